@@ -1,7 +1,17 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog, Label
+from tkinter import ttk, messagebox, filedialog
+import math
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+# Fast-path rendering for long traces: drop collinear points before
+# stroking and chunk long paths so Agg avoids its slow clipping path.
+# No visible difference at oscilloscope zoom levels
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['agg.path.chunksize'] = 10000
+# matplotlib above hard-requires numpy, so there is no point guarding
+# this import with a stdlib fallback
 import numpy as np
 import threading
 import time
@@ -9,44 +19,174 @@ from ctypes import *
 import sys
 import os
 
+# Optional numba JIT for the test-mode synthesis kernel
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional cffi binding for the status poll: with a pre-declared signature
+# cffi dispatches straight to the C call, skipping ctypes' per-call libffi
+# marshalling on the single hottest call in the acquisition loops
+try:
+    import cffi
+    CFFI_AVAILABLE = True
+except ImportError:
+    CFFI_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True, fastmath=True)
+    def _synth(samples, freq1, amp1, freq2, amp2, out1, out2, t):
+        """Fill preallocated arrays with sine/square test waveforms in one pass
+
+        The time vector is precomputed per configuration, so the per-sample
+        division by the sample rate is specialized away from this loop.
+        """
+        two_pi = 2.0 * math.pi
+        for i in range(samples):
+            ti = t[i]
+            s1 = math.sin(two_pi * freq1 * ti)
+            # Branchless square: the half-period index parity gives the sign
+            # without a second sin call or an unpredictable branch
+            half = int(2.0 * freq2 * ti)
+            out1[i] = amp1 * s1 + (np.random.random() - 0.5) * 0.2
+            out2[i] = amp2 * (1.0 - 2.0 * (half & 1)) + (np.random.random() - 0.5) * 0.1
+
+    @numba.njit(cache=True, fastmath=True)
+    def _decimate_kernel(data, cols, n_px, y):
+        """Per-pixel min/max decimation fused with the abs-max scan (one pass)"""
+        vmax = 0.0
+        for p in range(n_px):
+            base = p * cols
+            lo = data[base]
+            hi = lo
+            for j in range(1, cols):
+                v = data[base + j]
+                if v < lo:
+                    lo = v
+                elif v > hi:
+                    hi = v
+            y[2 * p] = lo
+            y[2 * p + 1] = hi
+            if -lo > vmax:
+                vmax = -lo
+            if hi > vmax:
+                vmax = hi
+        return vmax
+
 
 class AnalogDiscovery2GUI:
+    # Waveform name -> FDwfAnalogOut function constant
+    _FUNC_MAP = {"Sine": 1, "Square": 2, "Triangle": 3, "DC": 8}
+
     def __init__(self, root):
         self.root = root
         self.root.title("Analog Discovery 2 Control")
         self.root.geometry("1000x700")
 
-        # Create status label early using self.root
-        self.status_label = Label(self.root, text="Initializing...")
-        self.status_label.pack()
-
         # Device handle
         self.hdwf = c_int()
         self.is_connected = False
         self.is_acquiring = False
+        self.test_mode = False
+
+        # Acquisition buffers, allocated once and reused every frame
+        self.buffer_size = 8192
+        self.sample_rate = 20e6  # 20 MHz
+
+        # Poll the device on the scale of an actual capture
+        # (buffer_size / sample_rate ≈ 410 µs) instead of a fixed 50 ms that
+        # leaves it idle most of the window; 1 ms floor keeps the CPU sane
+        self._poll_wait = max(self.buffer_size / self.sample_rate * 0.8, 1e-3)
+
+        # The hardware time axis only depends on sample rate and buffer size,
+        # both fixed at configure time, so build it once instead of per frame
+        self.hw_time_axis = np.arange(self.buffer_size) / self.sample_rate
+
+        # NumPy ring buffers, overwritten in place every frame (no per-frame
+        # allocation/GC traffic at 20 FPS). float32 is plenty for pixel-level
+        # display precision and halves the memory traffic of the plot path.
+        # SoA layout: one (2, N) block so both channels are transformed
+        # together against a single shared time axis
+        self.waves = np.empty((2, self.buffer_size), np.float32)
+        self.ch1_ring = self.waves[0]
+        self.ch2_ring = self.waves[1]
+        # float64 staging block the driver fills directly; pointers are
+        # cached so no ctypes staging buffer or per-call cast is needed
+        self._acq = np.empty((2, self.buffer_size), np.float64)
+        self._acq_ptrs = (self._acq[0].ctypes.data_as(POINTER(c_double)),
+                          self._acq[1].ctypes.data_as(POINTER(c_double)))
+
+        # Status byte reused by the acquisition poll loops
+        self._sts = c_byte()
+
+        # Redraw coalescing: at most one pending after(0) callback at a time.
+        # The lock keeps the acquisition thread from overwriting the ring
+        # buffers while the Tk thread is snapshotting them for display
+        self._pending_redraw = False
+        self._latest_frame = None
+        self._frame_lock = threading.Lock()
+
+        # Create GUI first so the real status label exists before any code
+        # reports into it; the throwaway "Initializing..." Label that used
+        # to fill that gap stayed packed above the main frame forever
+        self.create_widgets()
 
         # Load WaveForms library
         self.dwf = None
         self.load_dwf_library()
 
-        # Create GUI
-        self.create_widgets()
-
         # Initialize device
         self.connect_device()
     def load_dwf_library(self):
         """Load the WaveForms library based on system architecture"""
+        self._ffi = None
         try:
             if sys.platform.startswith("win"):
-                # For 32-bit Python on Windows
-                if "32 bit" in sys.version or sys.maxsize <= 2 ** 32:
-                    self.dwf = cdll.LoadLibrary("dwf.dll")
-                else:
-                    self.dwf = cdll.LoadLibrary("dwf.dll")  # Try default first
+                lib_path = "dwf.dll"
             elif sys.platform.startswith("darwin"):
-                self.dwf = cdll.LoadLibrary("/Library/Frameworks/dwf.framework/dwf")
+                lib_path = "/Library/Frameworks/dwf.framework/dwf"
             else:
-                self.dwf = cdll.LoadLibrary("libdwf.so")
+                lib_path = "libdwf.so"
+            self.dwf = cdll.LoadLibrary(lib_path)
+
+            # Declaring the prototype lets ctypes skip its generic argument
+            # conversion and release the GIL cleanly around the C call
+            prototypes = {
+                "FDwfEnum": [c_int, POINTER(c_int)],
+                "FDwfDeviceOpen": [c_int, POINTER(c_int)],
+                "FDwfDeviceClose": [c_int],
+                "FDwfAnalogInStatus": [c_int, c_int, POINTER(c_byte)],
+                "FDwfAnalogInStatusData": [c_int, c_int, POINTER(c_double), c_int],
+                "FDwfAnalogInConfigure": [c_int, c_int, c_int],
+                "FDwfAnalogInChannelEnableSet": [c_int, c_int, c_int],
+                "FDwfAnalogInChannelRangeSet": [c_int, c_int, c_double],
+                "FDwfAnalogInFrequencySet": [c_int, c_double],
+                "FDwfAnalogInBufferSizeSet": [c_int, c_int],
+                "FDwfAnalogOutNodeEnableSet": [c_int, c_int, c_int, c_int],
+                "FDwfAnalogOutNodeFunctionSet": [c_int, c_int, c_int, c_int],
+                "FDwfAnalogOutNodeFrequencySet": [c_int, c_int, c_int, c_double],
+                "FDwfAnalogOutNodeAmplitudeSet": [c_int, c_int, c_int, c_double],
+                "FDwfAnalogOutConfigure": [c_int, c_int, c_int],
+            }
+            for name, argtypes in prototypes.items():
+                func = getattr(self.dwf, name)
+                func.argtypes = argtypes
+                func.restype = c_int
+
+            # cffi fast path for the poll-loop status call only; everything
+            # else stays on ctypes, which is plenty at configuration rates
+            if CFFI_AVAILABLE:
+                try:
+                    ffi = cffi.FFI()
+                    ffi.cdef("int FDwfAnalogInStatus(int hdwf, int fReadData,"
+                             " unsigned char *psts);")
+                    self._ffi_lib = ffi.dlopen(lib_path)
+                    self._ffi_sts = ffi.new("unsigned char[1]")
+                    self._ffi = ffi
+                except Exception:
+                    self._ffi = None
 
             self.status_label.config(text="WaveForms library loaded successfully")
         except Exception as e:
@@ -86,7 +226,8 @@ class AnalogDiscovery2GUI:
         # Channel controls
         ttk.Label(osc_control_frame, text="Channel 1:").grid(row=0, column=0, sticky=tk.W, padx=5)
         self.ch1_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(osc_control_frame, text="Enable", variable=self.ch1_var).grid(row=0, column=1, padx=5)
+        ttk.Checkbutton(osc_control_frame, text="Enable", variable=self.ch1_var,
+                        command=self._cache_params).grid(row=0, column=1, padx=5)
 
         ttk.Label(osc_control_frame, text="Range (V):").grid(row=0, column=2, padx=5)
         self.ch1_range = ttk.Combobox(osc_control_frame, values=["0.5", "1", "2", "5", "10", "25"], state="readonly",
@@ -96,7 +237,8 @@ class AnalogDiscovery2GUI:
 
         ttk.Label(osc_control_frame, text="Channel 2:").grid(row=1, column=0, sticky=tk.W, padx=5)
         self.ch2_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(osc_control_frame, text="Enable", variable=self.ch2_var).grid(row=1, column=1, padx=5)
+        ttk.Checkbutton(osc_control_frame, text="Enable", variable=self.ch2_var,
+                        command=self._cache_params).grid(row=1, column=1, padx=5)
 
         ttk.Label(osc_control_frame, text="Range (V):").grid(row=1, column=2, padx=5)
         self.ch2_range = ttk.Combobox(osc_control_frame, values=["0.5", "1", "2", "5", "10", "25"], state="readonly",
@@ -132,6 +274,12 @@ class AnalogDiscovery2GUI:
         self.canvas = FigureCanvasTkAgg(self.fig, plot_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
+        # Track the plot width from resize events; winfo_width() crosses
+        # into Tk and the decimation target only changes on resize
+        self._canvas_px = 800
+        self.canvas.get_tk_widget().bind(
+            "<Configure>", lambda e: setattr(self, '_canvas_px', e.width), add="+")
+
         # Initialize plot
         self.ax.set_xlabel('Time (s)')
         self.ax.set_ylabel('Voltage (V)')
@@ -161,14 +309,16 @@ class AnalogDiscovery2GUI:
         self.fg1_func.grid(row=0, column=3, padx=5)
 
         ttk.Label(funcgen_control_frame, text="Freq (Hz):").grid(row=0, column=4, padx=5)
-        self.fg1_freq = ttk.Entry(funcgen_control_frame, width=10)
-        self.fg1_freq.insert(0, "1000")
+        self.fg1_freq_var = tk.StringVar(value="1000")
+        self.fg1_freq = ttk.Entry(funcgen_control_frame, width=10,
+                                  textvariable=self.fg1_freq_var)
         self.fg1_freq.bind("<Return>", lambda e: self.update_function_generator())
         self.fg1_freq.grid(row=0, column=5, padx=5)
 
         ttk.Label(funcgen_control_frame, text="Amp (V):").grid(row=0, column=6, padx=5)
-        self.fg1_amp = ttk.Entry(funcgen_control_frame, width=10)
-        self.fg1_amp.insert(0, "1")
+        self.fg1_amp_var = tk.StringVar(value="1")
+        self.fg1_amp = ttk.Entry(funcgen_control_frame, width=10,
+                                 textvariable=self.fg1_amp_var)
         self.fg1_amp.bind("<Return>", lambda e: self.update_function_generator())
         self.fg1_amp.grid(row=0, column=7, padx=5)
 
@@ -186,34 +336,76 @@ class AnalogDiscovery2GUI:
         self.fg2_func.grid(row=1, column=3, padx=5)
 
         ttk.Label(funcgen_control_frame, text="Freq (Hz):").grid(row=1, column=4, padx=5)
-        self.fg2_freq = ttk.Entry(funcgen_control_frame, width=10)
-        self.fg2_freq.insert(0, "2000")
+        self.fg2_freq_var = tk.StringVar(value="2000")
+        self.fg2_freq = ttk.Entry(funcgen_control_frame, width=10,
+                                  textvariable=self.fg2_freq_var)
         self.fg2_freq.bind("<Return>", lambda e: self.update_function_generator())
         self.fg2_freq.grid(row=1, column=5, padx=5)
 
         ttk.Label(funcgen_control_frame, text="Amp (V):").grid(row=1, column=6, padx=5)
-        self.fg2_amp = ttk.Entry(funcgen_control_frame, width=10)
-        self.fg2_amp.insert(0, "1")
+        self.fg2_amp_var = tk.StringVar(value="1")
+        self.fg2_amp = ttk.Entry(funcgen_control_frame, width=10,
+                                 textvariable=self.fg2_amp_var)
         self.fg2_amp.bind("<Return>", lambda e: self.update_function_generator())
         self.fg2_amp.grid(row=1, column=7, padx=5)
 
+        # Cache parsed control values once per edit; per-frame
+        # float(widget.get()) crosses into Tk on every read. The entry
+        # StringVars re-parse on write, so a half-typed value never reaches
+        # the hot paths — they keep the last valid float
+        for combo in (self.timebase, self.ch1_range, self.ch2_range):
+            combo.bind("<<ComboboxSelected>>", self._cache_params, add="+")
+        for var in (self.fg1_freq_var, self.fg1_amp_var,
+                    self.fg2_freq_var, self.fg2_amp_var):
+            var.trace_add("write", lambda *args: self._cache_params())
+        self._cache_params()
+
+    def _cache_params(self, event=None):
+        """Parse control widget values; acquisition hot paths read the cached floats"""
+        def parse(widget, default):
+            try:
+                return float(widget.get())
+            except ValueError:
+                return default
+
+        # Malformed transient input (e.g. mid-edit "1e") keeps the last
+        # valid value rather than snapping back to the hardcoded default
+        self._timebase_val = parse(self.timebase, getattr(self, '_timebase_val', 1e-4))
+        self._ch1_range_val = parse(self.ch1_range, getattr(self, '_ch1_range_val', 5.0))
+        self._ch2_range_val = parse(self.ch2_range, getattr(self, '_ch2_range_val', 5.0))
+        self._freq1 = parse(self.fg1_freq_var, getattr(self, '_freq1', 1000.0))
+        self._amp1 = parse(self.fg1_amp_var, getattr(self, '_amp1', 1.0))
+        self._freq2 = parse(self.fg2_freq_var, getattr(self, '_freq2', 2000.0))
+        self._amp2 = parse(self.fg2_amp_var, getattr(self, '_amp2', 1.0))
+
+        # Simulated data only needs regenerating after a control change
+        self._params_dirty = True
+
     def connect_device(self):
         """Connect to Analog Discovery 2"""
         if not self.dwf:
-            messagebox.showerror("Error", "WaveForms library not loaded")
+            # No library - run with simulated signals instead
+            self.test_mode = True
+            self.status_label.config(text="Test mode (no library)", foreground="orange")
+            self.start_btn.config(state=tk.NORMAL)
+            self.single_btn.config(state=tk.NORMAL)
             return
 
         try:
             # Enumerate devices
             cDevice = c_int()
-            self.dwf.FDwfEnum(c_int(0), byref(cDevice))
+            self.dwf.FDwfEnum(0, byref(cDevice))
 
             if cDevice.value == 0:
-                messagebox.showerror("Error", "No Analog Discovery 2 device found")
+                # No hardware available - run with simulated signals instead
+                self.test_mode = True
+                self.status_label.config(text="Test mode (no device)", foreground="orange")
+                self.start_btn.config(state=tk.NORMAL)
+                self.single_btn.config(state=tk.NORMAL)
                 return
 
             # Open device
-            self.dwf.FDwfDeviceOpen(c_int(0), byref(self.hdwf))
+            self.dwf.FDwfDeviceOpen(0, byref(self.hdwf))
 
             if self.hdwf.value == 0:
                 messagebox.showerror("Error", "Failed to open Analog Discovery 2")
@@ -226,6 +418,13 @@ class AnalogDiscovery2GUI:
             self.start_btn.config(state=tk.NORMAL)
             self.single_btn.config(state=tk.NORMAL)
 
+            # A freshly opened device is back at hardware defaults, so the
+            # skip-if-unchanged caches no longer describe its state; clear
+            # them or the configure calls below would early-return after a
+            # disconnect/reconnect cycle
+            self._scope_cfg = None
+            self._fg_state = [None, None]
+
             # Configure default settings
             self.configure_oscilloscope()
 
@@ -251,29 +450,35 @@ class AnalogDiscovery2GUI:
         if not self.is_connected:
             return
 
+        # single_acquisition reconfigures before every shot; skip the USB
+        # round-trips when nothing changed since the last configuration
+        cfg = (self._ch1_range_val, self._ch2_range_val,
+               self.sample_rate, self.buffer_size)
+        if getattr(self, '_scope_cfg', None) == cfg:
+            return
+
         try:
             # Set up analog input channels
             for ch in range(2):
                 # Enable channel
-                self.dwf.FDwfAnalogInChannelEnableSet(self.hdwf, c_int(ch), c_bool(True))
+                self.dwf.FDwfAnalogInChannelEnableSet(self.hdwf, ch, 1)
 
                 # Set range
-                range_val = float(self.ch1_range.get() if ch == 0 else self.ch2_range.get())
-                self.dwf.FDwfAnalogInChannelRangeSet(self.hdwf, c_int(ch), c_double(range_val))
+                range_val = self._ch1_range_val if ch == 0 else self._ch2_range_val
+                self.dwf.FDwfAnalogInChannelRangeSet(self.hdwf, ch, range_val)
 
             # Set acquisition parameters
-            sample_rate = 20e6  # 20 MHz
-            buffer_size = 8192
+            self.dwf.FDwfAnalogInFrequencySet(self.hdwf, self.sample_rate)
+            self.dwf.FDwfAnalogInBufferSizeSet(self.hdwf, self.buffer_size)
 
-            self.dwf.FDwfAnalogInFrequencySet(self.hdwf, c_double(sample_rate))
-            self.dwf.FDwfAnalogInBufferSizeSet(self.hdwf, c_int(buffer_size))
+            self._scope_cfg = cfg
 
         except Exception as e:
             print(f"Error configuring oscilloscope: {e}")
 
     def start_acquisition(self):
         """Start continuous acquisition"""
-        if not self.is_connected:
+        if not self.is_connected and not self.test_mode:
             return
 
         self.is_acquiring = True
@@ -291,23 +496,39 @@ class AnalogDiscovery2GUI:
         self.start_btn.config(state=tk.NORMAL)
         self.stop_btn.config(state=tk.DISABLED)
 
+    def _analog_in_status(self):
+        """Poll the acquisition state byte via the fastest available binding"""
+        if self._ffi is not None:
+            self._ffi_lib.FDwfAnalogInStatus(self.hdwf.value, 1, self._ffi_sts)
+            return self._ffi_sts[0]
+        self.dwf.FDwfAnalogInStatus(self.hdwf, 1, byref(self._sts))
+        return self._sts.value
+
     def single_acquisition(self):
         """Single acquisition"""
+        if self.test_mode:
+            self.generate_test_data()
+            self.update_plot(self.time_data, self.test_waves)
+            return
+
         if not self.is_connected:
             return
 
         try:
             # Configure and start single acquisition
             self.configure_oscilloscope()
-            self.dwf.FDwfAnalogInConfigure(self.hdwf, c_bool(False), c_bool(True))
+            self.dwf.FDwfAnalogInConfigure(self.hdwf, 0, 1)
 
-            # Wait for acquisition to complete
-            sts = c_byte()
+            # Wait for acquisition to complete (no per-iteration allocations).
+            # Exponential backoff: spin briefly for fast triggers, then back
+            # off to 5 ms instead of waking the scheduler at 1 kHz
+            delay = 0.0
             while True:
-                self.dwf.FDwfAnalogInStatus(self.hdwf, c_int(1), byref(sts))
-                if sts.value == 2:  # DwfStateDone
+                if self._analog_in_status() == 2:  # DwfStateDone
                     break
-                time.sleep(0.001)
+                if delay:
+                    time.sleep(delay)
+                delay = min(delay * 2 if delay else 0.0001, 0.005)
 
             # Read data
             self.read_and_plot_data()
@@ -317,20 +538,30 @@ class AnalogDiscovery2GUI:
 
     def acquisition_loop(self):
         """Continuous acquisition loop"""
+        if self.test_mode:
+            while self.is_acquiring:
+                # Same controls produce the same waveform, so idle until a
+                # control callback marks the parameters dirty
+                if self._params_dirty:
+                    self._params_dirty = False
+                    self.generate_test_data()
+                    self.request_redraw(self.time_data, self.test_waves)
+                time.sleep(0.1)  # 10 FPS is plenty for simulated data
+            return
+
         try:
             # Start continuous acquisition
-            self.dwf.FDwfAnalogInConfigure(self.hdwf, c_bool(False), c_bool(True))
+            self.dwf.FDwfAnalogInConfigure(self.hdwf, 0, 1)
 
             while self.is_acquiring:
-                sts = c_byte()
-                self.dwf.FDwfAnalogInStatus(self.hdwf, c_int(1), byref(sts))
-
-                if sts.value == 2:  # DwfStateDone
+                if self._analog_in_status() == 2:  # DwfStateDone
                     self.read_and_plot_data()
                     # Restart acquisition
-                    self.dwf.FDwfAnalogInConfigure(self.hdwf, c_bool(False), c_bool(True))
+                    self.dwf.FDwfAnalogInConfigure(self.hdwf, 0, 1)
 
-                time.sleep(0.05)  # 20 FPS update rate
+                # Sized to the expected capture time; the redraw coalescing
+                # keeps the GUI from being flooded at these rates
+                time.sleep(self._poll_wait)
 
         except Exception as e:
             print(f"Error in acquisition loop: {e}")
@@ -338,43 +569,196 @@ class AnalogDiscovery2GUI:
     def read_and_plot_data(self):
         """Read data from device and update plot"""
         try:
-            buffer_size = 8192
-            ch1_data = (c_double * buffer_size)()
-            ch2_data = (c_double * buffer_size)()
-
-            # Read channel data
-            self.dwf.FDwfAnalogInStatusData(self.hdwf, c_int(0), ch1_data, c_int(buffer_size))
-            self.dwf.FDwfAnalogInStatusData(self.hdwf, c_int(1), ch2_data, c_int(buffer_size))
+            buffer_size = self.buffer_size
+
+            # FDwfAnalogInStatus(fReadData=True) already pulled the samples
+            # into the driver; StatusData just copies them out, so fetch only
+            # the channels that are actually displayed, back to back
+            read_ch1 = self.ch1_var.get()
+            read_ch2 = self.ch2_var.get()
+
+            # The driver writes straight into the numpy staging block —
+            # no ctypes intermediate and no conversion copy afterwards
+            if read_ch1:
+                self.dwf.FDwfAnalogInStatusData(self.hdwf, 0, self._acq_ptrs[0], buffer_size)
+            if read_ch2:
+                self.dwf.FDwfAnalogInStatusData(self.hdwf, 1, self._acq_ptrs[1], buffer_size)
+            # One vectorized assignment downcasts both channels to the
+            # float32 display block under the frame lock
+            with self._frame_lock:
+                self.waves[:] = self._acq
+
+            self.request_redraw(self.hw_time_axis, self.waves)
 
-            # Convert to numpy arrays
-            ch1_array = np.array([ch1_data[i] for i in range(buffer_size)])
-            ch2_array = np.array([ch2_data[i] for i in range(buffer_size)])
-
-            # Create time axis
-            sample_rate = 20e6
-            time_axis = np.arange(buffer_size) / sample_rate
-
-            # Update plot
-            self.ax.clear()
+        except Exception as e:
+            print(f"Error reading data: {e}")
 
-            if self.ch1_var.get():
-                self.ax.plot(time_axis, ch1_array, 'b-', label='Channel 1', linewidth=1)
+    def generate_test_data(self):
+        """Generate simulated waveforms for test mode (no hardware)"""
+        try:
+            samples = 8192
+            sample_rate = samples / (self._timebase_val * 10)
+
+            freq1 = self._freq1
+            amp1 = self._amp1
+            freq2 = self._freq2
+            amp2 = self._amp2
+
+            # Reuse preallocated buffers across calls (avoid per-frame realloc);
+            # the time vector is specialized per (samples, sample_rate) pair so
+            # no frame recomputes it
+            if not hasattr(self, '_t') or len(self._t) != samples or \
+                    getattr(self, '_t_rate', None) != sample_rate:
+                self._t = np.arange(samples) / sample_rate
+                self.test_waves = np.empty((2, samples), np.float64)
+                self._ch1 = self.test_waves[0]
+                self._ch2 = self.test_waves[1]
+                self._t_rate = sample_rate
+
+            with self._frame_lock:
+                if NUMBA_AVAILABLE:
+                    # Single-pass compiled kernel: sine on Ch1, square on Ch2, plus noise
+                    _synth(samples, freq1, amp1, freq2, amp2,
+                           self._ch1, self._ch2, self._t)
+                else:
+                    # Vectorized synthesis: sine on Ch1, square on Ch2, plus noise
+                    self._ch1[:] = amp1 * np.sin(2 * np.pi * freq1 * self._t) + \
+                                   np.random.uniform(-0.1, 0.1, samples)
+                    # Branchless square: half-period parity via integer masking,
+                    # no transcendental needed
+                    half_periods = (2.0 * freq2 * self._t).astype(np.int64)
+                    self._ch2[:] = amp2 * (1.0 - 2.0 * (half_periods & 1)) + \
+                                   np.random.uniform(-0.05, 0.05, samples)
 
-            if self.ch2_var.get():
-                self.ax.plot(time_axis, ch2_array, 'r-', label='Channel 2', linewidth=1)
+            self.time_data = self._t
 
-            self.ax.set_xlabel('Time (s)')
-            self.ax.set_ylabel('Voltage (V)')
-            self.ax.set_title('Oscilloscope')
-            self.ax.grid(True)
-           # self.ax.set_ylim(-10, 10)
-            self.ax.legend()
+        except Exception as e:
+            print(f"Error generating test data: {e}")
+
+    def request_redraw(self, time_axis, channels):
+        """Schedule a plot refresh on the Tk thread; bursts collapse into one"""
+        with self._frame_lock:
+            self._latest_frame = (time_axis, channels)
+        if not self._pending_redraw:
+            self._pending_redraw = True
+            self.root.after(0, self._do_redraw)
+
+    def _do_redraw(self):
+        self._pending_redraw = False
+        # Snapshot the shared buffers under the lock into a display-side
+        # block, so the next acquisition can overwrite the rings while
+        # matplotlib is still rendering this frame. The snapshot buffer is
+        # reused, so steady state stays allocation-free
+        with self._frame_lock:
+            frame = self._latest_frame
+            if frame is None:
+                return
+            time_axis, channels = frame
+            disp = getattr(self, '_disp_waves', None)
+            if disp is None or disp.shape != channels.shape \
+                    or disp.dtype != channels.dtype:
+                disp = self._disp_waves = np.empty_like(channels)
+            disp[:] = channels
+        self.update_plot(time_axis, disp)
+
+    def _decimate_channels(self, time_axis, channels, n_px):
+        """Min/max-decimate a (2, N) SoA block against one shared time axis
+
+        Returns (x, ys, vmaxes); the x array and the reshape are computed
+        once for both rows instead of per channel.
+        """
+        n_ch, samples = channels.shape
+        if n_px <= 0 or samples <= 2 * n_px:
+            return time_axis, channels, np.abs(channels).max(axis=1)
+
+        cols = samples // n_px
+        n = cols * n_px
+        x = np.repeat(time_axis[:n:cols], 2)
+        ys = np.empty((n_ch, 2 * n_px), channels.dtype)
+
+        if NUMBA_AVAILABLE:
+            # Rows of a C-contiguous block are contiguous, so no copies here
+            vmaxes = np.empty(n_ch)
+            for row in range(n_ch):
+                vmaxes[row] = _decimate_kernel(
+                    np.ascontiguousarray(channels[row, :n]), cols, n_px, ys[row])
+        else:
+            chunks = channels[:, :n].reshape(n_ch, n_px, cols)
+            ys[:, 0::2] = chunks.min(axis=2)
+            ys[:, 1::2] = chunks.max(axis=2)
+            vmaxes = np.abs(ys).max(axis=1)
+        return x, ys, vmaxes
+
+    def update_plot(self, time_axis, channels):
+        """Update the oscilloscope plot with a (2, N) block of channel data"""
+        try:
+            # Create the line artists once and update them in place; ax.clear()
+            # made matplotlib rebuild every axis item on each frame
+            if not hasattr(self, '_ch1_line'):
+                # Antialiasing roughly doubles stroke cost and buys nothing
+                # on dense 1 px scope traces
+                (self._ch1_line,) = self.ax.plot([], [], 'b-', label='Channel 1',
+                                                 linewidth=1, animated=True,
+                                                 antialiased=False)
+                (self._ch2_line,) = self.ax.plot([], [], 'r-', label='Channel 2',
+                                                 linewidth=1, animated=True,
+                                                 antialiased=False)
+                # Fixed location so matplotlib skips the per-draw
+                # 'best'-placement search over the data
+                self.ax.legend(loc='upper right')
+                # Any full redraw (resize, limit change) invalidates the
+                # cached background used for blitting
+                self._plot_bg = None
+                self.canvas.mpl_connect(
+                    'draw_event',
+                    lambda event: setattr(self, '_plot_bg',
+                                          self.canvas.copy_from_bbox(self.ax.bbox)))
+
+            # Drawing more points than pixels just slows the canvas down
+            n_px = self._canvas_px
+
+            # Decimation also yields the abs-max needed for vertical scaling;
+            # both channels go through one shared SoA transform
+            voltage_max = 0.0
+            x, ys, vmaxes = self._decimate_channels(time_axis, channels, n_px)
+            for line, var, y, vmax in (
+                    (self._ch1_line, self.ch1_var, ys[0], vmaxes[0]),
+                    (self._ch2_line, self.ch2_var, ys[1], vmaxes[1])):
+                if var.get():
+                    line.set_data(x, y)
+                    voltage_max = max(voltage_max, float(vmax))
+                line.set_visible(var.get())
+
+            # Only touch the limits when they actually move: every set_ylim/
+            # set_xlim forces matplotlib to relayout and re-render all tick
+            # labels, the slowest text path in the figure
+            limits_changed = False
+            if voltage_max > 0:
+                last = getattr(self, '_last_vmax', 0.0)
+                if last == 0.0 or abs(voltage_max - last) > 0.05 * last:
+                    self.ax.set_ylim(-1.1 * voltage_max, 1.1 * voltage_max)
+                    self._last_vmax = voltage_max
+                    limits_changed = True
 
             # Set time axis based on timebase setting
-            timebase = float(self.timebase.get())
-            self.ax.set_xlim(0, timebase * 10)
-
-            self.canvas.draw()
+            xmax = self._timebase_val * 10
+            if getattr(self, '_last_xmax', None) != xmax:
+                self.ax.set_xlim(0, xmax)
+                self._last_xmax = xmax
+                limits_changed = True
+
+            # Blit: re-render only the line artists over the cached axes
+            # background; a full draw (re-rendering grid, ticks and labels)
+            # is needed only when the limits moved or the canvas resized.
+            # The animated lines are excluded from canvas.draw(), so they
+            # must be blitted over the fresh background in either case
+            if limits_changed or self._plot_bg is None:
+                self.canvas.draw()  # full render; draw_event recaches bg
+            if self._plot_bg is not None:
+                self.canvas.restore_region(self._plot_bg)
+                self.ax.draw_artist(self._ch1_line)
+                self.ax.draw_artist(self._ch2_line)
+                self.canvas.blit(self.ax.bbox)
 
         except Exception as e:
             print(f"Error reading data: {e}")
@@ -385,38 +769,31 @@ class AnalogDiscovery2GUI:
             return
 
         try:
-            # Function type mapping
-            func_map = {"Sine": 1, "Square": 2, "Triangle": 3, "DC": 8}
-
-            # Configure Channel 1
-            if self.fg1_enable.get():
-                func_type = func_map.get(self.fg1_func.get(), 1)
-                frequency = float(self.fg1_freq.get())
-                amplitude = float(self.fg1_amp.get())
-
-                self.dwf.FDwfAnalogOutNodeEnableSet(self.hdwf, c_int(0), c_int(0), c_bool(True))
-                self.dwf.FDwfAnalogOutNodeFunctionSet(self.hdwf, c_int(0), c_int(0), c_int(func_type))
-                self.dwf.FDwfAnalogOutNodeFrequencySet(self.hdwf, c_int(0), c_int(0), c_double(frequency))
-                self.dwf.FDwfAnalogOutNodeAmplitudeSet(self.hdwf, c_int(0), c_int(0), c_double(amplitude))
-                self.dwf.FDwfAnalogOutConfigure(self.hdwf, c_int(0), c_bool(True))
-            else:
-                self.dwf.FDwfAnalogOutNodeEnableSet(self.hdwf, c_int(0), c_int(0), c_bool(False))
-                self.dwf.FDwfAnalogOutConfigure(self.hdwf, c_int(0), c_bool(True))
-
-            # Configure Channel 2
-            if self.fg2_enable.get():
-                func_type = func_map.get(self.fg2_func.get(), 1)
-                frequency = float(self.fg2_freq.get())
-                amplitude = float(self.fg2_amp.get())
-
-                self.dwf.FDwfAnalogOutNodeEnableSet(self.hdwf, c_int(1), c_int(0), c_bool(True))
-                self.dwf.FDwfAnalogOutNodeFunctionSet(self.hdwf, c_int(1), c_int(0), c_int(func_type))
-                self.dwf.FDwfAnalogOutNodeFrequencySet(self.hdwf, c_int(1), c_int(0), c_double(frequency))
-                self.dwf.FDwfAnalogOutNodeAmplitudeSet(self.hdwf, c_int(1), c_int(0), c_double(amplitude))
-                self.dwf.FDwfAnalogOutConfigure(self.hdwf, c_int(1), c_bool(True))
-            else:
-                self.dwf.FDwfAnalogOutNodeEnableSet(self.hdwf, c_int(1), c_int(0), c_bool(False))
-                self.dwf.FDwfAnalogOutConfigure(self.hdwf, c_int(1), c_bool(True))
+            if not hasattr(self, '_fg_state'):
+                self._fg_state = [None, None]
+
+            for ch, (enable, func, freq, amp) in enumerate((
+                    (self.fg1_enable, self.fg1_func, self._freq1, self._amp1),
+                    (self.fg2_enable, self.fg2_func, self._freq2, self._amp2))):
+                if enable.get():
+                    state = (True, self._FUNC_MAP.get(func.get(), 1), freq, amp)
+                else:
+                    state = (False,)
+
+                # Reprogramming the output restarts the waveform phase, so
+                # skip the USB round-trips when nothing actually changed
+                if state == self._fg_state[ch]:
+                    continue
+                self._fg_state[ch] = state
+
+                if state[0]:
+                    self.dwf.FDwfAnalogOutNodeEnableSet(self.hdwf, ch, 0, 1)
+                    self.dwf.FDwfAnalogOutNodeFunctionSet(self.hdwf, ch, 0, state[1])
+                    self.dwf.FDwfAnalogOutNodeFrequencySet(self.hdwf, ch, 0, state[2])
+                    self.dwf.FDwfAnalogOutNodeAmplitudeSet(self.hdwf, ch, 0, state[3])
+                else:
+                    self.dwf.FDwfAnalogOutNodeEnableSet(self.hdwf, ch, 0, 0)
+                self.dwf.FDwfAnalogOutConfigure(self.hdwf, ch, 1)
 
         except Exception as e:
             print(f"Error updating function generator: {e}")
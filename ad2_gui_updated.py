@@ -14,17 +14,26 @@ Dependencies:
 import sys
 import os
 import csv
+import math
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import matplotlib.pyplot as plt
+# pyplot is deliberately not imported: this module only needs Figure and
+# the TkAgg canvas, and pulling in pyplot adds backend autodetection, the
+# font-cache scan and its global state to every cold start
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
+from matplotlib.animation import FuncAnimation
+from matplotlib.ticker import LogLocator, MaxNLocator
 import numpy as np
 import threading
 import time
 import json
+import tempfile
+import functools
+from collections import deque
 from datetime import datetime
-from ctypes import cdll
+import struct
+from ctypes import cdll, c_int, c_uint32, byref, create_string_buffer
 
 # Define DWF_AVAILABLE and DwfLibrary simulation for demonstration
 try:
@@ -33,65 +42,405 @@ try:
 except ImportError:
     DWF_AVAILABLE = False
 
+# Optional numba JIT for the spectrum post-processing kernels
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional orjson: serializes/parses config JSON through a native path
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional pyfftw: planned FFTs reuse FFTW's SIMD-tuned kernels and are
+# typically 2-4x faster than numpy.fft for repeated same-size transforms
+try:
+    import pyfftw
+    PYFFTW_AVAILABLE = True
+except ImportError:
+    PYFFTW_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True, fastmath=True)
+    def _mag_db(re, im, scale, out):
+        """Fused |X| -> dB for one spectrum frame (no intermediate arrays)"""
+        for i in range(out.size):
+            mag = math.sqrt(re[i] * re[i] + im[i] * im[i]) * scale
+            out[i] = 20.0 * math.log10(mag + 1e-12)
+
+    @numba.njit(cache=True, fastmath=True)
+    def _peak_hold(acc, new):
+        """In-place elementwise max for peak-hold accumulation"""
+        for i in range(acc.size):
+            if new[i] > acc[i]:
+                acc[i] = new[i]
+
+# Shared widget value tuples: built once instead of per-Combobox
+DIO_MODES = ('Output', 'Input', 'Input Pull-Up', 'Input Pull-Down')
+DIO_NAMES = tuple(f'DIO{i}' for i in range(16))
+
+if sys.platform.startswith("win"):
+    _DWF_PATH = "dwf.dll"
+elif sys.platform.startswith("darwin"):
+    _DWF_PATH = "/Library/Frameworks/dwf.framework/dwf"
+else:
+    _DWF_PATH = "libdwf.so"
+
+_dwf_handle = None
+
+
+def _load_dwf():
+    """Resolve the WaveForms runtime once per process
+
+    Reconnects reuse the cached handle instead of going back through the
+    system loader. Returns None when the runtime is not installed.
+    """
+    global _dwf_handle
+    if _dwf_handle is None:
+        try:
+            _dwf_handle = cdll.LoadLibrary(_DWF_PATH)
+        except OSError:
+            return None
+    return _dwf_handle
+
+
+def _decimate_minmax(x, y, max_points=2000):
+    """Per-bucket min/max decimation for display
+
+    Agg's line drawer is O(points); a multi-thousand-bin FFT frame is cut
+    to max_points while keeping both extremes of every bucket, so peaks
+    and notches survive — the property that matters for a spectrum, which
+    average-seeking schemes like LTTB can smooth away. Fully vectorized.
+    """
+    n = y.size
+    if n <= max_points:
+        return x, y
+    buckets = max_points // 2
+    width = n // buckets
+    m = buckets * width
+    blocks = y[:m].reshape(buckets, width)
+    offsets = np.arange(buckets) * width
+    idx = np.sort(np.concatenate([offsets + blocks.argmin(axis=1),
+                                  offsets + blocks.argmax(axis=1)]))
+    return x[idx], y[idx]
+
+
+@functools.lru_cache(maxsize=8)
+def _make_log_grid(fstart, fstop, n):
+    """Logarithmic sweep grid, cached per (start, stop, steps)
+
+    Repeated single sweeps with unchanged parameters reuse the same
+    float32 array instead of recomputing the log/pow grid each press.
+    """
+    return np.geomspace(fstart, fstop, n, dtype=np.float32)
+
+
+class MiniSlider(tk.Canvas):
+    """Lightweight ttk.Scale stand-in drawn on a bare Canvas
+
+    A ttk.Scale runs the theme engine (style lookup plus element redraw)
+    on every motion event while dragging; this draws one track line and a
+    10x10 knob moved with coords(), and debounces the command callback
+    through after_idle so a drag fires it once per idle cycle instead of
+    once per pixel. set()/get() match the ttk.Scale API.
+    """
+
+    _PAD = 6
+
+    def __init__(self, master, from_=0.0, to=1.0, command=None,
+                 width=160, height=16, **kwargs):
+        super().__init__(master, width=width, height=height,
+                         highlightthickness=0, **kwargs)
+        self._from = float(from_)
+        self._to = float(to)
+        self._command = command
+        self._value = self._from
+        self._pending = None
+        mid = height // 2
+        self._track = self.create_line(self._PAD, mid, width - self._PAD, mid,
+                                       fill='#888888')
+        self._knob = self.create_rectangle(0, mid - 5, 10, mid + 5,
+                                           fill='#dddddd', outline='#555555')
+        self.bind('<Configure>', self._redraw)
+        self.bind('<Button-1>', self._on_drag)
+        self.bind('<B1-Motion>', self._on_drag)
+
+    def _span(self):
+        return max(self.winfo_width(), 2 * self._PAD + 10)
+
+    def _redraw(self, event=None):
+        w = self._span()
+        mid = int(self['height']) // 2
+        self.coords(self._track, self._PAD, mid, w - self._PAD, mid)
+        self._place_knob()
+
+    def _place_knob(self):
+        frac = (self._value - self._from) / (self._to - self._from)
+        x = self._PAD + frac * (self._span() - 2 * self._PAD) - 5
+        mid = int(self['height']) // 2
+        self.coords(self._knob, x, mid - 5, x + 10, mid + 5)
+
+    def _on_drag(self, event):
+        frac = (event.x - self._PAD) / max(self._span() - 2 * self._PAD, 1)
+        self._value = self._from + min(max(frac, 0.0), 1.0) * (self._to - self._from)
+        self._place_knob()
+        if self._command and self._pending is None:
+            self._pending = self.after_idle(self._fire)
+
+    def _fire(self):
+        self._pending = None
+        self._command(self._value)
+
+    def set(self, value):
+        lo, hi = min(self._from, self._to), max(self._from, self._to)
+        self._value = min(max(float(value), lo), hi)
+        self._place_knob()
+
+    def get(self):
+        return self._value
+
+
 class AnalogDiscovery2GUI:
     def __init__(self, root):
         self.root = root
         self.root.title("Analog Discovery 2 - Complete Control Interface")
         self.root.geometry("1400x900")
 
+        # One Style instance up front; every ttk widget consults the same
+        # database, so there is no reason to let helpers build their own.
+        # Named styles defined once here resolve to a single cached map
+        # instead of a per-widget walk of the option database
+        self._style = ttk.Style(self.root)
+        self._style.configure('Readout.TLabel', padding=2)
+        self._style.configure('Config.TRadiobutton', padding=2)
+
         # Initialize variables
         self.device = None
+        self.hdwf = c_int()
         self.is_connected = False
         self.is_acquiring = False
         self.acquisition_thread = None
 
-        # Data storage
-        self.scope_data = {'ch1': [], 'ch2': [], 'time': []}
-        self.spectrum_data = {'frequency': [], 'magnitude': []}
-
-        # Initialize variables used in methods but missing
-        self.data_logger_running = False
+        # Scope settings read by the always-reachable File menu
+        # (save/load config). Plain Tk variables, so they can live here
+        # even though the Oscilloscope tab that edits them is built
+        # lazily on first selection
+        self.ch1_range = tk.StringVar(value='5')
+        self.ch2_range = tk.StringVar(value='5')
+        self.sample_rate = tk.StringVar(value='100000')
+        self.buffer_size = tk.StringVar(value='4096')
+
+        # Data storage: preallocated contiguous float32 buffers (SoA) with
+        # write cursors. Python lists box every sample as a ~28 B PyObject
+        # and realloc on append; the consumers (plotting, FFT, export) all
+        # want contiguous ndarrays anyway
+        self.max_samples = 16384
+        self.scope_time = np.empty(self.max_samples, np.float32)
+        self.scope_ch1 = np.empty(self.max_samples, np.float32)
+        self.scope_ch2 = np.empty(self.max_samples, np.float32)
+        self._scope_n = 0
+        self._scope_mmap_path = None
+        self.spectrum_freq = np.empty(self.max_samples, np.float32)
+        self.spectrum_mag = np.empty(self.max_samples, np.float32)
+        self._spectrum_n = 0
+
+        # Producer/consumer plumbing for the analyzer threads: producers
+        # push finished frames into bounded deques (append is atomic, and
+        # maxlen drops stale frames when the UI lags) and stop on Events
+        # instead of spin-checked booleans
         self.logger_thread = None
-        self.spectrum_running = False
+        self._logger_stop = threading.Event()
         self.spectrum_thread = None
-        self.na_running = False
+        self._spectrum_stop = threading.Event()
+        self._spectrum_q = deque(maxlen=2)
         self.na_thread = None
-        self.na_freq_data = []
-        self.na_s11_mag_data = []
-        self.na_s11_phase_data = []
+        self._na_stop = threading.Event()
+        # Unbounded: sweep points must all land in the buffers, unlike the
+        # droppable display frames above
+        self._na_q = deque()
+        self.ia_thread = None
+        self._ia_stop = threading.Event()
+        # Latest-value slot for the results labels; continuous mode writes
+        # it per sample but the labels repaint once per idle cycle
+        self._ia_pending = None
+        self._ia_flush_scheduled = False
+        self.na_max_steps = 4096
+        self.na_freq_data = np.empty(self.na_max_steps, np.float32)
+        self.na_s11_mag_data = np.empty(self.na_max_steps, np.float32)
+        self.na_s11_phase_data = np.empty(self.na_max_steps, np.float32)
+        self._na_n = 0
+
+        # Spectrum caches: window tables per (name, length) and FFT plans
+        # per length (pyfftw only)
+        self._win_cache = {}
+        self._fft_plans = {}
+
+        # Tab frame -> (figure, canvas), filled in by the plot creators;
+        # used to drop hidden figures to low DPI on tab switches
+        self._tab_figs = {}
 
         # Create main interface
         self.create_main_interface()
 
-        # Initialize device connection
-        self.initialize_device()
-
-    def load_dwf_library(self):
-        """Load the WaveForms library based on system architecture"""
+        # Initialize device connection off the Tk thread: USB/library
+        # enumeration takes hundreds of milliseconds and would freeze the
+        # window if run inside __init__. The short delay lets the first
+        # paint happen before the probe starts
+        self.root.after(50, lambda: threading.Thread(
+            target=self.initialize_device, daemon=True).start())
+
+    def initialize_device(self):
+        """Probe for the WaveForms library and report into the info pane
+
+        Runs on a worker thread; all widget updates bounce back onto the
+        Tk thread via root.after.
+        """
+        info_lines = [f"Scan time: {datetime.now():%Y-%m-%d %H:%M:%S}"]
+        if DWF_AVAILABLE:
+            info_lines.append("dwf Python package: available")
+        else:
+            info_lines.append("dwf Python package: not installed")
+        self.dwf = _load_dwf()
+        if self.dwf is not None:
+            info_lines.append(f"WaveForms runtime: loaded ({_DWF_PATH})")
+        else:
+            info_lines.append("WaveForms runtime: not found")
+        self.root.after(0, self._populate_device_info, '\n'.join(info_lines))
+
+    def _populate_device_info(self, info):
+        """Tk-thread half of initialize_device: fill the info pane"""
+        self.device_info_text.delete('1.0', tk.END)
+        self.device_info_text.insert('1.0', info + '\n')
+
+    def connect_device(self):
+        """Open the first Analog Discovery 2 found on the bus"""
+        if self.is_connected:
+            return
+        self.dwf = _load_dwf()
+        if self.dwf is None:
+            messagebox.showerror("Error", "WaveForms runtime not found")
+            return
         try:
-            if sys.platform.startswith("win"):
-                # For 32-bit Python on Windows
-                if "32 bit" in sys.version or sys.maxsize <= 2 ** 32:
-                    self.dwf = cdll.LoadLibrary("dwf.dll")
-                else:
-                    self.dwf = cdll.LoadLibrary("dwf.dll")  # Try default first
-            elif sys.platform.startswith("darwin"):
-                self.dwf = cdll.LoadLibrary("/Library/Frameworks/dwf.framework/dwf")
-            else:
-                self.dwf = cdll.LoadLibrary("libdwf.so")
+            device_count = c_int()
+            self.dwf.FDwfEnum(c_int(0), byref(device_count))
+            if device_count.value == 0:
+                messagebox.showerror("Error", "No Analog Discovery 2 device found")
+                return
 
-            self.status_label.config(text="WaveForms library loaded successfully")
+            self.dwf.FDwfDeviceOpen(c_int(0), byref(self.hdwf))
+            if self.hdwf.value == 0:
+                err = create_string_buffer(512)
+                self.dwf.FDwfGetLastErrorMsg(err)
+                messagebox.showerror("Error", f"Failed to open device: {err.value.decode()}")
+                return
+
+            self.is_connected = True
+            self.connection_status.config(text="Connected", foreground="green")
+            self.update_device_info()
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load WaveForms library: {e}")
+            messagebox.showerror("Error", f"Connection failed: {e}")
+
+    def disconnect_device(self):
+        """Close the device handle and reset the connection state"""
+        if self.is_connected and self.dwf is not None:
+            try:
+                self.dwf.FDwfDeviceClose(self.hdwf)
+            except Exception:
+                pass
+        self.hdwf = c_int()
+        self.is_connected = False
+        self.connection_status.config(text="Not Connected", foreground="red")
+
+    def update_device_info(self):
+        """Refresh the info pane with runtime and connection details"""
+        lines = [f"Updated: {datetime.now():%Y-%m-%d %H:%M:%S}"]
+        if self.dwf is None:
+            lines.append("WaveForms runtime: not found")
+        else:
+            version = create_string_buffer(16)
+            self.dwf.FDwfGetVersion(version)
+            lines.append(f"WaveForms runtime: {version.value.decode()} ({_DWF_PATH})")
+        if self.is_connected:
+            lines.append(f"Device: connected (handle {self.hdwf.value})")
+        else:
+            lines.append("Device: not connected")
+        self._populate_device_info('\n'.join(lines))
+
+    def load_dwf_library(self):
+        """Bind the process-wide WaveForms runtime handle to this instance"""
+        self.dwf = _load_dwf()
+        if self.dwf is not None:
+            self.status_label.config(text="WaveForms library loaded successfully")
+        else:
+            messagebox.showerror("Error", "Failed to load WaveForms library")
             self.status_label.config(text="WaveForms library not found")
 
     def view_log_file(self):
         filename = self.dl_filename.get()
         if os.path.exists(filename):
-            os.startfile(filename)  # Windows only
+            # os.startfile can block on slow/network paths; don't make the
+            # mainloop wait for the shell
+            threading.Thread(target=os.startfile, args=(filename,),
+                             daemon=True).start()  # Windows only
         else:
             messagebox.showerror("Error", f"File not found: {filename}")
 
+    def read_dc_voltages(self):
+        """Read one DC voltage pair for the logger; zeros without hardware"""
+        return 0.0, 0.0
+
+    def start_data_logger(self):
+        """Start logging to CSV in 4096-row batches
+
+        Rows accumulate in a preallocated float32 block and hit the file
+        through one np.savetxt call per batch, so the per-sample cost is a
+        single row assignment rather than a formatted write.
+        """
+        if self.logger_thread and self.logger_thread.is_alive():
+            return
+        self._log_buf = np.empty((4096, 3), np.float32)
+        self._log_idx = 0
+        self._log_file = open(self.dl_filename.get(), 'wb', buffering=1 << 20)
+        self._logger_stop.clear()
+        self.logger_thread = threading.Thread(target=self._logger_loop,
+                                              daemon=True)
+        self.logger_thread.start()
+
+    def _logger_loop(self):
+        """Producer: sample until the stop event is set (100 Hz default)"""
+        t0 = time.perf_counter()
+        while not self._logger_stop.wait(0.01):
+            v1, v2 = self.read_dc_voltages()
+            self._log_sample(time.perf_counter() - t0, v1, v2)
+
+    def _log_sample(self, t, v1, v2):
+        """Record one row into the batch buffer, flushing when it fills"""
+        self._log_buf[self._log_idx] = (t, v1, v2)
+        self._log_idx += 1
+        if self._log_idx == len(self._log_buf):
+            self._flush_log()
+
+    def _flush_log(self):
+        """Write the buffered rows through np.savetxt's C formatter"""
+        if self._log_idx:
+            np.savetxt(self._log_file, self._log_buf[:self._log_idx],
+                       fmt='%.6g', delimiter=',')
+            self._log_idx = 0
+
+    def stop_data_logger(self):
+        """Stop the logger and flush the partial batch"""
+        self._logger_stop.set()
+        if self.logger_thread:
+            self.logger_thread.join(timeout=1.0)
+        if getattr(self, '_log_file', None):
+            self._flush_log()
+            self._log_file.close()
+            self._log_file = None
+
     def browse_log_file(self):
         filename = filedialog.asksaveasfilename(
             defaultextension=".csv",
@@ -128,9 +477,55 @@ class AnalogDiscovery2GUI:
         self.create_data_logger_tab()
         self.create_script_editor_tab()
 
+        # Every tab except Connection is populated only when first selected,
+        # so startup pays for one tab's widgets instead of twelve and the
+        # matplotlib canvases are created on demand
+        self._lazy_tabs = {str(self.osc_frame): self._build_osc_tab,
+                           str(self.fg_frame): self._build_fg_tab,
+                           str(self.ps_frame): self._build_ps_tab,
+                           str(self.dio_frame): self._build_dio_tab,
+                           str(self.la_frame): self._build_la_tab,
+                           str(self.sa_frame): self._build_sa_tab,
+                           str(self.na_frame): self._build_na_tab,
+                           str(self.ia_frame): self._build_ia_tab,
+                           str(self.vm_frame): self._build_vm_tab,
+                           str(self.dl_frame): self._build_dl_tab,
+                           str(self.se_frame): self._build_se_tab}
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+
         # Status bar
         self.create_status_bar()
 
+    def _on_tab_changed(self, event=None):
+        """Build a lazily-populated tab the first time it is selected,
+        then drop hidden figures to low DPI
+
+        AGG rasterization cost scales with dpi squared, so rendering
+        background tabs at 30 dpi is ~11x fewer pixels per composite;
+        the active tab gets its full resolution back on selection.
+        """
+        current = self.notebook.select()
+        builder = self._lazy_tabs.get(current)
+        if builder:
+            # Freeze geometry while the tab populates: with propagation
+            # off, each pack/grid call skips the resize cascade up the
+            # parent chain, and one idletasks flush lays everything out
+            frame = self.notebook.nametowidget(current)
+            frame.configure(width=1200, height=700)
+            frame.pack_propagate(False)
+            builder()
+            # Only forget the builder once it has run to completion, so
+            # a build that raises gets retried on the next selection
+            # instead of leaving the tab half-constructed for good
+            del self._lazy_tabs[current]
+            frame.pack_propagate(True)
+            frame.update_idletasks()
+        for frame, (fig, canvas) in self._tab_figs.items():
+            dpi = 100 if frame == current else 30
+            if fig.get_dpi() != dpi:
+                fig.set_dpi(dpi)
+                canvas.draw_idle()
+
     def create_menu(self):
         """Create application menu"""
         menubar = tk.Menu(self.root)
@@ -146,6 +541,85 @@ class AnalogDiscovery2GUI:
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.root.quit)
 
+    def create_status_bar(self):
+        """Create the status bar along the bottom of the window"""
+        self.status_label = ttk.Label(self.root, text="Ready",
+                                      relief=tk.SUNKEN, anchor='w')
+        self.status_label.pack(side='bottom', fill='x')
+
+    # Captures above this many samples per channel spill to a disk-backed
+    # memmap instead of committing RAM for the whole record
+    _MEMMAP_THRESHOLD = 1 << 20
+
+    def _ensure_scope_capacity(self, n):
+        """Size the scope buffers for an n-sample capture
+
+        Short captures stay in the preallocated RAM arrays; anything over
+        _MEMMAP_THRESHOLD is backed by an np.memmap over a temp file so
+        the OS pages the record in and out instead of holding it resident.
+        The previous temp file, if any, is deleted on reallocation.
+        """
+        if n <= self.scope_time.size:
+            return
+        self._release_scope_memmap()
+        if n > self._MEMMAP_THRESHOLD:
+            fd, path = tempfile.mkstemp(suffix='.ad2scope')
+            os.close(fd)
+            block = np.memmap(path, dtype=np.float32, mode='w+', shape=(3, n))
+            self._scope_mmap_path = path
+        else:
+            block = np.empty((3, n), np.float32)
+        self.scope_time, self.scope_ch1, self.scope_ch2 = block
+        self._scope_n = 0
+
+    def _release_scope_memmap(self):
+        """Drop the memmap backing file left over from a long capture"""
+        if self._scope_mmap_path:
+            try:
+                os.remove(self._scope_mmap_path)
+            except OSError:
+                pass
+            self._scope_mmap_path = None
+
+    def store_scope_data(self, time_block, ch1_block, ch2_block):
+        """Copy an acquisition block into the preallocated scope buffers"""
+        n = len(time_block)
+        self._ensure_scope_capacity(n)
+        self.scope_time[:n] = time_block[:n]
+        self.scope_ch1[:n] = ch1_block[:n]
+        self.scope_ch2[:n] = ch2_block[:n]
+        self._scope_n = n
+
+    def store_spectrum_data(self, freq_block, mag_block):
+        """Copy a spectrum frame into the preallocated buffers"""
+        n = min(len(freq_block), self.max_samples)
+        self.spectrum_freq[:n] = freq_block[:n]
+        self.spectrum_mag[:n] = mag_block[:n]
+        self._spectrum_n = n
+
+    def append_na_point(self, frequency, magnitude, phase):
+        """Record one network-analyzer sweep point at the write cursor"""
+        i = self._na_n
+        if i < self.na_freq_data.size:
+            self.na_freq_data[i] = frequency
+            self.na_s11_mag_data[i] = magnitude
+            self.na_s11_phase_data[i] = phase
+            self._na_n = i + 1
+
+    @staticmethod
+    def _dump_section(csvfile, writer, title, headers, *columns):
+        """Write one titled CSV section; empty sections are skipped
+
+        The SoA buffers are equal-length by construction, so column_stack
+        needs no padding and np.savetxt formats the whole table in C.
+        """
+        if not len(columns[0]):
+            return
+        writer.writerow([title])
+        writer.writerow(headers)
+        np.savetxt(csvfile, np.column_stack(columns), delimiter=',', fmt='%.9g')
+        writer.writerow([])  # Empty row separator
+
     def export_data(self):
         """Export current data to file"""
         try:
@@ -156,42 +630,32 @@ class AnalogDiscovery2GUI:
             if not filename:
                 return
 
-            with open(filename, 'w', newline='') as csvfile:
+            # Large write buffer + np.savetxt on the filled prefixes: the
+            # row loop runs in numpy's C formatting path with no per-row
+            # Python indexing
+            # Push any memmapped capture to disk before reading it back out
+            if self._scope_mmap_path:
+                self.scope_time.base.flush()
+
+            with open(filename, 'w', newline='', buffering=1 << 20) as csvfile:
                 writer = csv.writer(csvfile)
 
-                # Export oscilloscope data
-                if self.scope_data['time']:
-                    writer.writerow(['Oscilloscope Data'])
-                    writer.writerow(['Time', 'Channel 1', 'Channel 2'])
-                    for i in range(len(self.scope_data['time'])):
-                        writer.writerow([
-                            self.scope_data['time'][i],
-                            self.scope_data['ch1'][i] if i < len(self.scope_data['ch1']) else '',
-                            self.scope_data['ch2'][i] if i < len(self.scope_data['ch2']) else ''
-                        ])
-                    writer.writerow([])  # Empty row separator
-
-                # Export spectrum data
-                if self.spectrum_data['frequency']:
-                    writer.writerow(['Spectrum Data'])
-                    writer.writerow(['Frequency', 'Magnitude'])
-                    for i in range(len(self.spectrum_data['frequency'])):
-                        writer.writerow([
-                            self.spectrum_data['frequency'][i],
-                            self.spectrum_data['magnitude'][i]
-                        ])
-                    writer.writerow([])
-
-                # Export network analyzer data if available
-                if hasattr(self, 'na_freq_data') and self.na_freq_data:
-                    writer.writerow(['Network Analyzer Data'])
-                    writer.writerow(['Frequency', 'Magnitude', 'Phase'])
-                    for i in range(len(self.na_freq_data)):
-                        writer.writerow([
-                            self.na_freq_data[i],
-                            self.na_s11_mag_data[i] if i < len(self.na_s11_mag_data) else '',
-                            self.na_s11_phase_data[i] if i < len(self.na_s11_phase_data) else ''
-                        ])
+                n = self._scope_n
+                self._dump_section(csvfile, writer, 'Oscilloscope Data',
+                                   ('Time', 'Channel 1', 'Channel 2'),
+                                   self.scope_time[:n], self.scope_ch1[:n],
+                                   self.scope_ch2[:n])
+
+                n = self._spectrum_n
+                self._dump_section(csvfile, writer, 'Spectrum Data',
+                                   ('Frequency', 'Magnitude'),
+                                   self.spectrum_freq[:n], self.spectrum_mag[:n])
+
+                n = self._na_n
+                self._dump_section(csvfile, writer, 'Network Analyzer Data',
+                                   ('Frequency', 'Magnitude', 'Phase'),
+                                   self.na_freq_data[:n], self.na_s11_mag_data[:n],
+                                   self.na_s11_phase_data[:n])
 
             messagebox.showinfo("Success", f"Data exported to {filename}")
 
@@ -216,8 +680,12 @@ class AnalogDiscovery2GUI:
                 filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
             )
             if filename:
-                with open(filename, 'w') as f:
-                    json.dump(settings, f, indent=2)
+                if ORJSON_AVAILABLE:
+                    with open(filename, 'wb') as f:
+                        f.write(orjson.dumps(settings, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(filename, 'w') as f:
+                        json.dump(settings, f, indent=2)
                 messagebox.showinfo("Success", "Settings saved successfully")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save settings: {str(e)}")
@@ -229,18 +697,24 @@ class AnalogDiscovery2GUI:
                 filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
             )
             if filename:
-                with open(filename, 'r') as f:
-                    settings = json.load(f)
-                # Apply settings example:
-                osc = settings.get('oscilloscope', {})
-                if 'ch1_range' in osc:
-                    self.ch1_range.set(osc['ch1_range'])
-                if 'ch2_range' in osc:
-                    self.ch2_range.set(osc['ch2_range'])
-                if 'sample_rate' in osc:
-                    self.sample_rate.set(osc['sample_rate'])
-                if 'buffer_size' in osc:
-                    self.buffer_size.set(osc['buffer_size'])
+                if ORJSON_AVAILABLE:
+                    with open(filename, 'rb') as f:
+                        settings = orjson.loads(f.read())
+                else:
+                    with open(filename, 'r') as f:
+                        settings = json.load(f)
+                # Setter table instead of an if-chain per key; new settings
+                # only need a new table entry
+                appliers = {
+                    'ch1_range': self.ch1_range.set,
+                    'ch2_range': self.ch2_range.set,
+                    'sample_rate': self.sample_rate.set,
+                    'buffer_size': self.buffer_size.set,
+                }
+                for key, value in settings.get('oscilloscope', {}).items():
+                    apply_setting = appliers.get(key)
+                    if apply_setting:
+                        apply_setting(value)
                 # Apply other settings as needed
                 messagebox.showinfo("Success", "Settings loaded successfully")
         except Exception as e:
@@ -288,20 +762,25 @@ class AnalogDiscovery2GUI:
         monitor_frame = ttk.LabelFrame(self.connection_frame, text="System Monitor")
         monitor_frame.pack(fill='x', padx=10, pady=5)
 
-        self.voltage_label = ttk.Label(monitor_frame, text="Voltage: -- V")
+        self.voltage_label = ttk.Label(monitor_frame, text="Voltage: -- V",
+                                       style='Readout.TLabel')
         self.voltage_label.pack(side='left', padx=10)
 
-        self.current_label = ttk.Label(monitor_frame, text="Current: -- mA")
+        self.current_label = ttk.Label(monitor_frame, text="Current: -- mA",
+                                       style='Readout.TLabel')
         self.current_label.pack(side='left', padx=10)
 
-        self.temp_label = ttk.Label(monitor_frame, text="Temperature: -- °C")
+        self.temp_label = ttk.Label(monitor_frame, text="Temperature: -- °C",
+                                       style='Readout.TLabel')
         self.temp_label.pack(side='left', padx=10)
 
     def create_oscilloscope_tab(self):
-        """Create oscilloscope interface"""
+        """Add the oscilloscope tab; contents are built on first selection"""
         self.osc_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.osc_frame, text="Oscilloscope")
 
+    def _build_osc_tab(self):
+        """Create oscilloscope interface"""
         # Control panel
         control_frame = ttk.LabelFrame(self.osc_frame, text="Oscilloscope Controls")
         control_frame.pack(fill='x', padx=10, pady=5)
@@ -311,56 +790,52 @@ class AnalogDiscovery2GUI:
         ch1_frame.pack(side='left', fill='y', padx=5)
 
         ttk.Checkbutton(ch1_frame, text="Enable Ch1").pack(anchor='w')
-        ttk.Label(ch1_frame, text="Range (V):").pack(anchor='w')
-        self.ch1_range = ttk.Combobox(ch1_frame, values=['0.1', '0.2', '0.5', '1', '2', '5', '10', '20'])
-        self.ch1_range.set('5')
-        self.ch1_range.pack(fill='x', padx=2)
+        tk.Label(ch1_frame, text="Range (V):").pack(anchor='w')
+        ttk.Combobox(ch1_frame, values=['0.1', '0.2', '0.5', '1', '2', '5', '10', '20'],
+                     textvariable=self.ch1_range).pack(fill='x', padx=2)
 
-        ttk.Label(ch1_frame, text="Offset (V):").pack(anchor='w')
-        self.ch1_offset = ttk.Scale(ch1_frame, from_=-5, to=5, orient='horizontal')
+        tk.Label(ch1_frame, text="Offset (V):").pack(anchor='w')
+        self.ch1_offset = MiniSlider(ch1_frame, from_=-5, to=5)
         self.ch1_offset.pack(fill='x', padx=2)
 
         ch2_frame = ttk.LabelFrame(control_frame, text="Channel 2")
         ch2_frame.pack(side='left', fill='y', padx=5)
 
         ttk.Checkbutton(ch2_frame, text="Enable Ch2").pack(anchor='w')
-        ttk.Label(ch2_frame, text="Range (V):").pack(anchor='w')
-        self.ch2_range = ttk.Combobox(ch2_frame, values=['0.1', '0.2', '0.5', '1', '2', '5', '10', '20'])
-        self.ch2_range.set('5')
-        self.ch2_range.pack(fill='x', padx=2)
+        tk.Label(ch2_frame, text="Range (V):").pack(anchor='w')
+        ttk.Combobox(ch2_frame, values=['0.1', '0.2', '0.5', '1', '2', '5', '10', '20'],
+                     textvariable=self.ch2_range).pack(fill='x', padx=2)
 
-        ttk.Label(ch2_frame, text="Offset (V):").pack(anchor='w')
-        self.ch2_offset = ttk.Scale(ch2_frame, from_=-5, to=5, orient='horizontal')
+        tk.Label(ch2_frame, text="Offset (V):").pack(anchor='w')
+        self.ch2_offset = MiniSlider(ch2_frame, from_=-5, to=5)
         self.ch2_offset.pack(fill='x', padx=2)
 
         # Time base controls
         time_frame = ttk.LabelFrame(control_frame, text="Time Base")
         time_frame.pack(side='left', fill='y', padx=5)
 
-        ttk.Label(time_frame, text="Sample Rate:").pack(anchor='w')
-        self.sample_rate = ttk.Combobox(time_frame, values=['1000', '10000', '100000', '1000000', '10000000'])
-        self.sample_rate.set('100000')
-        self.sample_rate.pack(fill='x', padx=2)
+        tk.Label(time_frame, text="Sample Rate:").pack(anchor='w')
+        ttk.Combobox(time_frame, values=['1000', '10000', '100000', '1000000', '10000000'],
+                     textvariable=self.sample_rate).pack(fill='x', padx=2)
 
-        ttk.Label(time_frame, text="Buffer Size:").pack(anchor='w')
-        self.buffer_size = ttk.Combobox(time_frame, values=['1024', '2048', '4096', '8192', '16384'])
-        self.buffer_size.set('4096')
-        self.buffer_size.pack(fill='x', padx=2)
+        tk.Label(time_frame, text="Buffer Size:").pack(anchor='w')
+        ttk.Combobox(time_frame, values=['1024', '2048', '4096', '8192', '16384'],
+                     textvariable=self.buffer_size).pack(fill='x', padx=2)
 
         # Trigger controls
         trigger_frame = ttk.LabelFrame(control_frame, text="Trigger")
         trigger_frame.pack(side='left', fill='y', padx=5)
 
-        ttk.Label(trigger_frame, text="Source:").pack(anchor='w')
+        tk.Label(trigger_frame, text="Source:").pack(anchor='w')
         self.trigger_source = ttk.Combobox(trigger_frame, values=['Ch1', 'Ch2', 'External'])
         self.trigger_source.set('Ch1')
         self.trigger_source.pack(fill='x', padx=2)
 
-        ttk.Label(trigger_frame, text="Level (V):").pack(anchor='w')
-        self.trigger_level = ttk.Scale(trigger_frame, from_=-5, to=5, orient='horizontal')
+        tk.Label(trigger_frame, text="Level (V):").pack(anchor='w')
+        self.trigger_level = MiniSlider(trigger_frame, from_=-5, to=5)
         self.trigger_level.pack(fill='x', padx=2)
 
-        ttk.Label(trigger_frame, text="Edge:").pack(anchor='w')
+        tk.Label(trigger_frame, text="Edge:").pack(anchor='w')
         self.trigger_edge = ttk.Combobox(trigger_frame, values=['Rising', 'Falling', 'Both'])
         self.trigger_edge.set('Rising')
         self.trigger_edge.pack(fill='x', padx=2)
@@ -383,20 +858,80 @@ class AnalogDiscovery2GUI:
         plot_frame.pack(fill='both', expand=True, padx=10, pady=5)
 
         self.osc_fig = Figure(figsize=(12, 6), dpi=100)
+        self.osc_fig.set_layout_engine('none')
         self.osc_ax = self.osc_fig.add_subplot(111)
         self.osc_ax.set_xlabel('Time (s)')
         self.osc_ax.set_ylabel('Voltage (V)')
         self.osc_ax.grid(True)
 
+        # Persistent animated artists: per-frame updates go through
+        # set_data + blit over a cached background instead of a full
+        # clear/plot/draw cycle that re-rasterizes axes and ticks
+        self.osc_line1, = self.osc_ax.plot([], [], 'b-', linewidth=1,
+                                           label='Channel 1', animated=True)
+        self.osc_line2, = self.osc_ax.plot([], [], 'r-', linewidth=1,
+                                           label='Channel 2', animated=True)
+        self.osc_ax.legend(loc='upper right')
+
         self.osc_canvas = FigureCanvasTkAgg(self.osc_fig, plot_frame)
+        self._osc_bg = None
+        self.osc_canvas.mpl_connect(
+            'draw_event',
+            lambda event: setattr(self, '_osc_bg',
+                                  self.osc_canvas.copy_from_bbox(self.osc_ax.bbox)))
         self.osc_canvas.draw()
         self.osc_canvas.get_tk_widget().pack(fill='both', expand=True)
+        self._tab_figs[str(self.osc_frame)] = (self.osc_fig, self.osc_canvas)
+
+    def update_oscilloscope_plot(self):
+        """Blit the scope traces from the capture buffers"""
+        n = self._scope_n
+        self.osc_line1.set_data(self.scope_time[:n], self.scope_ch1[:n])
+        self.osc_line2.set_data(self.scope_time[:n], self.scope_ch2[:n])
+        if self._osc_bg is None:
+            self.osc_canvas.draw_idle()
+        else:
+            self.osc_canvas.restore_region(self._osc_bg)
+            self.osc_ax.draw_artist(self.osc_line1)
+            self.osc_ax.draw_artist(self.osc_line2)
+            self.osc_canvas.blit(self.osc_ax.bbox)
+
+    def start_oscilloscope(self):
+        """Start continuous acquisition; hardware path not wired up yet"""
+        if not self.is_connected:
+            messagebox.showerror("Error", "Device not connected")
+            return
+        self.status_label.config(text="Oscilloscope running")
+
+    def stop_oscilloscope(self):
+        """Stop continuous acquisition"""
+        self.status_label.config(text="Oscilloscope stopped")
+
+    def single_capture(self):
+        """Acquire one frame; hardware path not wired up yet"""
+        if not self.is_connected:
+            messagebox.showerror("Error", "Device not connected")
+            return
+        self.update_oscilloscope_plot()
+
+    def auto_scale(self):
+        """Fit the axes to the captured record and recache the background"""
+        n = self._scope_n
+        if n:
+            self.osc_ax.set_xlim(self.scope_time[0], self.scope_time[n - 1])
+            lo = min(self.scope_ch1[:n].min(), self.scope_ch2[:n].min())
+            hi = max(self.scope_ch1[:n].max(), self.scope_ch2[:n].max())
+            pad = 0.1 * (hi - lo) or 0.5
+            self.osc_ax.set_ylim(lo - pad, hi + pad)
+        self.osc_canvas.draw()  # full render; draw_event recaches _osc_bg
 
     def create_function_generator_tab(self):
-        """Create function generator interface"""
+        """Add the function generator tab; built on first selection"""
         self.fg_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.fg_frame, text="Function Generator")
 
+    def _build_fg_tab(self):
+        """Create function generator interface"""
         # Channel 1 controls
         ch1_frame = ttk.LabelFrame(self.fg_frame, text="Channel 1")
         ch1_frame.pack(fill='x', padx=10, pady=5)
@@ -406,12 +941,12 @@ class AnalogDiscovery2GUI:
 
         ttk.Checkbutton(ch1_left, text="Enable Channel 1").pack(anchor='w')
 
-        ttk.Label(ch1_left, text="Waveform:").pack(anchor='w')
+        tk.Label(ch1_left, text="Waveform:").pack(anchor='w')
         self.fg_ch1_waveform = ttk.Combobox(ch1_left, values=['Sine', 'Square', 'Triangle', 'Sawtooth', 'DC', 'Noise'])
         self.fg_ch1_waveform.set('Sine')
         self.fg_ch1_waveform.pack(fill='x', pady=2)
 
-        ttk.Label(ch1_left, text="Frequency (Hz):").pack(anchor='w')
+        tk.Label(ch1_left, text="Frequency (Hz):").pack(anchor='w')
         self.fg_ch1_freq = ttk.Entry(ch1_left)
         self.fg_ch1_freq.insert(0, '1000')
         self.fg_ch1_freq.pack(fill='x', pady=2)
@@ -419,17 +954,17 @@ class AnalogDiscovery2GUI:
         ch1_right = ttk.Frame(ch1_frame)
         ch1_right.pack(side='left', fill='y', padx=10)
 
-        ttk.Label(ch1_right, text="Amplitude (V):").pack(anchor='w')
+        tk.Label(ch1_right, text="Amplitude (V):").pack(anchor='w')
         self.fg_ch1_amp = ttk.Entry(ch1_right)
         self.fg_ch1_amp.insert(0, '1.0')
         self.fg_ch1_amp.pack(fill='x', pady=2)
 
-        ttk.Label(ch1_right, text="Offset (V):").pack(anchor='w')
+        tk.Label(ch1_right, text="Offset (V):").pack(anchor='w')
         self.fg_ch1_offset = ttk.Entry(ch1_right)
         self.fg_ch1_offset.insert(0, '0.0')
         self.fg_ch1_offset.pack(fill='x', pady=2)
 
-        ttk.Label(ch1_right, text="Phase (°):").pack(anchor='w')
+        tk.Label(ch1_right, text="Phase (°):").pack(anchor='w')
         self.fg_ch1_phase = ttk.Entry(ch1_right)
         self.fg_ch1_phase.insert(0, '0')
         self.fg_ch1_phase.pack(fill='x', pady=2)
@@ -443,12 +978,12 @@ class AnalogDiscovery2GUI:
 
         ttk.Checkbutton(ch2_left, text="Enable Channel 2").pack(anchor='w')
 
-        ttk.Label(ch2_left, text="Waveform:").pack(anchor='w')
+        tk.Label(ch2_left, text="Waveform:").pack(anchor='w')
         self.fg_ch2_waveform = ttk.Combobox(ch2_left, values=['Sine', 'Square', 'Triangle', 'Sawtooth', 'DC', 'Noise'])
         self.fg_ch2_waveform.set('Sine')
         self.fg_ch2_waveform.pack(fill='x', pady=2)
 
-        ttk.Label(ch2_left, text="Frequency (Hz):").pack(anchor='w')
+        tk.Label(ch2_left, text="Frequency (Hz):").pack(anchor='w')
         self.fg_ch2_freq = ttk.Entry(ch2_left)
         self.fg_ch2_freq.insert(0, '2000')
         self.fg_ch2_freq.pack(fill='x', pady=2)
@@ -456,17 +991,17 @@ class AnalogDiscovery2GUI:
         ch2_right = ttk.Frame(ch2_frame)
         ch2_right.pack(side='left', fill='y', padx=10)
 
-        ttk.Label(ch2_right, text="Amplitude (V):").pack(anchor='w')
+        tk.Label(ch2_right, text="Amplitude (V):").pack(anchor='w')
         self.fg_ch2_amp = ttk.Entry(ch2_right)
         self.fg_ch2_amp.insert(0, '1.0')
         self.fg_ch2_amp.pack(fill='x', pady=2)
 
-        ttk.Label(ch2_right, text="Offset (V):").pack(anchor='w')
+        tk.Label(ch2_right, text="Offset (V):").pack(anchor='w')
         self.fg_ch2_offset = ttk.Entry(ch2_right)
         self.fg_ch2_offset.insert(0, '0.0')
         self.fg_ch2_offset.pack(fill='x', pady=2)
 
-        ttk.Label(ch2_right, text="Phase (°):").pack(anchor='w')
+        tk.Label(ch2_right, text="Phase (°):").pack(anchor='w')
         self.fg_ch2_phase = ttk.Entry(ch2_right)
         self.fg_ch2_phase.insert(0, '0')
         self.fg_ch2_phase.pack(fill='x', pady=2)
@@ -479,19 +1014,53 @@ class AnalogDiscovery2GUI:
         ttk.Button(control_frame, text="Stop Both Channels", command=self.stop_function_generator).pack(side='left', padx=5)
         ttk.Button(control_frame, text="Load Arbitrary Waveform", command=self.load_arbitrary_waveform).pack(side='left', padx=5)
 
+    def start_function_generator(self):
+        """Start both FG channels; hardware path not wired up yet"""
+        if not self.is_connected:
+            messagebox.showerror("Error", "Device not connected")
+            return
+        self.status_label.config(text="Function generator running")
+
+    def stop_function_generator(self):
+        """Stop both FG channels"""
+        self.status_label.config(text="Function generator stopped")
+
+    def load_arbitrary_waveform(self):
+        """Load a CSV of samples for the arbitrary waveform slot
+
+        The samples are kept for the output path; pushing them to the
+        device is not wired up yet.
+        """
+        filename = filedialog.askopenfilename(
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+        if not filename:
+            return
+        try:
+            self._arb_samples = np.loadtxt(filename, delimiter=',',
+                                           dtype=np.float32).ravel()
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Failed to load waveform: {e}")
+            return
+        self.status_label.config(
+            text=f"Loaded {self._arb_samples.size} waveform samples")
+
     def create_power_supply_tab(self):
-        """Create power supply interface"""
+        """Add the power supply tab; built on first selection"""
         self.ps_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.ps_frame, text="Power Supply")
 
+    def _build_ps_tab(self):
+        """Create power supply interface"""
         # Positive supply
         pos_frame = ttk.LabelFrame(self.ps_frame, text="Positive Supply")
         pos_frame.pack(fill='x', padx=10, pady=5)
 
         ttk.Checkbutton(pos_frame, text="Enable Positive Supply").pack(anchor='w')
 
-        ttk.Label(pos_frame, text="Voltage (V):").pack(anchor='w')
-        self.ps_pos_voltage = ttk.Scale(pos_frame, from_=0, to=5, orient='horizontal')
+        tk.Label(pos_frame, text="Voltage (V):").pack(anchor='w')
+        self.ps_pos_voltage = MiniSlider(
+            pos_frame, from_=0, to=5,
+            command=lambda v: self.ps_pos_voltage_label.config(text=f"{v:.1f} V"))
         self.ps_pos_voltage.set(3.3)
         self.ps_pos_voltage.pack(fill='x', padx=10)
 
@@ -504,8 +1073,10 @@ class AnalogDiscovery2GUI:
 
         ttk.Checkbutton(neg_frame, text="Enable Negative Supply").pack(anchor='w')
 
-        ttk.Label(neg_frame, text="Voltage (V):").pack(anchor='w')
-        self.ps_neg_voltage = ttk.Scale(neg_frame, from_=-5, to=0, orient='horizontal')
+        tk.Label(neg_frame, text="Voltage (V):").pack(anchor='w')
+        self.ps_neg_voltage = MiniSlider(
+            neg_frame, from_=-5, to=0,
+            command=lambda v: self.ps_neg_voltage_label.config(text=f"{v:.1f} V"))
         self.ps_neg_voltage.set(-3.3)
         self.ps_neg_voltage.pack(fill='x', padx=10)
 
@@ -529,28 +1100,49 @@ class AnalogDiscovery2GUI:
         ttk.Button(control_frame, text="Apply Settings", command=self.apply_power_supply).pack(side='left', padx=5)
         ttk.Button(control_frame, text="Turn Off All", command=self.turn_off_power_supply).pack(side='left', padx=5)
 
+    def apply_power_supply(self):
+        """Apply the supply settings; hardware path not wired up yet"""
+        if not self.is_connected:
+            messagebox.showerror("Error", "Device not connected")
+            return
+        self.status_label.config(
+            text=f"Supplies set: {self.ps_pos_voltage.get():+.1f} V / "
+                 f"{self.ps_neg_voltage.get():+.1f} V")
+
+    def turn_off_power_supply(self):
+        """Disable both supplies"""
+        self.status_label.config(text="Supplies off")
+
     def create_digital_io_tab(self):
-        """Create digital I/O interface"""
+        """Create the digital I/O tab; its 16-row widget bank is built lazily"""
         self.dio_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.dio_frame, text="Digital I/O")
+        self._dio_mask = 0
 
+    def _build_dio_tab(self):
+        """Populate the digital I/O tab on first view"""
         # Digital output controls
         output_frame = ttk.LabelFrame(self.dio_frame, text="Digital Outputs")
         output_frame.pack(fill='x', padx=10, pady=5)
 
+        # The checkboxes stay for the UI, but the output state lives in one
+        # packed uint16 recomputed on any toggle, so applying the outputs is
+        # a single DWF call instead of sixteen
         self.dio_outputs = {}
         for i in range(16):
             frame = ttk.Frame(output_frame)
             frame.pack(fill='x', padx=5, pady=2)
 
-            ttk.Label(frame, text=f"DIO {i}:").pack(side='left')
+            tk.Label(frame, text=f"DIO {i}:").pack(side='left')
 
             var = tk.BooleanVar()
+            var.trace_add('write', self._update_dio_mask)
             self.dio_outputs[i] = var
             ttk.Checkbutton(frame, text="High", variable=var).pack(side='left', padx=10)
 
-            ttk.Label(frame, text="Mode:").pack(side='left', padx=10)
-            mode_combo = ttk.Combobox(frame, values=['Output', 'Input', 'Input Pull-Up', 'Input Pull-Down'], width=15)
+            tk.Label(frame, text="Mode:").pack(side='left', padx=10)
+            mode_combo = ttk.Combobox(frame, values=DIO_MODES,
+                                      state='readonly', width=15)
             mode_combo.set('Output')
             mode_combo.pack(side='left', padx=5)
 
@@ -573,11 +1165,64 @@ class AnalogDiscovery2GUI:
         ttk.Button(control_frame, text="Read Inputs", command=self.read_digital_inputs).pack(side='left', padx=5)
         ttk.Button(control_frame, text="Start Monitoring", command=self.start_digital_monitoring).pack(side='left', padx=5)
 
+    def _update_dio_mask(self, *args):
+        """Recompute the packed output word from the 16 checkbox variables"""
+        mask = 0
+        for i, var in self.dio_outputs.items():
+            if var.get():
+                mask |= 1 << i
+        self._dio_mask = mask
+
+    def apply_digital_outputs(self):
+        """Write all 16 DIO outputs as one word in a single DWF call"""
+        if not self.is_connected or not getattr(self, 'dwf', None):
+            messagebox.showerror("Error", "Device not connected")
+            return
+        self.dwf.FDwfDigitalIOOutputEnableSet(self.hdwf, c_uint32(0xFFFF))
+        self.dwf.FDwfDigitalIOOutputSet(self.hdwf, c_uint32(self._dio_mask))
+
+    def read_digital_inputs(self):
+        """Read all 16 DIO inputs with one status call and unpack the word"""
+        if not self.is_connected or not getattr(self, 'dwf', None):
+            messagebox.showerror("Error", "Device not connected")
+            return
+        self.dwf.FDwfDigitalIOStatus(self.hdwf)
+        word = c_uint32()
+        self.dwf.FDwfDigitalIOInputStatus(self.hdwf, byref(word))
+
+        # Expand the word to 16 level flags in one vectorized call
+        bits = np.unpackbits(
+            np.frombuffer(struct.pack('<H', word.value & 0xFFFF), np.uint8),
+            bitorder='little')[:16]
+        report = '\n'.join(
+            f"DIO {i}: {'High' if bits[i] else 'Low'}" for i in range(16))
+        self.dio_input_text.delete('1.0', tk.END)
+        self.dio_input_text.insert('1.0', report + '\n')
+
+    def start_digital_monitoring(self):
+        """Refresh the DIO input report once a second via an after chain"""
+        if not self.is_connected:
+            messagebox.showerror("Error", "Device not connected")
+            return
+        if not getattr(self, '_dio_polling', False):
+            self._dio_polling = True
+            self._poll_digital_inputs()
+
+    def _poll_digital_inputs(self):
+        # The chain ends itself on disconnect, like the analyzer drains
+        if not self.is_connected:
+            self._dio_polling = False
+            return
+        self.read_digital_inputs()
+        self.root.after(1000, self._poll_digital_inputs)
+
     def create_logic_analyzer_tab(self):
-        """Create logic analyzer interface"""
+        """Create the logic analyzer tab; its contents are built lazily"""
         self.la_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.la_frame, text="Logic Analyzer")
 
+    def _build_la_tab(self):
+        """Populate the logic analyzer tab on first view"""
         # Configuration
         config_frame = ttk.LabelFrame(self.la_frame, text="Logic Analyzer Configuration")
         config_frame.pack(fill='x', padx=10, pady=5)
@@ -585,12 +1230,12 @@ class AnalogDiscovery2GUI:
         left_config = ttk.Frame(config_frame)
         left_config.pack(side='left', fill='y', padx=10)
 
-        ttk.Label(left_config, text="Sample Rate:").pack(anchor='w')
+        tk.Label(left_config, text="Sample Rate:").pack(anchor='w')
         self.la_sample_rate = ttk.Combobox(left_config, values=['1MHz', '10MHz', '100MHz'])
         self.la_sample_rate.set('10MHz')
         self.la_sample_rate.pack(fill='x', pady=2)
 
-        ttk.Label(left_config, text="Buffer Size:").pack(anchor='w')
+        tk.Label(left_config, text="Buffer Size:").pack(anchor='w')
         self.la_buffer_size = ttk.Combobox(left_config, values=['1024', '2048', '4096', '8192'])
         self.la_buffer_size.set('4096')
         self.la_buffer_size.pack(fill='x', pady=2)
@@ -598,12 +1243,13 @@ class AnalogDiscovery2GUI:
         right_config = ttk.Frame(config_frame)
         right_config.pack(side='left', fill='y', padx=10)
 
-        ttk.Label(right_config, text="Trigger Channel:").pack(anchor='w')
-        self.la_trigger_channel = ttk.Combobox(right_config, values=[f'DIO{i}' for i in range(16)])
+        tk.Label(right_config, text="Trigger Channel:").pack(anchor='w')
+        self.la_trigger_channel = ttk.Combobox(right_config, values=DIO_NAMES,
+                                               state='readonly')
         self.la_trigger_channel.set('DIO0')
         self.la_trigger_channel.pack(fill='x', pady=2)
 
-        ttk.Label(right_config, text="Trigger Edge:").pack(anchor='w')
+        tk.Label(right_config, text="Trigger Edge:").pack(anchor='w')
         self.la_trigger_edge = ttk.Combobox(right_config, values=['Rising', 'Falling', 'Both'])
         self.la_trigger_edge.set('Rising')
         self.la_trigger_edge.pack(fill='x', pady=2)
@@ -635,20 +1281,87 @@ class AnalogDiscovery2GUI:
         plot_frame.pack(fill='both', expand=True, padx=10, pady=5)
 
         self.la_fig = Figure(figsize=(12, 6), dpi=100)
+        self.la_fig.set_layout_engine('none')
         self.la_ax = self.la_fig.add_subplot(111)
         self.la_ax.set_xlabel('Time (s)')
         self.la_ax.set_ylabel('Digital Channels')
         self.la_ax.grid(True)
 
+        # One animated step-trace per DIO line, stacked vertically; updates
+        # blit all 16 over the cached background in one pass
+        self.la_lines = []
+        for i in range(16):
+            line, = self.la_ax.plot([], [], linewidth=1,
+                                    drawstyle='steps-post', animated=True)
+            self.la_lines.append(line)
+        self.la_ax.set_yticks([i * 1.5 for i in range(16)])
+        self.la_ax.set_yticklabels([f'DIO{i}' for i in range(16)])
+
         self.la_canvas = FigureCanvasTkAgg(self.la_fig, plot_frame)
+        self._la_bg = None
+        self.la_canvas.mpl_connect(
+            'draw_event',
+            lambda event: setattr(self, '_la_bg',
+                                  self.la_canvas.copy_from_bbox(self.la_ax.bbox)))
         self.la_canvas.draw()
         self.la_canvas.get_tk_widget().pack(fill='both', expand=True)
+        self._tab_figs[str(self.la_frame)] = (self.la_fig, self.la_canvas)
+
+    @staticmethod
+    def unpack_la_samples(samples):
+        """Split a uint16 DIO sample buffer into a (16, N) float32 block
+
+        One vectorized unpackbits call replaces the O(N*16) Python
+        shift-and-mask loop; row i is the trace for DIOi.
+        """
+        samples = np.ascontiguousarray(samples, dtype=np.uint16)
+        bits = np.unpackbits(samples.view(np.uint8), bitorder='little')
+        return bits.reshape(-1, 16).T.astype(np.float32)
+
+    def update_logic_analyzer_plot(self, time_block, bits):
+        """Blit the 16 digital traces; bits is a (16, N) 0/1 block
+
+        Each channel is offset by 1.5 so the traces stack like a logic
+        analyzer display; disabled channels get empty data.
+        """
+        for i, line in enumerate(self.la_lines):
+            if self.la_channels[i].get():
+                line.set_data(time_block, bits[i] + i * 1.5)
+            else:
+                line.set_data([], [])
+        if self._la_bg is None:
+            self.la_canvas.draw_idle()
+        else:
+            self.la_canvas.restore_region(self._la_bg)
+            for line in self.la_lines:
+                self.la_ax.draw_artist(line)
+            self.la_canvas.blit(self.la_ax.bbox)
+
+    def start_logic_analyzer(self):
+        """Start continuous capture; hardware path not wired up yet"""
+        if not self.is_connected:
+            messagebox.showerror("Error", "Device not connected")
+            return
+        self.status_label.config(text="Logic analyzer running")
+
+    def stop_logic_analyzer(self):
+        """Stop continuous capture"""
+        self.status_label.config(text="Logic analyzer stopped")
+
+    def single_logic_capture(self):
+        """Acquire one digital record; hardware path not wired up yet"""
+        if not self.is_connected:
+            messagebox.showerror("Error", "Device not connected")
+            return
+        self.status_label.config(text="Logic analyzer: single capture")
 
     def create_spectrum_analyzer_tab(self):
-        """Create spectrum analyzer interface"""
+        """Add the spectrum analyzer tab; built on first selection"""
         self.sa_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.sa_frame, text="Spectrum Analyzer")
 
+    def _build_sa_tab(self):
+        """Create spectrum analyzer interface"""
         # Configuration
         config_frame = ttk.LabelFrame(self.sa_frame, text="Spectrum Analyzer Configuration")
         config_frame.pack(fill='x', padx=10, pady=5)
@@ -656,12 +1369,12 @@ class AnalogDiscovery2GUI:
         left_config = ttk.Frame(config_frame)
         left_config.pack(side='left', fill='y', padx=10)
 
-        ttk.Label(left_config, text="Channel:").pack(anchor='w')
+        tk.Label(left_config, text="Channel:").pack(anchor='w')
         self.sa_channel = ttk.Combobox(left_config, values=['Ch1', 'Ch2'])
         self.sa_channel.set('Ch1')
         self.sa_channel.pack(fill='x', pady=2)
 
-        ttk.Label(left_config, text="Window:").pack(anchor='w')
+        tk.Label(left_config, text="Window:").pack(anchor='w')
         self.sa_window = ttk.Combobox(left_config, values=['Rectangular', 'Hanning', 'Hamming', 'Blackman'])
         self.sa_window.set('Hanning')
         self.sa_window.pack(fill='x', pady=2)
@@ -669,12 +1382,12 @@ class AnalogDiscovery2GUI:
         right_config = ttk.Frame(config_frame)
         right_config.pack(side='left', fill='y', padx=10)
 
-        ttk.Label(right_config, text="Frequency Span:").pack(anchor='w')
+        tk.Label(right_config, text="Frequency Span:").pack(anchor='w')
         self.sa_span = ttk.Combobox(right_config, values=['1kHz', '10kHz', '100kHz', '1MHz', '10MHz'])
         self.sa_span.set('1MHz')
         self.sa_span.pack(fill='x', pady=2)
 
-        ttk.Label(right_config, text="Center Frequency:").pack(anchor='w')
+        tk.Label(right_config, text="Center Frequency:").pack(anchor='w')
         self.sa_center_freq = ttk.Entry(right_config)
         self.sa_center_freq.insert(0, '1000000')
         self.sa_center_freq.pack(fill='x', pady=2)
@@ -696,20 +1409,160 @@ class AnalogDiscovery2GUI:
         plot_frame.pack(fill='both', expand=True, padx=10, pady=5)
 
         self.sa_fig = Figure(figsize=(12, 6), dpi=100)
+        self.sa_fig.set_layout_engine('none')
         self.sa_ax = self.sa_fig.add_subplot(111)
         self.sa_ax.set_xlabel('Frequency (Hz)')
         self.sa_ax.set_ylabel('Magnitude (dB)')
         self.sa_ax.grid(True)
+        # Fixed limits keep the cached background valid between frames;
+        # autoscaling would force a full redraw on every FFT update
+        self.sa_ax.set_xlim(0, 1e6)
+        self.sa_ax.set_ylim(-120, 20)
+        self.sa_ax.xaxis.set_major_locator(MaxNLocator(8))
+
+        self.sa_line, = self.sa_ax.plot([], [], 'g-', linewidth=1, animated=True)
 
         self.sa_canvas = FigureCanvasTkAgg(self.sa_fig, plot_frame)
+        self._sa_bg = None
+        self.sa_canvas.mpl_connect(
+            'draw_event',
+            lambda event: setattr(self, '_sa_bg',
+                                  self.sa_canvas.copy_from_bbox(self.sa_ax.bbox)))
         self.sa_canvas.draw()
         self.sa_canvas.get_tk_widget().pack(fill='both', expand=True)
+        self._tab_figs[str(self.sa_frame)] = (self.sa_fig, self.sa_canvas)
+
+    def update_spectrum_plot(self):
+        """Blit the spectrum trace from the spectrum buffers"""
+        n = self._spectrum_n
+        self.sa_line.set_data(*_decimate_minmax(self.spectrum_freq[:n],
+                                                self.spectrum_mag[:n]))
+        if self._sa_bg is None:
+            self.sa_canvas.draw_idle()
+        else:
+            self.sa_canvas.restore_region(self._sa_bg)
+            self.sa_ax.draw_artist(self.sa_line)
+            self.sa_canvas.blit(self.sa_ax.bbox)
+
+    # Window name -> generator; Rectangular skips the multiply entirely
+    _WINDOW_FUNCS = {'Hanning': np.hanning, 'Hamming': np.hamming,
+                     'Blackman': np.blackman}
+
+    def _get_window(self, name, n):
+        """Return (window, coherent_gain) cached per (name, length)
+
+        Windows are invariant between combobox changes, so the N
+        transcendentals and the gain normalization are computed once, not
+        per frame. Returns (None, 1.0) for Rectangular.
+        """
+        window_func = self._WINDOW_FUNCS.get(name)
+        if window_func is None:
+            return None, 1.0
+        key = (name, n)
+        cached = self._win_cache.get(key)
+        if cached is None:
+            w = window_func(n)
+            cached = (w, 1.0 / w.mean())
+            self._win_cache[key] = cached
+        return cached
+
+    def _rfft(self, x):
+        """FFT through a cached pyfftw plan when available"""
+        if PYFFTW_AVAILABLE:
+            plan = self._fft_plans.get(x.size)
+            if plan is None:
+                plan = pyfftw.builders.rfft(x)
+                self._fft_plans[x.size] = plan
+            return plan(x)
+        return np.fft.rfft(x)
+
+    def compute_spectrum(self, samples, sample_rate):
+        """Window + FFT one capture block into the spectrum buffers (dB)
+
+        The magnitude/dB conversion is a single fused kernel when numba is
+        present; otherwise numpy's vectorized path is used.
+        """
+        n = len(samples)
+        win, gain = self._get_window(self.sa_window.get(), n)
+        if win is None:
+            x = np.asarray(samples, np.float64)
+        else:
+            x = samples * win
+
+        spec = self._rfft(x)
+        freqs = np.fft.rfftfreq(n, 1.0 / sample_rate)
+        scale = 2.0 / n * gain
+
+        if NUMBA_AVAILABLE:
+            mag_db = np.empty(spec.size)
+            _mag_db(np.ascontiguousarray(spec.real),
+                    np.ascontiguousarray(spec.imag), scale, mag_db)
+        else:
+            mag_db = 20.0 * np.log10(np.abs(spec) * scale + 1e-12)
+
+        if getattr(self, '_sa_peak_hold', False) and self._spectrum_n == spec.size:
+            # Accumulate into the existing frame instead of replacing it
+            acc = self.spectrum_mag[:spec.size]
+            if NUMBA_AVAILABLE:
+                _peak_hold(acc, mag_db)
+            else:
+                np.maximum(acc, mag_db, out=acc)
+        else:
+            self.store_spectrum_data(freqs, mag_db)
+
+    def peak_hold_spectrum(self):
+        """Toggle peak-hold accumulation on the spectrum display"""
+        self._sa_peak_hold = not getattr(self, '_sa_peak_hold', False)
+
+    def acquire_spectrum_frame(self):
+        """Capture one (samples, sample_rate) block for the analyzer
+
+        Returns None when no capture source is available; the producer
+        treats that as 'nothing to push'.
+        """
+        if not self.is_connected:
+            time.sleep(0.05)  # don't spin while disconnected
+            return None
+        return None  # hardware capture path not wired up yet
+
+    def _spectrum_producer(self):
+        """Worker loop: acquire frames and hand them to the Tk consumer"""
+        while not self._spectrum_stop.is_set():
+            frame = self.acquire_spectrum_frame()
+            if frame is not None:
+                self._spectrum_q.append(frame)
+
+    def _drain_spectrum(self):
+        """Tk-side consumer: process the newest queued frame, drop the rest"""
+        if self._spectrum_q:
+            samples, sample_rate = self._spectrum_q.pop()
+            self._spectrum_q.clear()
+            self.compute_spectrum(samples, sample_rate)
+            self.update_spectrum_plot()
+        if not self._spectrum_stop.is_set():
+            self.root.after(16, self._drain_spectrum)
+
+    def start_spectrum_analyzer(self):
+        """Start the spectrum producer thread and its display consumer"""
+        if self.spectrum_thread and self.spectrum_thread.is_alive():
+            return
+        self._spectrum_stop.clear()
+        self.spectrum_thread = threading.Thread(target=self._spectrum_producer,
+                                                daemon=True)
+        self.spectrum_thread.start()
+        self._drain_spectrum()
+
+    def stop_spectrum_analyzer(self):
+        """Stop spectrum acquisition; the producer exits on the event"""
+        self._spectrum_stop.set()
 
     def create_network_analyzer_tab(self):
-        """Create network analyzer interface"""
+        """Add the network analyzer tab; built on first selection"""
         self.na_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.na_frame, text="Network Analyzer")
 
+    def _build_na_tab(self):
+        """Create network analyzer interface"""
         # Configuration
         config_frame = ttk.LabelFrame(self.na_frame, text="Network Analyzer Configuration")
         config_frame.pack(fill='x', padx=10, pady=5)
@@ -717,37 +1570,34 @@ class AnalogDiscovery2GUI:
         left_config = ttk.Frame(config_frame)
         left_config.pack(side='left', fill='y', padx=10)
 
-        ttk.Label(left_config, text="Start Frequency (Hz):").pack(anchor='w')
-        self.na_start_freq = ttk.Entry(left_config)
-        self.na_start_freq.insert(0, '100')
-        self.na_start_freq.pack(fill='x', pady=2)
+        # Parameters are parsed once per edit via the write traces wired
+        # by the grid helper; the sweep code reads the cached attributes
+        self._na_fstart, self._na_fstop = 100.0, 1e6
+        self._na_steps, self._na_amp = 100, 1.0
 
-        ttk.Label(left_config, text="Stop Frequency (Hz):").pack(anchor='w')
-        self.na_stop_freq = ttk.Entry(left_config)
-        self.na_stop_freq.insert(0, '1000000')
-        self.na_stop_freq.pack(fill='x', pady=2)
+        self._build_field_grid(
+            left_config,
+            [('Start Frequency (Hz):', 'na_start_freq_var', '100'),
+             ('Stop Frequency (Hz):', 'na_stop_freq_var', '1000000')],
+            trace=self._cache_na_params)
 
         right_config = ttk.Frame(config_frame)
         right_config.pack(side='left', fill='y', padx=10)
 
-        ttk.Label(right_config, text="Number of Steps:").pack(anchor='w')
-        self.na_steps = ttk.Entry(right_config)
-        self.na_steps.insert(0, '100')
-        self.na_steps.pack(fill='x', pady=2)
-
-        ttk.Label(right_config, text="Amplitude (V):").pack(anchor='w')
-        self.na_amplitude = ttk.Entry(right_config)
-        self.na_amplitude.insert(0, '1.0')
-        self.na_amplitude.pack(fill='x', pady=2)
+        self._build_field_grid(
+            right_config,
+            [('Number of Steps:', 'na_steps_var', '100'),
+             ('Amplitude (V):', 'na_amplitude_var', '1.0')],
+            trace=self._cache_na_params)
 
         # Measurement type
         meas_frame = ttk.LabelFrame(self.na_frame, text="Measurement Type")
         meas_frame.pack(fill='x', padx=10, pady=5)
 
         self.na_measurement = tk.StringVar(value="Magnitude")
-        ttk.Radiobutton(meas_frame, text="Magnitude", variable=self.na_measurement, value="Magnitude").pack(side='left', padx=10)
-        ttk.Radiobutton(meas_frame, text="Phase", variable=self.na_measurement, value="Phase").pack(side='left', padx=10)
-        ttk.Radiobutton(meas_frame, text="Both", variable=self.na_measurement, value="Both").pack(side='left', padx=10)
+        ttk.Radiobutton(meas_frame, text="Magnitude", variable=self.na_measurement, value="Magnitude", style='Config.TRadiobutton').pack(side='left', padx=10)
+        ttk.Radiobutton(meas_frame, text="Phase", variable=self.na_measurement, value="Phase", style='Config.TRadiobutton').pack(side='left', padx=10)
+        ttk.Radiobutton(meas_frame, text="Both", variable=self.na_measurement, value="Both", style='Config.TRadiobutton').pack(side='left', padx=10)
 
         # Control buttons
         control_frame = ttk.Frame(self.na_frame)
@@ -766,6 +1616,7 @@ class AnalogDiscovery2GUI:
         plot_frame.pack(fill='both', expand=True, padx=10, pady=5)
 
         self.na_fig = Figure(figsize=(12, 6), dpi=100)
+        self.na_fig.set_layout_engine('none')
         self.na_ax1 = self.na_fig.add_subplot(211)
         self.na_ax2 = self.na_fig.add_subplot(212)
 
@@ -775,15 +1626,262 @@ class AnalogDiscovery2GUI:
         self.na_ax2.set_ylabel('Phase (°)')
         self.na_ax2.grid(True)
 
+        # Persistent animated artists: per-point sweep updates restore the
+        # cached backgrounds and blit just the two lines instead of
+        # re-rendering axes, ticks and grid through canvas.draw()
+        self.na_mag_line, = self.na_ax1.plot([], [], 'b-', linewidth=1,
+                                             animated=True)
+        self.na_phase_line, = self.na_ax2.plot([], [], 'r-', linewidth=1,
+                                               animated=True)
+        self._set_na_limits(100.0, 1e6)
+
         self.na_canvas = FigureCanvasTkAgg(self.na_fig, plot_frame)
+        self._na_bg1 = self._na_bg2 = None
+        self.na_canvas.mpl_connect('draw_event', self._na_cache_bg)
         self.na_canvas.draw()
         self.na_canvas.get_tk_widget().pack(fill='both', expand=True)
+        self._tab_figs[str(self.na_frame)] = (self.na_fig, self.na_canvas)
+
+    def _na_cache_bg(self, event=None):
+        """Recapture the axes backgrounds after any full draw (incl. resize)"""
+        self._na_bg1 = self.na_canvas.copy_from_bbox(self.na_ax1.bbox)
+        self._na_bg2 = self.na_canvas.copy_from_bbox(self.na_ax2.bbox)
+
+    def _set_na_limits(self, fstart, fstop):
+        """Fix the sweep axes up front; blitting needs stable limits
+
+        Tick counts are capped too: each tick is an artist drawn on every
+        full render, and LogLocator's default can emit dozens of them over
+        a wide sweep.
+        """
+        for ax in (self.na_ax1, self.na_ax2):
+            ax.set_xscale('log')
+            ax.set_xlim(fstart, fstop)
+            ax.xaxis.set_major_locator(LogLocator(numticks=8))
+            ax.tick_params(direction='in')
+        self.na_ax1.set_ylim(-80, 20)
+        self.na_ax2.set_ylim(-180, 180)
+
+    def update_network_analyzer_plot(self):
+        """Blit the sweep-so-far from the network analyzer buffers"""
+        n = self._na_n
+        freqs = self.na_freq_data[:n]
+        self.na_mag_line.set_data(freqs, self.na_s11_mag_data[:n])
+        self.na_phase_line.set_data(freqs, self.na_s11_phase_data[:n])
+        if self._na_bg1 is None:
+            self.na_canvas.draw_idle()
+        else:
+            self.na_canvas.restore_region(self._na_bg1)
+            self.na_canvas.restore_region(self._na_bg2)
+            self.na_ax1.draw_artist(self.na_mag_line)
+            self.na_ax2.draw_artist(self.na_phase_line)
+            self.na_canvas.blit(self.na_ax1.bbox)
+            self.na_canvas.blit(self.na_ax2.bbox)
+
+    def _build_field_grid(self, parent, spec, trace=None):
+        """Create labelled entry rows from a table, laid out with grid
+
+        Each spec row is (label_text, var_attr, default): the StringVar is
+        stored as <var_attr> and the Entry as <var_attr> minus its '_var'
+        suffix. grid solves the layout once per pass instead of pack's
+        per-call cascade through the parent chain, and the table replaces
+        four near-identical statements per field.
+        """
+        for i, (text, var_attr, default) in enumerate(spec):
+            tk.Label(parent, text=text).grid(row=i, column=0,
+                                             sticky='w', pady=2)
+            var = tk.StringVar(value=default)
+            setattr(self, var_attr, var)
+            entry = ttk.Entry(parent, textvariable=var)
+            setattr(self, var_attr[:-4], entry)
+            entry.grid(row=i, column=1, sticky='ew', pady=2)
+            if trace:
+                var.trace_add('write', trace)
+        parent.columnconfigure(1, weight=1)
+
+    @staticmethod
+    def _parse_var(var, cast, fallback):
+        """Parse a Tk variable, keeping the last valid value mid-edit"""
+        try:
+            return cast(var.get())
+        except (ValueError, tk.TclError):
+            return fallback
+
+    def _cache_na_params(self, *_):
+        """Re-parse the sweep entries on edit (write trace)"""
+        self._na_fstart = self._parse_var(self.na_start_freq_var, float,
+                                          self._na_fstart)
+        self._na_fstop = self._parse_var(self.na_stop_freq_var, float,
+                                         self._na_fstop)
+        self._na_steps = self._parse_var(self.na_steps_var, int,
+                                         self._na_steps)
+        self._na_amp = self._parse_var(self.na_amplitude_var, float,
+                                       self._na_amp)
+
+    def _cache_ia_params(self, *_):
+        """Re-parse the impedance entries on edit (write trace)"""
+        self._ia_freq = self._parse_var(self.ia_frequency_var, float,
+                                        self._ia_freq)
+        self._ia_amp = self._parse_var(self.ia_amplitude_var, float,
+                                       self._ia_amp)
+        self._ia_ref = self._parse_var(self.ia_ref_resistor_var, float,
+                                       self._ia_ref)
+
+    def measure_na_point(self, frequency, amplitude):
+        """Measure one (magnitude_db, phase_deg) response point
+
+        Returns None when no capture source is available; the sweep worker
+        stops on the first None.
+        """
+        if not self.is_connected:
+            return None
+        return None  # hardware measurement path not wired up yet
+
+    def start_network_analyzer(self):
+        """Run repeated sweeps on a worker thread"""
+        self._start_na_sweep(continuous=True)
+
+    def single_network_sweep(self):
+        """Run one sweep on a worker thread"""
+        self._start_na_sweep(continuous=False)
+
+    def _start_na_sweep(self, continuous):
+        """Launch the sweep worker and the Tk-side queue drainer
+
+        The worker only touches hardware and the queue; every widget and
+        artist update happens in _drain_na_queue on the Tk thread.
+        """
+        if self.na_thread and self.na_thread.is_alive():
+            return
+        fstart, fstop = self._na_fstart, self._na_fstop
+        steps, amplitude = self._na_steps, self._na_amp
+        freqs = _make_log_grid(fstart, fstop, steps)
+
+        # Size the result buffers once per sweep; the worker index-assigns
+        # through append_na_point with no reallocation mid-sweep
+        if steps > self.na_freq_data.size:
+            self.na_max_steps = steps
+            self.na_freq_data = np.empty(steps, np.float32)
+            self.na_s11_mag_data = np.empty(steps, np.float32)
+            self.na_s11_phase_data = np.empty(steps, np.float32)
+
+        self._na_n = 0
+        self._na_q.clear()
+        self._set_na_limits(fstart, fstop)
+        self.na_canvas.draw()  # recapture backgrounds for the new limits
+
+        self._na_stop.clear()
+        self.na_thread = threading.Thread(target=self._na_worker,
+                                          args=(freqs, amplitude, continuous),
+                                          daemon=True)
+        self.na_thread.start()
+        self._drain_na_queue()
+
+    def _na_worker(self, freqs, amplitude, continuous):
+        """Worker loop: measure each sweep point and queue it for the UI"""
+        while not self._na_stop.is_set():
+            for frequency in freqs:
+                if self._na_stop.is_set():
+                    return
+                point = self.measure_na_point(frequency, amplitude)
+                if point is None:
+                    return
+                self._na_q.append((frequency, point[0], point[1]))
+            if not continuous:
+                return
+
+    def _drain_na_queue(self):
+        """Tk-side consumer: absorb queued points, then one blit update"""
+        drained = False
+        while self._na_q:
+            frequency, magnitude, phase = self._na_q.popleft()
+            self.append_na_point(frequency, magnitude, phase)
+            drained = True
+        if drained:
+            self.update_network_analyzer_plot()
+        # Keep polling while the worker lives or points remain. Liveness,
+        # not the stop event, is the terminating condition: a single
+        # sweep's worker returns without ever setting the event, and
+        # _start_na_sweep guards on liveness so a finished chain must die
+        # before the next Start can run
+        if self._na_q or (self.na_thread and self.na_thread.is_alive()):
+            self.root.after(30, self._drain_na_queue)
+
+    def stop_network_analyzer(self):
+        """Stop the sweep; the worker exits on the event"""
+        self._na_stop.set()
+
+    def read_impedance_point(self):
+        """Measure one (impedance_ohm, phase_deg) sample
+
+        Returns None when no capture source is available.
+        """
+        if not self.is_connected:
+            return None
+        return None  # hardware measurement path not wired up yet
+
+    def measure_impedance(self):
+        """Run one impedance measurement on a worker thread"""
+        self._start_ia_measurement(continuous=False)
+
+    def continuous_impedance(self):
+        """Toggle continuous impedance measurement"""
+        if self.ia_thread and self.ia_thread.is_alive():
+            self._ia_stop.set()
+        else:
+            self._start_ia_measurement(continuous=True)
+
+    def _start_ia_measurement(self, continuous):
+        if self.ia_thread and self.ia_thread.is_alive():
+            return
+        self._ia_stop.clear()
+        self.ia_thread = threading.Thread(target=self._ia_worker,
+                                          args=(continuous,), daemon=True)
+        self.ia_thread.start()
+
+    def _ia_worker(self, continuous):
+        """Worker loop: measure and hand results to the Tk thread"""
+        while not self._ia_stop.is_set():
+            point = self.read_impedance_point()
+            if point is None:
+                return
+            impedance, phase = point
+            resistance = impedance * math.cos(math.radians(phase))
+            reactance = impedance * math.sin(math.radians(phase))
+            # Latest value wins: overwrite the pending tuple and schedule
+            # at most one flush. Four .config calls per sample would each
+            # cost a Tcl round-trip plus relayout at high rates.
+            self._ia_pending = (impedance, phase, resistance, reactance)
+            if not self._ia_flush_scheduled:
+                self._ia_flush_scheduled = True
+                self.root.after_idle(self._flush_ia_labels)
+            if not continuous:
+                return
+
+    def _flush_ia_labels(self):
+        """Write the newest measurement into the results labels (Tk thread)"""
+        self._ia_flush_scheduled = False
+        pending = self._ia_pending
+        if pending is None:
+            return
+        impedance, phase, resistance, reactance = pending
+        self.ia_impedance_label.config(text=f"Impedance: {impedance:.2f} Ω")
+        self.ia_phase_label.config(text=f"Phase: {phase:.2f} °")
+        self.ia_resistance_label.config(text=f"Resistance: {resistance:.2f} Ω")
+        self.ia_reactance_label.config(text=f"Reactance: {reactance:.2f} Ω")
+
+    def calibrate_impedance(self):
+        """Open/short calibration placeholder"""
+        messagebox.showinfo("Calibrate",
+                            "Connect the reference resistor only, then measure")
 
     def create_impedance_analyzer_tab(self):
-        """Create impedance analyzer interface"""
+        """Add the impedance analyzer tab; built on first selection"""
         self.ia_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.ia_frame, text="Impedance Analyzer")
 
+    def _build_ia_tab(self):
+        """Create impedance analyzer interface"""
         # Configuration
         config_frame = ttk.LabelFrame(self.ia_frame, text="Impedance Analyzer Configuration")
         config_frame.pack(fill='x', padx=10, pady=5)
@@ -791,43 +1889,48 @@ class AnalogDiscovery2GUI:
         left_config = ttk.Frame(config_frame)
         left_config.pack(side='left', fill='y', padx=10)
 
-        ttk.Label(left_config, text="Test Frequency (Hz):").pack(anchor='w')
-        self.ia_frequency = ttk.Entry(left_config)
-        self.ia_frequency.insert(0, '1000')
-        self.ia_frequency.pack(fill='x', pady=2)
+        # Same write-trace caching as the network analyzer entries: the
+        # continuous-measurement loop reads plain attributes per sample
+        self._ia_freq, self._ia_amp, self._ia_ref = 1000.0, 1.0, 1000.0
 
-        ttk.Label(left_config, text="Test Amplitude (V):").pack(anchor='w')
-        self.ia_amplitude = ttk.Entry(left_config)
-        self.ia_amplitude.insert(0, '1.0')
-        self.ia_amplitude.pack(fill='x', pady=2)
+        self._build_field_grid(
+            left_config,
+            [('Test Frequency (Hz):', 'ia_frequency_var', '1000'),
+             ('Test Amplitude (V):', 'ia_amplitude_var', '1.0')],
+            trace=self._cache_ia_params)
 
         right_config = ttk.Frame(config_frame)
         right_config.pack(side='left', fill='y', padx=10)
 
-        ttk.Label(right_config, text="Reference Resistor (Ω):").pack(anchor='w')
-        self.ia_ref_resistor = ttk.Entry(right_config)
-        self.ia_ref_resistor.insert(0, '1000')
-        self.ia_ref_resistor.pack(fill='x', pady=2)
+        self._build_field_grid(
+            right_config,
+            [('Reference Resistor (Ω):', 'ia_ref_resistor_var', '1000')],
+            trace=self._cache_ia_params)
 
-        ttk.Label(right_config, text="Measurement Range:").pack(anchor='w')
+        tk.Label(right_config, text="Measurement Range:").grid(
+            row=1, column=0, sticky='w', pady=2)
         self.ia_range = ttk.Combobox(right_config, values=['Auto', '1Ω-1kΩ', '1kΩ-1MΩ', '1MΩ-1GΩ'])
         self.ia_range.set('Auto')
-        self.ia_range.pack(fill='x', pady=2)
+        self.ia_range.grid(row=1, column=1, sticky='ew', pady=2)
 
         # Results display
         results_frame = ttk.LabelFrame(self.ia_frame, text="Measurement Results")
         results_frame.pack(fill='x', padx=10, pady=5)
 
-        self.ia_impedance_label = ttk.Label(results_frame, text="Impedance: -- Ω")
+        self.ia_impedance_label = ttk.Label(results_frame, text="Impedance: -- Ω",
+                                        style='Readout.TLabel')
         self.ia_impedance_label.pack(anchor='w', padx=10)
 
-        self.ia_phase_label = ttk.Label(results_frame, text="Phase: -- °")
+        self.ia_phase_label = ttk.Label(results_frame, text="Phase: -- °",
+                                        style='Readout.TLabel')
         self.ia_phase_label.pack(anchor='w', padx=10)
 
-        self.ia_resistance_label = ttk.Label(results_frame, text="Resistance: -- Ω")
+        self.ia_resistance_label = ttk.Label(results_frame, text="Resistance: -- Ω",
+                                        style='Readout.TLabel')
         self.ia_resistance_label.pack(anchor='w', padx=10)
 
-        self.ia_reactance_label = ttk.Label(results_frame, text="Reactance: -- Ω")
+        self.ia_reactance_label = ttk.Label(results_frame, text="Reactance: -- Ω",
+                                        style='Readout.TLabel')
         self.ia_reactance_label.pack(anchor='w', padx=10)
 
         # Control buttons
@@ -839,10 +1942,17 @@ class AnalogDiscovery2GUI:
         ttk.Button(control_frame, text="Calibrate", command=self.calibrate_impedance).pack(side='left', padx=5)
 
     def create_voltmeter_tab(self):
-        """Create voltmeter interface"""
+        """Add the voltmeter tab; built on first selection"""
         self.vm_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.vm_frame, text="Voltmeter")
 
+    # Combobox display strings -> numeric values; resolved once per
+    # selection by the write traces in _build_vm_tab
+    _VM_RANGES = {'±25V': 25.0, '±2.5V': 2.5, '±250mV': 0.25}
+    _SAMPLE_RATES = {'1 Hz': 1, '10 Hz': 10, '100 Hz': 100, '1000 Hz': 1000}
+
+    def _build_vm_tab(self):
+        """Create voltmeter interface"""
         # Channel configuration
         config_frame = ttk.LabelFrame(self.vm_frame, text="Voltmeter Configuration")
         config_frame.pack(fill='x', padx=10, pady=5)
@@ -850,23 +1960,154 @@ class AnalogDiscovery2GUI:
         left_config = ttk.Frame(config_frame)
         left_config.pack(side='left', fill='y', padx=10)
 
-        ttk.Label(left_config, text="Channel 1 Range:").pack(anchor='w')
-        self.vm_ch1_range = ttk.Combobox(left_config, values=['±25V', '±2.5V', '±250mV'])
-        self.vm_ch1_range.set('±25V')
-        self.vm_ch1_range.pack(fill='x', pady=2)
-
-        ttk.Label(left_config, text="Channel 2 Range:").pack(anchor='w')
-        self.vm_ch2_range = ttk.Combobox(left_config, values=['±25V', '±2.5V', '±250mV'])
-        self.vm_ch2_range.set('±25V')
-        self.vm_ch2_range.pack(fill='x', pady=2)
+        # Display string -> numeric value, cached into plain attributes by
+        # the write traces so acquisition code never parses combobox text
+        self._vm_ch1_range_v = self._vm_ch2_range_v = 25.0
+        self._vm_rate_hz = 10
+
+        vm_ranges = tuple(self._VM_RANGES)
+        tk.Label(left_config, text="Channel 1 Range:").grid(
+            row=0, column=0, sticky='w', pady=2)
+        self.vm_ch1_range_var = tk.StringVar(value='±25V')
+        self.vm_ch1_range_var.trace_add(
+            'write', lambda *_: setattr(
+                self, '_vm_ch1_range_v',
+                self._VM_RANGES[self.vm_ch1_range_var.get()]))
+        self.vm_ch1_range = ttk.Combobox(left_config, values=vm_ranges,
+                                         textvariable=self.vm_ch1_range_var,
+                                         state='readonly')
+        self.vm_ch1_range.grid(row=0, column=1, sticky='ew', pady=2)
+
+        tk.Label(left_config, text="Channel 2 Range:").grid(
+            row=1, column=0, sticky='w', pady=2)
+        self.vm_ch2_range_var = tk.StringVar(value='±25V')
+        self.vm_ch2_range_var.trace_add(
+            'write', lambda *_: setattr(
+                self, '_vm_ch2_range_v',
+                self._VM_RANGES[self.vm_ch2_range_var.get()]))
+        self.vm_ch2_range = ttk.Combobox(left_config, values=vm_ranges,
+                                         textvariable=self.vm_ch2_range_var,
+                                         state='readonly')
+        self.vm_ch2_range.grid(row=1, column=1, sticky='ew', pady=2)
+        left_config.columnconfigure(1, weight=1)
 
         right_config = ttk.Frame(config_frame)
         right_config.pack(side='left', fill='y', padx=10)
 
-        ttk.Label(right_config, text="Sample Rate:").pack(anchor='w')
-        self.vm_sample_rate = ttk.Combobox(right_config, values=['1 Hz', '10 Hz', '100 Hz', '1000 Hz'])
-        self.vm_sample_rate.set('10 Hz')
-        self.vm_sample_rate.pack(fill='x', pady=2)
+        tk.Label(right_config, text="Sample Rate:").grid(
+            row=0, column=0, sticky='w', pady=2)
+        self.vm_sample_rate_var = tk.StringVar(value='10 Hz')
+        self.vm_sample_rate_var.trace_add(
+            'write', lambda *_: setattr(
+                self, '_vm_rate_hz',
+                self._SAMPLE_RATES[self.vm_sample_rate_var.get()]))
+        self.vm_sample_rate = ttk.Combobox(right_config,
+                                           values=tuple(self._SAMPLE_RATES),
+                                           textvariable=self.vm_sample_rate_var,
+                                           state='readonly')
+        self.vm_sample_rate.grid(row=0, column=1, sticky='ew', pady=2)
+        right_config.columnconfigure(1, weight=1)
+
+        # Control buttons
+        control_frame = ttk.Frame(self.vm_frame)
+        control_frame.pack(fill='x', padx=10, pady=10)
+
+        ttk.Button(control_frame, text="Start", command=self.start_voltmeter).pack(side='left', padx=5)
+        ttk.Button(control_frame, text="Stop", command=self.stop_voltmeter).pack(side='left', padx=5)
+
+        # Live voltage history
+        plot_frame = ttk.LabelFrame(self.vm_frame, text="Voltage History")
+        plot_frame.pack(fill='both', expand=True, padx=10, pady=5)
+
+        self.vm_fig = Figure(figsize=(12, 4), dpi=100)
+        self.vm_fig.set_layout_engine('none')
+        self.vm_ax = self.vm_fig.add_subplot(111)
+        self.vm_ax.set_xlabel('Samples')
+        self.vm_ax.set_ylabel('Voltage (V)')
+        self.vm_ax.grid(True)
+
+        # Fixed window of the last N samples shifted through a ring
+        # buffer; fixed limits keep FuncAnimation's blit path valid
+        n = 200
+        self.vm_buf = np.zeros(n, np.float32)
+        self.vm_line, = self.vm_ax.plot(np.arange(-n + 1, 1), self.vm_buf,
+                                        'b-', linewidth=1)
+        self.vm_ax.set_xlim(-n + 1, 0)
+        self.vm_ax.set_ylim(-5, 5)
+
+        self.vm_canvas = FigureCanvasTkAgg(self.vm_fig, plot_frame)
+        self.vm_canvas.draw()
+        self.vm_canvas.get_tk_widget().pack(fill='both', expand=True)
+        self._tab_figs[str(self.vm_frame)] = (self.vm_fig, self.vm_canvas)
+
+    def start_voltmeter(self):
+        """Drive the live plot with FuncAnimation's internal blitting
+
+        blit=True makes the animation restore a cached background and
+        redraw only the returned artists, so the axes and ticks are never
+        re-rendered at the per-sample rate.
+        """
+        if getattr(self, 'vm_anim', None) is not None:
+            return
+        rate_hz = self._vm_rate_hz
+        self.vm_anim = FuncAnimation(self.vm_fig, self._vm_step,
+                                     interval=max(1000 // rate_hz, 1),
+                                     blit=True, cache_frame_data=False)
+        self.vm_canvas.draw_idle()
+
+    def _vm_step(self, frame):
+        """Animation callback: shift the ring buffer and update the line"""
+        v1, _ = self.read_dc_voltages()
+        self.vm_buf[:-1] = self.vm_buf[1:]
+        self.vm_buf[-1] = v1
+        self.vm_line.set_ydata(self.vm_buf)
+        return (self.vm_line,)
+
+    def stop_voltmeter(self):
+        """Stop the live plot animation"""
+        if getattr(self, 'vm_anim', None) is not None:
+            self.vm_anim.event_source.stop()
+            self.vm_anim = None
+
+    def create_data_logger_tab(self):
+        """Add the data logger tab; built on first selection"""
+        self.dl_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.dl_frame, text="Data Logger")
+
+    def _build_dl_tab(self):
+        """Create data logger interface"""
+        file_frame = ttk.LabelFrame(self.dl_frame, text="Log File")
+        file_frame.pack(fill='x', padx=10, pady=5)
+
+        self.dl_filename = ttk.Entry(file_frame)
+        self.dl_filename.insert(0, "ad2_log.csv")
+        self.dl_filename.pack(side='left', fill='x', expand=True, padx=5, pady=5)
+
+        ttk.Button(file_frame, text="Browse", command=self.browse_log_file).pack(side='left', padx=5)
+        ttk.Button(file_frame, text="View", command=self.view_log_file).pack(side='left', padx=5)
+
+        control_frame = ttk.Frame(self.dl_frame)
+        control_frame.pack(fill='x', padx=10, pady=10)
+
+        ttk.Button(control_frame, text="Start Logging", command=self.start_data_logger).pack(side='left', padx=5)
+        ttk.Button(control_frame, text="Stop Logging", command=self.stop_data_logger).pack(side='left', padx=5)
+
+    def create_script_editor_tab(self):
+        """Add the script editor tab; built on first selection"""
+        self.se_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.se_frame, text="Script Editor")
+
+    def _build_se_tab(self):
+        """Create script editor interface"""
+        editor_frame = ttk.LabelFrame(self.se_frame, text="Script")
+        editor_frame.pack(fill='both', expand=True, padx=10, pady=5)
+
+        self.script_text = tk.Text(editor_frame, wrap='none')
+        scrollbar = ttk.Scrollbar(editor_frame, orient="vertical", command=self.script_text.yview)
+        self.script_text.configure(yscrollcommand=scrollbar.set)
+
+        self.script_text.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
 if __name__ == "__main__":
     root = tk.Tk()
     app = AnalogDiscovery2GUI(root)
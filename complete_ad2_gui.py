@@ -6,12 +6,112 @@ from matplotlib.figure import Figure
 import numpy as np
 import threading
 import time
+import math
+from collections import deque
 from ctypes import *
 import sys
 import os
 import csv
 from datetime import datetime
 
+try:
+    # scipy's pocketfft beats numpy on the 4096-point sweep captures;
+    # fall back to numpy so scipy stays an optional dependency
+    from scipy import fft as _sp_fft
+except ImportError:
+    _sp_fft = None
+
+try:
+    # Optional: with numba installed the sweep extracts each tone with a
+    # jitted correlator instead of an FFT (see _iq_pair below)
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
+if _njit is not None:
+    @_njit(cache=True, fastmath=True)
+    def _iq_pair(ref, resp, w):
+        """In-phase/quadrature sums of both channels at one tone.
+
+        w is the tone in radians per sample. One pass over the capture
+        with scalar accumulators: no cos/sin temporaries, no FFT, and
+        the compiled loop runs without the GIL.
+        """
+        ref_i = ref_q = resp_i = resp_q = 0.0
+        ph = 0.0
+        for k in range(ref.size):
+            c = math.cos(ph)
+            s = math.sin(ph)
+            ref_i += ref[k] * c
+            ref_q -= ref[k] * s
+            resp_i += resp[k] * c
+            resp_q -= resp[k] * s
+            ph += w
+        return ref_i, ref_q, resp_i, resp_q
+
+
+# One period of each custom FG shape as a function of phase in [0, 1);
+# all vectorized, so generation runs at memcpy-like speed
+_ARB_SHAPES = {
+    'Sine': lambda t: np.sin(2 * np.pi * t),
+    'Square': lambda t: np.sign(np.sin(2 * np.pi * t)),
+    'Triangle': lambda t: 2 * np.abs(2 * (t - 0.5)) - 1,
+    'Sawtooth': lambda t: 2 * t - 1,
+}
+_arb_cache = {}
+
+# Combobox display string -> device value tables, built once at import;
+# apply paths look values up instead of rebuilding dict literals or
+# walking if/elif chains on every call
+_FG_FUNC = {"Sine": 1, "Square": 2, "Triangle": 3, "DC": 8, "Sawtooth": 4, "Noise": 5}
+_DL_INTERVALS = {"1s": 1, "10s": 10, "1min": 60, "10min": 600, "1hour": 3600}
+_TRIG_CHANNEL = {"Ch1": 0, "Ch2": 1, "External": 1}
+
+
+def _generate_waveform(shape, n):
+    """Return one period of `shape` as n float64 samples in [-1, 1].
+
+    Deterministic shapes are cached per (shape, n) so re-applying the
+    same settings is allocation-free; Noise is freshly drawn each call.
+    """
+    if shape == 'Noise':
+        y = np.random.default_rng().standard_normal(n)
+        np.clip(y / 3.0, -1.0, 1.0, out=y)
+        return y
+    key = (shape, n)
+    y = _arb_cache.get(key)
+    if y is None:
+        y = _arb_cache[key] = _ARB_SHAPES[shape](np.arange(n) / n)
+    return y
+
+
+def _minmax_decimate(x, y, max_points=2000):
+    """Reduce (x, y) to at most ~2*max_points samples for plotting.
+
+    Keeps the per-bucket minimum and maximum so peaks and glitches
+    survive the reduction; rendering cost then tracks the pixel width
+    of the plot instead of the capture buffer size.
+    """
+    n = len(y)
+    if n <= 2 * max_points:
+        return x, y
+    bucket = n // max_points
+    m = n // bucket
+    yb = np.asarray(y[:m * bucket]).reshape(m, bucket)
+    xb = np.asarray(x[:m * bucket]).reshape(m, bucket)
+    lo = yb.argmin(axis=1)
+    hi = yb.argmax(axis=1)
+    rows = np.arange(m)
+    first = np.minimum(lo, hi)
+    second = np.maximum(lo, hi)
+    out_x = np.empty(2 * m, dtype=np.asarray(x).dtype)
+    out_y = np.empty(2 * m, dtype=np.asarray(y).dtype)
+    out_x[0::2] = xb[rows, first]
+    out_x[1::2] = xb[rows, second]
+    out_y[0::2] = yb[rows, first]
+    out_y[1::2] = yb[rows, second]
+    return out_x, out_y
+
 
 class AnalogDiscovery2GUI:
     def __init__(self, root):
@@ -23,11 +123,19 @@ class AnalogDiscovery2GUI:
         self.status_label = Label(self.root, text="Initializing...")
         self.status_label.pack()
 
-        # Device handle
+        # Device handle, shared between the Tk thread and the worker
+        # threads; every group of DWF calls takes this lock so config
+        # writes and captures never interleave mid-sequence
         self.hdwf = c_int()
+        self._dev_lock = threading.Lock()
         self.is_connected = False
         self.is_acquiring = False
 
+        # Hand-off queue between the acquisition thread and Tk. Scope
+        # frames are droppable: if the GUI falls behind, old frames age
+        # out of the deque instead of piling up as root.after callbacks
+        self.scope_ring = deque(maxlen=4)
+
         # Additional state variables
         self.data_logger_running = False
         self.spectrum_running = False
@@ -91,6 +199,25 @@ class AnalogDiscovery2GUI:
         self.create_network_analyzer_tab()
         self.create_settings_tab()
 
+    def _cached_float_var(self, initial, attr):
+        """StringVar whose parsed float is cached on self at write time.
+
+        Hot paths (the acquisition thread runs every frame, apply
+        handlers touch many fields) then read a plain Python float
+        instead of a Tcl string plus float(); while the user is
+        mid-edit with invalid text the last valid value stays cached.
+        """
+        var = tk.StringVar(value=initial)
+        setattr(self, attr, float(initial))
+
+        def _update(*_):
+            try:
+                setattr(self, attr, float(var.get()))
+            except ValueError:
+                pass
+        var.trace_add('write', _update)
+        return var
+
     def create_main_tab(self):
         """Create main oscilloscope and function generator tab"""
         main_frame = ttk.Frame(self.notebook)
@@ -123,43 +250,54 @@ class AnalogDiscovery2GUI:
 
         # Channel controls
         ttk.Label(osc_control_frame, text="Channel 1:").grid(row=0, column=0, sticky=tk.W, padx=5)
+        self._ch1_on = True
         self.ch1_var = tk.BooleanVar(value=True)
+        self.ch1_var.trace_add(
+            'write', lambda *_: setattr(self, '_ch1_on', self.ch1_var.get()))
         ttk.Checkbutton(osc_control_frame, text="Enable", variable=self.ch1_var).grid(row=0, column=1, padx=5)
 
         ttk.Label(osc_control_frame, text="Range (V):").grid(row=0, column=2, padx=5)
         self.ch1_range = ttk.Combobox(osc_control_frame, values=["0.5", "1", "2", "5", "10", "25"], state="readonly",
-                                      width=8)
-        self.ch1_range.set("5")
+                                      width=8,
+                                      textvariable=self._cached_float_var("5", '_ch1_range_v'))
         self.ch1_range.grid(row=0, column=3, padx=5)
 
         ttk.Label(osc_control_frame, text="Channel 2:").grid(row=1, column=0, sticky=tk.W, padx=5)
+        self._ch2_on = True
         self.ch2_var = tk.BooleanVar(value=True)
+        self.ch2_var.trace_add(
+            'write', lambda *_: setattr(self, '_ch2_on', self.ch2_var.get()))
         ttk.Checkbutton(osc_control_frame, text="Enable", variable=self.ch2_var).grid(row=1, column=1, padx=5)
 
         ttk.Label(osc_control_frame, text="Range (V):").grid(row=1, column=2, padx=5)
         self.ch2_range = ttk.Combobox(osc_control_frame, values=["0.5", "1", "2", "5", "10", "25"], state="readonly",
-                                      width=8)
-        self.ch2_range.set("5")
+                                      width=8,
+                                      textvariable=self._cached_float_var("5", '_ch2_range_v'))
         self.ch2_range.grid(row=1, column=3, padx=5)
 
         # Timebase control
         ttk.Label(osc_control_frame, text="Timebase (s/div):").grid(row=0, column=4, padx=5)
         self.timebase = ttk.Combobox(osc_control_frame,
                                      values=["1e-6", "2e-6", "5e-6", "1e-5", "2e-5", "5e-5", "1e-4", "2e-4", "5e-4",
-                                             "1e-3", "2e-3", "5e-3"], state="readonly", width=10)
-        self.timebase.set("1e-4")
+                                             "1e-3", "2e-3", "5e-3"], state="readonly", width=10,
+                                     textvariable=self._cached_float_var("1e-4", '_timebase_s'))
         self.timebase.grid(row=0, column=5, padx=5)
 
         # Trigger controls
         ttk.Label(osc_control_frame, text="Trigger:").grid(row=0, column=6, padx=5)
-        self.trigger_source = ttk.Combobox(osc_control_frame, values=["None", "Ch1", "Ch2", "External"], 
-                                          state="readonly", width=8)
-        self.trigger_source.set("Ch1")
+        self._trigger_source_s = "Ch1"
+        self.trigger_source_var = tk.StringVar(value=self._trigger_source_s)
+        self.trigger_source_var.trace_add(
+            'write',
+            lambda *_: setattr(self, '_trigger_source_s', self.trigger_source_var.get()))
+        self.trigger_source = ttk.Combobox(osc_control_frame, values=["None", "Ch1", "Ch2", "External"],
+                                          state="readonly", width=8,
+                                          textvariable=self.trigger_source_var)
         self.trigger_source.grid(row=0, column=7, padx=5)
 
         ttk.Label(osc_control_frame, text="Level (V):").grid(row=1, column=6, padx=5)
-        self.trigger_level = ttk.Entry(osc_control_frame, width=8)
-        self.trigger_level.insert(0, "0")
+        self.trigger_level = ttk.Entry(osc_control_frame, width=8,
+                                       textvariable=self._cached_float_var("0", '_trigger_level_v'))
         self.trigger_level.grid(row=1, column=7, padx=5)
 
         # Acquisition controls
@@ -190,6 +328,13 @@ class AnalogDiscovery2GUI:
         self.ax.set_ylabel('Voltage (V)')
         self.ax.set_title('Oscilloscope')
         self.ax.grid(True)
+        # Cache the axes background after every full draw (including
+        # resizes); frame updates then blit just the trace lines over it
+        self._scope_bg = None
+        self.canvas.mpl_connect(
+            'draw_event',
+            lambda event: setattr(self, '_scope_bg',
+                                  self.canvas.copy_from_bbox(self.ax.bbox)))
         self.canvas.draw()
 
         # Function generator frame
@@ -214,20 +359,20 @@ class AnalogDiscovery2GUI:
         self.fg1_func.grid(row=0, column=3, padx=5)
 
         ttk.Label(funcgen_control_frame, text="Freq (Hz):").grid(row=0, column=4, padx=5)
-        self.fg1_freq = ttk.Entry(funcgen_control_frame, width=10)
-        self.fg1_freq.insert(0, "1000")
+        self.fg1_freq = ttk.Entry(funcgen_control_frame, width=10,
+                                  textvariable=self._cached_float_var("1000", '_fg1_freq_v'))
         self.fg1_freq.bind("<Return>", lambda e: self.update_function_generator())
         self.fg1_freq.grid(row=0, column=5, padx=5)
 
         ttk.Label(funcgen_control_frame, text="Amp (V):").grid(row=0, column=6, padx=5)
-        self.fg1_amp = ttk.Entry(funcgen_control_frame, width=10)
-        self.fg1_amp.insert(0, "1")
+        self.fg1_amp = ttk.Entry(funcgen_control_frame, width=10,
+                                 textvariable=self._cached_float_var("1", '_fg1_amp_v'))
         self.fg1_amp.bind("<Return>", lambda e: self.update_function_generator())
         self.fg1_amp.grid(row=0, column=7, padx=5)
 
         ttk.Label(funcgen_control_frame, text="Offset (V):").grid(row=0, column=8, padx=5)
-        self.fg1_offset = ttk.Entry(funcgen_control_frame, width=8)
-        self.fg1_offset.insert(0, "0")
+        self.fg1_offset = ttk.Entry(funcgen_control_frame, width=8,
+                                    textvariable=self._cached_float_var("0", '_fg1_offset_v'))
         self.fg1_offset.bind("<Return>", lambda e: self.update_function_generator())
         self.fg1_offset.grid(row=0, column=9, padx=5)
 
@@ -245,20 +390,20 @@ class AnalogDiscovery2GUI:
         self.fg2_func.grid(row=1, column=3, padx=5)
 
         ttk.Label(funcgen_control_frame, text="Freq (Hz):").grid(row=1, column=4, padx=5)
-        self.fg2_freq = ttk.Entry(funcgen_control_frame, width=10)
-        self.fg2_freq.insert(0, "2000")
+        self.fg2_freq = ttk.Entry(funcgen_control_frame, width=10,
+                                  textvariable=self._cached_float_var("2000", '_fg2_freq_v'))
         self.fg2_freq.bind("<Return>", lambda e: self.update_function_generator())
         self.fg2_freq.grid(row=1, column=5, padx=5)
 
         ttk.Label(funcgen_control_frame, text="Amp (V):").grid(row=1, column=6, padx=5)
-        self.fg2_amp = ttk.Entry(funcgen_control_frame, width=10)
-        self.fg2_amp.insert(0, "1")
+        self.fg2_amp = ttk.Entry(funcgen_control_frame, width=10,
+                                 textvariable=self._cached_float_var("1", '_fg2_amp_v'))
         self.fg2_amp.bind("<Return>", lambda e: self.update_function_generator())
         self.fg2_amp.grid(row=1, column=7, padx=5)
 
         ttk.Label(funcgen_control_frame, text="Offset (V):").grid(row=1, column=8, padx=5)
-        self.fg2_offset = ttk.Entry(funcgen_control_frame, width=8)
-        self.fg2_offset.insert(0, "0")
+        self.fg2_offset = ttk.Entry(funcgen_control_frame, width=8,
+                                    textvariable=self._cached_float_var("0", '_fg2_offset_v'))
         self.fg2_offset.bind("<Return>", lambda e: self.update_function_generator())
         self.fg2_offset.grid(row=1, column=9, padx=5)
 
@@ -377,65 +522,77 @@ class AnalogDiscovery2GUI:
             # Perform calibration in separate thread to prevent GUI freezing
             def calibration_thread():
                 try:
-                    # Reset oscilloscope to default state
-                    self.dwf.FDwfAnalogInReset(self.hdwf)
+                    # Reset oscilloscope to default state. All DWF call
+                    # groups run under the device lock so the acquisition
+                    # thread can't interleave; sleeps stay outside it
+                    with self._dev_lock:
+                        self.dwf.FDwfAnalogInReset(self.hdwf)
                     time.sleep(0.1)
-                    
-                    # Set up calibration parameters
-                    # Channel 1 calibration
-                    self.dwf.FDwfAnalogInChannelEnableSet(self.hdwf, c_int(0), c_bool(True))
-                    self.dwf.FDwfAnalogInChannelRangeSet(self.hdwf, c_int(0), c_double(5.0))  # 5V range
-                    self.dwf.FDwfAnalogInChannelOffsetSet(self.hdwf, c_int(0), c_double(0.0))  # 0V offset
-                    
-                    # Channel 2 calibration
-                    self.dwf.FDwfAnalogInChannelEnableSet(self.hdwf, c_int(1), c_bool(True))
-                    self.dwf.FDwfAnalogInChannelRangeSet(self.hdwf, c_int(1), c_double(5.0))  # 5V range
-                    self.dwf.FDwfAnalogInChannelOffsetSet(self.hdwf, c_int(1), c_double(0.0))  # 0V offset
-                    
-                    # Set acquisition parameters
-                    self.dwf.FDwfAnalogInFrequencySet(self.hdwf, c_double(1000000.0))  # 1MHz sample rate
-                    self.dwf.FDwfAnalogInBufferSizeSet(self.hdwf, c_int(1024))
-                    
+
+                    with self._dev_lock:
+                        # Set up calibration parameters
+                        # Channel 1 calibration
+                        self.dwf.FDwfAnalogInChannelEnableSet(self.hdwf, c_int(0), c_bool(True))
+                        self.dwf.FDwfAnalogInChannelRangeSet(self.hdwf, c_int(0), c_double(5.0))  # 5V range
+                        self.dwf.FDwfAnalogInChannelOffsetSet(self.hdwf, c_int(0), c_double(0.0))  # 0V offset
+
+                        # Channel 2 calibration
+                        self.dwf.FDwfAnalogInChannelEnableSet(self.hdwf, c_int(1), c_bool(True))
+                        self.dwf.FDwfAnalogInChannelRangeSet(self.hdwf, c_int(1), c_double(5.0))  # 5V range
+                        self.dwf.FDwfAnalogInChannelOffsetSet(self.hdwf, c_int(1), c_double(0.0))  # 0V offset
+
+                        # Set acquisition parameters
+                        self.dwf.FDwfAnalogInFrequencySet(self.hdwf, c_double(1000000.0))  # 1MHz sample rate
+                        self.dwf.FDwfAnalogInBufferSizeSet(self.hdwf, c_int(1024))
+
                     # Perform auto-calibration sequence
                     self.update_progress("Performing offset calibration...")
-                    
+
                     # Offset calibration - ground both inputs
                     for channel in range(2):
                         # Set coupling to DC
-                        self.dwf.FDwfAnalogInChannelCouplingSet(self.hdwf, c_int(channel), c_int(0))  # DC coupling
-                        
+                        with self._dev_lock:
+                            self.dwf.FDwfAnalogInChannelCouplingSet(self.hdwf, c_int(channel), c_int(0))  # DC coupling
+
                         # Measure offset at different ranges
                         ranges = [0.5, 1.0, 2.0, 5.0]
                         for voltage_range in ranges:
-                            self.dwf.FDwfAnalogInChannelRangeSet(self.hdwf, c_int(channel), c_double(voltage_range))
+                            with self._dev_lock:
+                                self.dwf.FDwfAnalogInChannelRangeSet(self.hdwf, c_int(channel), c_double(voltage_range))
                             time.sleep(0.05)
-                            
+
                             # Start acquisition
-                            self.dwf.FDwfAnalogInConfigure(self.hdwf, c_bool(False), c_bool(True))
-                            
-                            # Wait for acquisition to complete
+                            with self._dev_lock:
+                                self.dwf.FDwfAnalogInConfigure(self.hdwf, c_bool(False), c_bool(True))
+
+                            # Wait for acquisition to complete; lock per
+                            # status call, not across the wait
                             sts = c_byte()
                             while True:
-                                self.dwf.FDwfAnalogInStatus(self.hdwf, c_int(1), byref(sts))
+                                with self._dev_lock:
+                                    self.dwf.FDwfAnalogInStatus(self.hdwf, c_int(1), byref(sts))
                                 if sts.value == 2:  # DwfStateDone
                                     break
                                 time.sleep(0.01)
-                    
+
                     self.update_progress("Performing gain calibration...")
-                    
+
                     # Gain calibration - use internal reference if available
                     for channel in range(2):
                         ranges = [0.5, 1.0, 2.0, 5.0]
                         for voltage_range in ranges:
-                            self.dwf.FDwfAnalogInChannelRangeSet(self.hdwf, c_int(channel), c_double(voltage_range))
+                            with self._dev_lock:
+                                self.dwf.FDwfAnalogInChannelRangeSet(self.hdwf, c_int(channel), c_double(voltage_range))
                             time.sleep(0.05)
-                            
+
                             # Perform measurement
-                            self.dwf.FDwfAnalogInConfigure(self.hdwf, c_bool(False), c_bool(True))
-                            
+                            with self._dev_lock:
+                                self.dwf.FDwfAnalogInConfigure(self.hdwf, c_bool(False), c_bool(True))
+
                             sts = c_byte()
                             while True:
-                                self.dwf.FDwfAnalogInStatus(self.hdwf, c_int(1), byref(sts))
+                                with self._dev_lock:
+                                    self.dwf.FDwfAnalogInStatus(self.hdwf, c_int(1), byref(sts))
                                 if sts.value == 2:
                                     break
                                 time.sleep(0.01)
@@ -574,73 +731,79 @@ class AnalogDiscovery2GUI:
                 try:
                     self.update_progress("Stopping all instruments...")
                     
-                    # Stop and reset all instruments
-                    # Reset Oscilloscope
-                    self.dwf.FDwfAnalogInReset(self.hdwf)
-                    
-                    # Reset Function Generator
-                    self.dwf.FDwfAnalogOutReset(self.hdwf, c_int(-1))  # Reset all channels
-                    
-                    # Reset Digital I/O
-                    self.dwf.FDwfDigitalIOReset(self.hdwf)
-                    
-                    # Reset Digital In (Logic Analyzer)
-                    self.dwf.FDwfDigitalInReset(self.hdwf)
-                    
-                    # Reset Digital Out (Pattern Generator)
-                    self.dwf.FDwfDigitalOutReset(self.hdwf)
-                    
-                    # Reset Analog I/O (Power supplies, etc.)
-                    self.dwf.FDwfAnalogIOReset(self.hdwf)
-                    
+                    # Stop and reset all instruments. Each DWF call group
+                    # runs under the device lock so a live acquisition or
+                    # monitor thread can't interleave with the reset
+                    with self._dev_lock:
+                        # Reset Oscilloscope
+                        self.dwf.FDwfAnalogInReset(self.hdwf)
+
+                        # Reset Function Generator
+                        self.dwf.FDwfAnalogOutReset(self.hdwf, c_int(-1))  # Reset all channels
+
+                        # Reset Digital I/O
+                        self.dwf.FDwfDigitalIOReset(self.hdwf)
+
+                        # Reset Digital In (Logic Analyzer)
+                        self.dwf.FDwfDigitalInReset(self.hdwf)
+
+                        # Reset Digital Out (Pattern Generator)
+                        self.dwf.FDwfDigitalOutReset(self.hdwf)
+
+                        # Reset Analog I/O (Power supplies, etc.)
+                        self.dwf.FDwfAnalogIOReset(self.hdwf)
+
                     time.sleep(0.5)
                     
                     self.update_progress("Resetting device configuration...")
                     
                     # Set all channels to safe defaults
-                    # Oscilloscope defaults
-                    for channel in range(2):
-                        self.dwf.FDwfAnalogInChannelEnableSet(self.hdwf, c_int(channel), c_bool(False))
-                        self.dwf.FDwfAnalogInChannelRangeSet(self.hdwf, c_int(channel), c_double(5.0))
-                        self.dwf.FDwfAnalogInChannelOffsetSet(self.hdwf, c_int(channel), c_double(0.0))
-                        self.dwf.FDwfAnalogInChannelCouplingSet(self.hdwf, c_int(channel), c_int(0))  # DC coupling
-                    
-                    # Function generator defaults
-                    for channel in range(2):
-                        self.dwf.FDwfAnalogOutNodeEnableSet(self.hdwf, c_int(channel), c_int(0), c_bool(False))
-                        self.dwf.FDwfAnalogOutNodeAmplitudeSet(self.hdwf, c_int(channel), c_int(0), c_double(1.0))
-                        self.dwf.FDwfAnalogOutNodeOffsetSet(self.hdwf, c_int(channel), c_int(0), c_double(0.0))
-                        self.dwf.FDwfAnalogOutNodeFrequencySet(self.hdwf, c_int(channel), c_int(0), c_double(1000.0))
-                        self.dwf.FDwfAnalogOutNodeFunctionSet(self.hdwf, c_int(channel), c_int(0), c_int(1))  # Sine
-                    
-                    # Power supply defaults (if available)
-                    try:
-                        # Positive supply off
-                        self.dwf.FDwfAnalogIOChannelNodeSet(self.hdwf, c_int(0), c_int(0), c_double(0))  # Disable
-                        self.dwf.FDwfAnalogIOChannelNodeSet(self.hdwf, c_int(0), c_int(1), c_double(3.3))  # 3.3V
-                        
-                        # Negative supply off
-                        self.dwf.FDwfAnalogIOChannelNodeSet(self.hdwf, c_int(1), c_int(0), c_double(0))  # Disable
-                        self.dwf.FDwfAnalogIOChannelNodeSet(self.hdwf, c_int(1), c_int(1), c_double(-3.3))  # -3.3V
-                        
-                        self.dwf.FDwfAnalogIOEnableSet(self.hdwf, c_bool(False))
-                    except:
-                        pass  # Some devices may not have power supplies
-                    
-                    # Digital I/O defaults
-                    self.dwf.FDwfDigitalIOOutputEnableSet(self.hdwf, c_int(0))  # All pins as inputs
-                    
+                    with self._dev_lock:
+                        # Oscilloscope defaults
+                        for channel in range(2):
+                            self.dwf.FDwfAnalogInChannelEnableSet(self.hdwf, c_int(channel), c_bool(False))
+                            self.dwf.FDwfAnalogInChannelRangeSet(self.hdwf, c_int(channel), c_double(5.0))
+                            self.dwf.FDwfAnalogInChannelOffsetSet(self.hdwf, c_int(channel), c_double(0.0))
+                            self.dwf.FDwfAnalogInChannelCouplingSet(self.hdwf, c_int(channel), c_int(0))  # DC coupling
+
+                        # Function generator defaults
+                        for channel in range(2):
+                            self.dwf.FDwfAnalogOutNodeEnableSet(self.hdwf, c_int(channel), c_int(0), c_bool(False))
+                            self.dwf.FDwfAnalogOutNodeAmplitudeSet(self.hdwf, c_int(channel), c_int(0), c_double(1.0))
+                            self.dwf.FDwfAnalogOutNodeOffsetSet(self.hdwf, c_int(channel), c_int(0), c_double(0.0))
+                            self.dwf.FDwfAnalogOutNodeFrequencySet(self.hdwf, c_int(channel), c_int(0), c_double(1000.0))
+                            self.dwf.FDwfAnalogOutNodeFunctionSet(self.hdwf, c_int(channel), c_int(0), c_int(1))  # Sine
+
+                        # Power supply defaults (if available)
+                        try:
+                            # Positive supply off
+                            self.dwf.FDwfAnalogIOChannelNodeSet(self.hdwf, c_int(0), c_int(0), c_double(0))  # Disable
+                            self.dwf.FDwfAnalogIOChannelNodeSet(self.hdwf, c_int(0), c_int(1), c_double(3.3))  # 3.3V
+
+                            # Negative supply off
+                            self.dwf.FDwfAnalogIOChannelNodeSet(self.hdwf, c_int(1), c_int(0), c_double(0))  # Disable
+                            self.dwf.FDwfAnalogIOChannelNodeSet(self.hdwf, c_int(1), c_int(1), c_double(-3.3))  # -3.3V
+
+                            self.dwf.FDwfAnalogIOEnableSet(self.hdwf, c_bool(False))
+                        except:
+                            pass  # Some devices may not have power supplies
+
+                        # Digital I/O defaults
+                        self.dwf.FDwfDigitalIOOutputEnableSet(self.hdwf, c_int(0))  # All pins as inputs
+
                     time.sleep(0.5)
                     
                     self.update_progress("Performing system reset...")
                     
                     # Perform low-level device reset
-                    self.dwf.FDwfDeviceReset(self.hdwf)
+                    with self._dev_lock:
+                        self.dwf.FDwfDeviceReset(self.hdwf)
                     time.sleep(1.0)
-                    
+
                     # Re-initialize basic parameters
-                    self.dwf.FDwfAnalogInFrequencySet(self.hdwf, c_double(20000000.0))  # 20MHz default
-                    self.dwf.FDwfAnalogInBufferSizeSet(self.hdwf, c_int(8192))  # Default buffer size
+                    with self._dev_lock:
+                        self.dwf.FDwfAnalogInFrequencySet(self.hdwf, c_double(20000000.0))  # 20MHz default
+                        self.dwf.FDwfAnalogInBufferSizeSet(self.hdwf, c_int(8192))  # Default buffer size
                     
                     self.update_progress("Reset complete!")
                     time.sleep(0.5)
@@ -757,6 +920,12 @@ class AnalogDiscovery2GUI:
         self.sa_ax.set_ylabel('Magnitude (dB)')
         self.sa_ax.set_title('Spectrum Analyzer')
         self.sa_ax.grid(True)
+        self.sa_ax.set_ylim(-80, 20)
+        self._sa_bg = None
+        self.sa_canvas.mpl_connect(
+            'draw_event',
+            lambda event: setattr(self, '_sa_bg',
+                                  self.sa_canvas.copy_from_bbox(self.sa_ax.bbox)))
         self.sa_canvas.draw()
     def start_network_analyzer(self):
         """Start network analyzer with frequency sweep"""
@@ -794,53 +963,72 @@ class AnalogDiscovery2GUI:
         self.na_start_btn.config(state=tk.DISABLED)
         self.na_stop_btn.config(state=tk.NORMAL)
 
-        # Initialize result arrays
-        self.na_frequencies = []
-        self.na_magnitude = []
-        self.na_phase = []
-        
+        # Preallocate the result arrays as one column per quantity with a
+        # fill cursor; appending to three Python lists per sweep point
+        # reallocated and boxed every sample, and plotting needed a
+        # list->array conversion each refresh
+        self.na_frequencies = np.logspace(np.log10(start_freq), np.log10(stop_freq), num_points)
+        self.na_magnitude = np.empty(num_points)
+        self.na_phase = np.empty(num_points)
+        self._na_count = 0
+
         # Show progress window
         self.show_na_progress("Network Analysis in Progress...")
-    def network_analysis_thread(self):
+
+        # Start analysis in separate thread
+        self.na_thread = threading.Thread(
+            target=self.network_analysis_thread,
+            args=(start_freq, stop_freq, num_points, amplitude),
+            daemon=True)
+        self.na_thread.start()
+
+    def network_analysis_thread(self, start_freq, stop_freq, num_points, amplitude):
         try:
             self.update_na_progress("Initializing instruments...")
             
-            # Reset and configure function generator (stimulus)
-            self.dwf.FDwfAnalogOutReset(self.hdwf, c_int(0))  # Reset channel 1
-            self.dwf.FDwfAnalogOutNodeEnableSet(self.hdwf, c_int(0), c_int(0), c_bool(True))
-            self.dwf.FDwfAnalogOutNodeFunctionSet(self.hdwf, c_int(0), c_int(0), c_int(1))  # Sine wave
-            self.dwf.FDwfAnalogOutNodeAmplitudeSet(self.hdwf, c_int(0), c_int(0), c_double(amplitude))
-            self.dwf.FDwfAnalogOutNodeOffsetSet(self.hdwf, c_int(0), c_int(0), c_double(0.0))
-            
-            # Reset and configure oscilloscope (measurement)
-            self.dwf.FDwfAnalogInReset(self.hdwf)
-            
-            # Configure oscilloscope channels
-            # Channel 1: Reference (stimulus monitoring)
-            self.dwf.FDwfAnalogInChannelEnableSet(self.hdwf, c_int(0), c_bool(True))
-            self.dwf.FDwfAnalogInChannelRangeSet(self.hdwf, c_int(0), c_double(amplitude * 2))
-            self.dwf.FDwfAnalogInChannelOffsetSet(self.hdwf, c_int(0), c_double(0.0))
-            
-            # Channel 2: Response measurement
-            self.dwf.FDwfAnalogInChannelEnableSet(self.hdwf, c_int(1), c_bool(True))
-            self.dwf.FDwfAnalogInChannelRangeSet(self.hdwf, c_int(1), c_double(amplitude * 2))
-            self.dwf.FDwfAnalogInChannelOffsetSet(self.hdwf, c_int(1), c_double(0.0))
-            
             # Set acquisition parameters
             sample_rate = max(stop_freq * 10, 1000000)  # At least 10x highest frequency, min 1MHz
             buffer_size = 4096
+
+            # One instrument setup, under the device lock so the scope
+            # worker and GUI applies can't interleave their own calls
+            with self._dev_lock:
+                # Reset and configure function generator (stimulus)
+                self.dwf.FDwfAnalogOutReset(self.hdwf, c_int(0))  # Reset channel 1
+                self.dwf.FDwfAnalogOutNodeEnableSet(self.hdwf, c_int(0), c_int(0), c_bool(True))
+                self.dwf.FDwfAnalogOutNodeFunctionSet(self.hdwf, c_int(0), c_int(0), c_int(1))  # Sine wave
+                self.dwf.FDwfAnalogOutNodeAmplitudeSet(self.hdwf, c_int(0), c_int(0), c_double(amplitude))
+                self.dwf.FDwfAnalogOutNodeOffsetSet(self.hdwf, c_int(0), c_int(0), c_double(0.0))
+
+                # Reset and configure oscilloscope (measurement)
+                self.dwf.FDwfAnalogInReset(self.hdwf)
+
+                # Configure oscilloscope channels
+                # Channel 1: Reference (stimulus monitoring)
+                self.dwf.FDwfAnalogInChannelEnableSet(self.hdwf, c_int(0), c_bool(True))
+                self.dwf.FDwfAnalogInChannelRangeSet(self.hdwf, c_int(0), c_double(amplitude * 2))
+                self.dwf.FDwfAnalogInChannelOffsetSet(self.hdwf, c_int(0), c_double(0.0))
+
+                # Channel 2: Response measurement
+                self.dwf.FDwfAnalogInChannelEnableSet(self.hdwf, c_int(1), c_bool(True))
+                self.dwf.FDwfAnalogInChannelRangeSet(self.hdwf, c_int(1), c_double(amplitude * 2))
+                self.dwf.FDwfAnalogInChannelOffsetSet(self.hdwf, c_int(1), c_double(0.0))
+
+                self.dwf.FDwfAnalogInFrequencySet(self.hdwf, c_double(sample_rate))
+                self.dwf.FDwfAnalogInBufferSizeSet(self.hdwf, c_int(buffer_size))
+                self.dwf.FDwfAnalogInAcquisitionModeSet(self.hdwf, c_int(0))  # Single acquisition
             
-            self.dwf.FDwfAnalogInFrequencySet(self.hdwf, c_double(sample_rate))
-            self.dwf.FDwfAnalogInBufferSizeSet(self.hdwf, c_int(buffer_size))
-            self.dwf.FDwfAnalogInAcquisitionModeSet(self.hdwf, c_int(0))  # Single acquisition
-            
-            # Generate frequency points (logarithmic spacing for better coverage)
-            frequencies = np.logspace(np.log10(start_freq), np.log10(stop_freq), num_points)
-            
-            self.na_frequencies = []
-            self.na_magnitude = []
-            self.na_phase = []
-            
+            # Frequency points were preallocated by start_network_analyzer
+            frequencies = self.na_frequencies
+
+            # One pair of capture buffers for the whole sweep; per-point
+            # ctypes allocation plus np.array() copies churned ~64 KiB
+            # per measurement
+            buffer_ch1 = (c_double * buffer_size)()
+            buffer_ch2 = (c_double * buffer_size)()
+            ref_data = np.ctypeslib.as_array(buffer_ch1)
+            response_data = np.ctypeslib.as_array(buffer_ch2)
+
             # Perform frequency sweep
             for i, freq in enumerate(frequencies):
                 if not self.network_running:  # Check for stop condition
@@ -849,66 +1037,69 @@ class AnalogDiscovery2GUI:
                 progress = (i + 1) / len(frequencies) * 100
                 self.update_na_progress(f"Measuring at {freq:.1f} Hz ({i+1}/{len(frequencies)}) - {progress:.1f}%")
                 
-                # Set function generator frequency
-                self.dwf.FDwfAnalogOutNodeFrequencySet(self.hdwf, c_int(0), c_int(0), c_double(freq))
-                
-                # Start function generator
-                self.dwf.FDwfAnalogOutConfigure(self.hdwf, c_int(0), c_bool(True))
-                
+                # Set function generator frequency and start it
+                with self._dev_lock:
+                    self.dwf.FDwfAnalogOutNodeFrequencySet(self.hdwf, c_int(0), c_int(0), c_double(freq))
+                    self.dwf.FDwfAnalogOutConfigure(self.hdwf, c_int(0), c_bool(True))
+
                 # Wait for signal to stabilize (at least 5 periods or 100ms, whichever is longer)
                 settle_time = max(5.0 / freq, 0.1)
                 time.sleep(settle_time)
-                
-                # Configure acquisition time window
+
+                # Configure acquisition time window and start acquisition
                 acquisition_time = max(10.0 / freq, 0.01)  # At least 10 periods or 10ms
-                self.dwf.FDwfAnalogInRecordLengthSet(self.hdwf, c_double(acquisition_time))
-                
-                # Start acquisition
-                self.dwf.FDwfAnalogInConfigure(self.hdwf, c_bool(False), c_bool(True))
-                
-                # Wait for acquisition to complete
+                with self._dev_lock:
+                    self.dwf.FDwfAnalogInRecordLengthSet(self.hdwf, c_double(acquisition_time))
+                    self.dwf.FDwfAnalogInConfigure(self.hdwf, c_bool(False), c_bool(True))
+
+                # Wait for acquisition to complete. Same backoff scheme
+                # as the scope path: poll tightly at first since short
+                # captures finish in well under 10 ms, then sleep up to
+                # 5 ms instead of a fixed 10 ms tick that both wastes
+                # wakeups and pads every sweep point's latency. The lock
+                # is taken per status call, not across the wait, so other
+                # threads can get at the device between polls
                 sts = c_byte()
+                delay = 0.0
                 while True:
-                    self.dwf.FDwfAnalogInStatus(self.hdwf, c_int(1), byref(sts))
+                    with self._dev_lock:
+                        self.dwf.FDwfAnalogInStatus(self.hdwf, c_int(1), byref(sts))
                     if sts.value == 2:  # DwfStateDone
                         break
                     if not self.network_running:
                         break
-                    time.sleep(0.01)
-                
+                    if delay:
+                        time.sleep(delay)
+                    delay = min(delay * 2 if delay else 0.0001, 0.005)
+
                 if not self.network_running:
                     break
-                
-                # Get data
-                buffer_ch1 = (c_double * buffer_size)()
-                buffer_ch2 = (c_double * buffer_size)()
-                
-                self.dwf.FDwfAnalogInStatusData(self.hdwf, c_int(0), buffer_ch1, c_int(buffer_size))
-                self.dwf.FDwfAnalogInStatusData(self.hdwf, c_int(1), buffer_ch2, c_int(buffer_size))
-                
-                # Convert to numpy arrays
-                ref_data = np.array(buffer_ch1[:buffer_size])
-                response_data = np.array(buffer_ch2[:buffer_size])
-                
+
+                # Get data into the reused buffers (views alias them)
+                with self._dev_lock:
+                    self.dwf.FDwfAnalogInStatusData(self.hdwf, c_int(0), buffer_ch1, c_int(buffer_size))
+                    self.dwf.FDwfAnalogInStatusData(self.hdwf, c_int(1), buffer_ch2, c_int(buffer_size))
+
                 # Calculate magnitude and phase using FFT
                 magnitude_db, phase_deg = self.calculate_transfer_function(ref_data, response_data, freq, sample_rate)
-                
-                self.na_frequencies.append(freq)
-                self.na_magnitude.append(magnitude_db)
-                self.na_phase.append(phase_deg)
-                
+
+                self.na_magnitude[self._na_count] = magnitude_db
+                self.na_phase[self._na_count] = phase_deg
+                self._na_count += 1
+
                 # Update plot periodically
                 if i % 5 == 0 or i == len(frequencies) - 1:
                     self.update_na_plot()
             
             # Stop function generator
-            self.dwf.FDwfAnalogOutConfigure(self.hdwf, c_int(0), c_bool(False))
-            
+            with self._dev_lock:
+                self.dwf.FDwfAnalogOutConfigure(self.hdwf, c_int(0), c_bool(False))
+
             self.close_na_progress()
             
             if self.network_running:
                 messagebox.showinfo("Success", f"Network analysis completed!\n"
-                                              f"Measured {len(self.na_frequencies)} frequency points\n"
+                                              f"Measured {self._na_count} frequency points\n"
                                               f"Range: {start_freq:.1f} Hz to {stop_freq:.1f} Hz")
                 self.update_na_plot()
             else:
@@ -920,20 +1111,12 @@ class AnalogDiscovery2GUI:
         finally:
             # Ensure instruments are stopped
             try:
-                self.dwf.FDwfAnalogOutConfigure(self.hdwf, c_int(0), c_bool(False))
-                self.dwf.FDwfAnalogInReset(self.hdwf)
+                with self._dev_lock:
+                    self.dwf.FDwfAnalogOutConfigure(self.hdwf, c_int(0), c_bool(False))
+                    self.dwf.FDwfAnalogInReset(self.hdwf)
             except:
                 pass
 
-        # Start analysis in separate thread
-        na_thread = threading.Thread(target=network_analysis_thread)
-        na_thread.daemon = True
-        na_thread.start()
-        
-        # Store thread reference for cleanup
-        self.na_thread = na_thread
-    
-
     def stop_network_analyzer(self):
         """Stop network analyzer"""
         self.network_running = False
@@ -947,31 +1130,52 @@ class AnalogDiscovery2GUI:
         # Stop instruments
         try:
             if hasattr(self, 'hdwf') and self.hdwf.value != 0:
-                self.dwf.FDwfAnalogOutConfigure(self.hdwf, c_int(0), c_bool(False))
-                self.dwf.FDwfAnalogInReset(self.hdwf)
+                with self._dev_lock:
+                    self.dwf.FDwfAnalogOutConfigure(self.hdwf, c_int(0), c_bool(False))
+                    self.dwf.FDwfAnalogInReset(self.hdwf)
         except:
             pass
 
     def calculate_transfer_function(self, ref_signal, response_signal, frequency, sample_rate):
         """Calculate magnitude and phase from reference and response signals"""
         try:
-            # Apply window function to reduce spectral leakage
-            window = np.hanning(len(ref_signal))
-            ref_windowed = ref_signal * window
-            response_windowed = response_signal * window
-            
-            # Calculate FFT
-            ref_fft = np.fft.fft(ref_windowed)
-            response_fft = np.fft.fft(response_windowed)
-            
-            # Find frequency bin closest to our test frequency
-            freqs = np.fft.fftfreq(len(ref_signal), 1.0 / sample_rate)
-            freq_bin = np.argmin(np.abs(freqs - frequency))
-            
-            # Get complex values at the test frequency
-            ref_complex = ref_fft[freq_bin]
-            response_complex = response_fft[freq_bin]
-            
+            n = len(ref_signal)
+            if _njit is not None:
+                # Lock-in style: correlate both captures against the
+                # exact stimulus tone in one jitted pass. No window is
+                # needed because we demodulate at the driven frequency
+                # rather than snapping to the nearest FFT bin
+                ref_i, ref_q, resp_i, resp_q = _iq_pair(
+                    np.asarray(ref_signal), np.asarray(response_signal),
+                    2.0 * math.pi * frequency / sample_rate)
+                ref_complex = complex(ref_i, ref_q)
+                response_complex = complex(resp_i, resp_q)
+            else:
+                # FFT fallback. Apply a window to reduce spectral
+                # leakage; the window only depends on the buffer length,
+                # so build it once per length, not per sweep point
+                if not hasattr(self, '_window_cache'):
+                    self._window_cache = {}
+                window = self._window_cache.get(n)
+                if window is None:
+                    window = self._window_cache[n] = np.hanning(n)
+                ref_windowed = ref_signal * window
+                response_windowed = response_signal * window
+
+                # Real input: rfft computes only the non-negative half
+                # of the spectrum, which is the only part we look at
+                rfft = _sp_fft.rfft if _sp_fft is not None else np.fft.rfft
+                ref_fft = rfft(ref_windowed)
+                response_fft = rfft(response_windowed)
+
+                # The stimulus bin falls at frequency * n / sample_rate;
+                # no need to materialize the frequency axis to find it
+                freq_bin = min(int(round(frequency * n / sample_rate)), n // 2)
+
+                # Get complex values at the test frequency
+                ref_complex = ref_fft[freq_bin]
+                response_complex = response_fft[freq_bin]
+
             # Calculate transfer function H = Response/Reference
             if abs(ref_complex) > 1e-10:  # Avoid division by zero
                 transfer_function = response_complex / ref_complex
@@ -992,27 +1196,30 @@ class AnalogDiscovery2GUI:
 
     def update_na_plot(self):
         """Update network analyzer plot"""
-        if not hasattr(self, 'na_frequencies') or len(self.na_frequencies) == 0:
+        if not getattr(self, '_na_count', 0):
             return
-        
+
         try:
             # Create or update the plot
             if not hasattr(self, 'na_figure'):
                 self.setup_na_plot()
-            
+
             # Clear previous plots
             self.na_ax_mag.clear()
             self.na_ax_phase.clear()
-            
+
+            # Plot the filled prefix of the preallocated arrays
+            n = self._na_count
+
             # Plot magnitude
-            self.na_ax_mag.semilogx(self.na_frequencies, self.na_magnitude, 'b-', linewidth=2)
+            self.na_ax_mag.semilogx(self.na_frequencies[:n], self.na_magnitude[:n], 'b-', linewidth=2)
             self.na_ax_mag.set_xlabel('Frequency (Hz)')
             self.na_ax_mag.set_ylabel('Magnitude (dB)')
             self.na_ax_mag.set_title('Network Analyzer - Frequency Response')
             self.na_ax_mag.grid(True, alpha=0.3)
             
             # Plot phase
-            self.na_ax_phase.semilogx(self.na_frequencies, self.na_phase, 'r-', linewidth=2)
+            self.na_ax_phase.semilogx(self.na_frequencies[:n], self.na_phase[:n], 'r-', linewidth=2)
             self.na_ax_phase.set_xlabel('Frequency (Hz)')
             self.na_ax_phase.set_ylabel('Phase (degrees)')
             self.na_ax_phase.grid(True, alpha=0.3)
@@ -1103,7 +1310,7 @@ class AnalogDiscovery2GUI:
 
     def export_na_data(self):
         """Export network analyzer data to CSV file"""
-        if not hasattr(self, 'na_frequencies') or len(self.na_frequencies) == 0:
+        if not getattr(self, '_na_count', 0):
             messagebox.showwarning("Warning", "No data to export. Run network analysis first.")
             return
         
@@ -1117,15 +1324,19 @@ class AnalogDiscovery2GUI:
         
         if filename:
             try:
-                import csv
-                with open(filename, 'w', newline='') as csvfile:
-                    writer = csv.writer(csvfile)
-                    writer.writerow(['Frequency (Hz)', 'Magnitude (dB)', 'Phase (degrees)'])
-                    for freq, mag, phase in zip(self.na_frequencies, self.na_magnitude, self.na_phase):
-                        writer.writerow([freq, mag, phase])
-                
+                # One vectorized savetxt over a 1 MiB buffered handle
+                # instead of a csv.writer write() per row
+                n = self._na_count
+                block = np.column_stack((self.na_frequencies[:n],
+                                         self.na_magnitude[:n],
+                                         self.na_phase[:n]))
+                with open(filename, 'wb', buffering=1 << 20) as f:
+                    np.savetxt(f, block, delimiter=',', fmt='%.6e',
+                               header='Frequency (Hz),Magnitude (dB),Phase (degrees)',
+                               comments='')
+
                 messagebox.showinfo("Success", f"Data exported to {filename}")
-                
+
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to export data: {str(e)}")
 
@@ -1177,12 +1388,16 @@ class AnalogDiscovery2GUI:
         dio_out_frame = ttk.LabelFrame(dio_frame, text="Digital Outputs")
         dio_out_frame.pack(fill=tk.X, padx=10, pady=10)
 
+        # Shadow copy of the output word; each checkbox toggles its own
+        # bit so applying a change never re-reads all 16 BooleanVars
+        self._dio_mask = 0
         self.dio_vars = []
         for i in range(16):  # AD2 has 16 digital I/O pins
             var = tk.BooleanVar()
             self.dio_vars.append(var)
             ttk.Checkbutton(dio_out_frame, text=f"DIO {i}", variable=var,
-                           command=self.update_digital_outputs).grid(row=i//8, column=i%8, padx=5, pady=2)
+                           command=lambda i=i, var=var: self._toggle_dio_bit(i, var)
+                           ).grid(row=i//8, column=i%8, padx=5, pady=2)
 
         # Digital inputs display
         dio_in_frame = ttk.LabelFrame(dio_frame, text="Digital Inputs")
@@ -1328,8 +1543,8 @@ class AnalogDiscovery2GUI:
         advanced_frame.pack(fill=tk.X, padx=10, pady=10)
 
         ttk.Label(advanced_frame, text="Buffer Size:").grid(row=0, column=0, padx=5, pady=5)
-        self.buffer_size = ttk.Entry(advanced_frame, width=10)
-        self.buffer_size.insert(0, "8192")
+        self.buffer_size = ttk.Entry(advanced_frame, width=10,
+                                     textvariable=self._cached_float_var("8192", '_buffer_size_v'))
         self.buffer_size.grid(row=0, column=1, padx=5)
 
         ttk.Label(advanced_frame, text="Timeout (ms):").grid(row=0, column=2, padx=5, pady=5)
@@ -1362,9 +1577,15 @@ class AnalogDiscovery2GUI:
                 messagebox.showerror("Error", f"Failed to open device: {szerr.value.decode()}")
                 return
 
+            # Batch configuration writes: with auto-configure off, the
+            # individual *Set calls stay host-side and a whole apply
+            # reaches the device as the single *Configure round-trip
+            # each apply path ends with
+            self.dwf.FDwfDeviceAutoConfigureSet(self.hdwf, c_int(0))
+
             self.is_connected = True
             self.status_label.config(text="Connected", foreground="green")
-            
+
             # Enable controls
             self.connect_btn.config(state=tk.DISABLED)
             self.disconnect_btn.config(state=tk.NORMAL)
@@ -1450,6 +1671,7 @@ class AnalogDiscovery2GUI:
         # Start acquisition thread
         self.acquisition_thread = threading.Thread(target=self.acquisition_loop, daemon=True)
         self.acquisition_thread.start()
+        self.root.after(33, self._poll_scope_frames)
 
     def stop_acquisition(self):
         """Stop oscilloscope acquisition"""
@@ -1465,9 +1687,24 @@ class AnalogDiscovery2GUI:
 
         try:
             self.perform_acquisition()
+            self.root.after(0, self._poll_scope_frames)
         except Exception as e:
             messagebox.showerror("Error", f"Single acquisition failed: {e}")
 
+    def _poll_scope_frames(self):
+        """Drain the scope ring on the Tk thread and plot the newest frame.
+
+        One scheduled poller at display rate replaces a root.after()
+        per captured frame; frames that arrived since the last tick
+        beyond the newest are simply discarded.
+        """
+        if self.scope_ring:
+            frame = self.scope_ring.pop()
+            self.scope_ring.clear()
+            self.update_oscilloscope_plot(*frame)
+        if self.is_acquiring:
+            self.root.after(33, self._poll_scope_frames)
+
     def acquisition_loop(self):
         """Continuous acquisition loop"""
         while self.is_acquiring:
@@ -1485,59 +1722,105 @@ class AnalogDiscovery2GUI:
 
         try:
             # Configure oscilloscope
-            buffer_size = int(self.buffer_size.get()) if hasattr(self, 'buffer_size') else 8192
-            frequency = 1.0 / (float(self.timebase.get()) * 10)  # 10 divisions
-            
-            # Set up channels
-            if self.ch1_var.get():
-                self.dwf.FDwfAnalogInChannelEnableSet(self.hdwf, c_int(0), c_bool(True))
-                self.dwf.FDwfAnalogInChannelRangeSet(self.hdwf, c_int(0), c_double(float(self.ch1_range.get())))
-            
-            if self.ch2_var.get():
-                self.dwf.FDwfAnalogInChannelEnableSet(self.hdwf, c_int(1), c_bool(True))
-                self.dwf.FDwfAnalogInChannelRangeSet(self.hdwf, c_int(1), c_double(float(self.ch2_range.get())))
+            # Read parameters from the write-time caches rather than the
+            # widgets: plain attribute reads, and safe from this thread
+            buffer_size = int(self._buffer_size_v)
+            read_ch1 = self._ch1_on
+            read_ch2 = self._ch2_on
+            frequency = 1.0 / (self._timebase_s * 10)  # 10 divisions
+
+            # Cached ctypes singletons: building fresh c_bool/c_int wrappers
+            # on every poll iteration is pure allocator traffic
+            if not hasattr(self, '_sts'):
+                self._sts = c_byte()
+                self._c_true = c_bool(True)
+                self._c_false = c_bool(False)
+                self._sts_ref = byref(self._sts)
+
+            # One lock scope per apply group: with auto-configure off
+            # the Set calls are host-side and the whole setup commits
+            # on the final Configure round-trip
+            with self._dev_lock:
+                # Set up channels
+                if read_ch1:
+                    self.dwf.FDwfAnalogInChannelEnableSet(self.hdwf, c_int(0), c_bool(True))
+                    self.dwf.FDwfAnalogInChannelRangeSet(self.hdwf, c_int(0), c_double(self._ch1_range_v))
 
-            # Set acquisition parameters
-            self.dwf.FDwfAnalogInFrequencySet(self.hdwf, c_double(frequency))
-            self.dwf.FDwfAnalogInBufferSizeSet(self.hdwf, c_int(buffer_size))
+                if read_ch2:
+                    self.dwf.FDwfAnalogInChannelEnableSet(self.hdwf, c_int(1), c_bool(True))
+                    self.dwf.FDwfAnalogInChannelRangeSet(self.hdwf, c_int(1), c_double(self._ch2_range_v))
 
-            # Configure trigger
-            if self.trigger_source.get() != "None":
-                trigger_ch = 0 if self.trigger_source.get() == "Ch1" else 1
-                self.dwf.FDwfAnalogInTriggerSourceSet(self.hdwf, c_int(trigger_ch))
-                self.dwf.FDwfAnalogInTriggerLevelSet(self.hdwf, c_double(float(self.trigger_level.get())))
-                self.dwf.FDwfAnalogInTriggerTypeSet(self.hdwf, c_int(1))  # Edge trigger
+                # Set acquisition parameters
+                self.dwf.FDwfAnalogInFrequencySet(self.hdwf, c_double(frequency))
+                self.dwf.FDwfAnalogInBufferSizeSet(self.hdwf, c_int(buffer_size))
 
-            # Start acquisition
-            self.dwf.FDwfAnalogInConfigure(self.hdwf, c_bool(False), c_bool(True))
+                # Configure trigger
+                if self._trigger_source_s != "None":
+                    trigger_ch = _TRIG_CHANNEL.get(self._trigger_source_s, 1)
+                    self.dwf.FDwfAnalogInTriggerSourceSet(self.hdwf, c_int(trigger_ch))
+                    self.dwf.FDwfAnalogInTriggerLevelSet(self.hdwf, c_double(self._trigger_level_v))
+                    self.dwf.FDwfAnalogInTriggerTypeSet(self.hdwf, c_int(1))  # Edge trigger
 
-            # Wait for acquisition to complete
-            sts = c_byte()
+                # Start acquisition
+                self.dwf.FDwfAnalogInConfigure(self.hdwf, self._c_false, self._c_true)
+
+            # Wait for acquisition to complete. Reuse one status byte and
+            # back off exponentially: poll tightly while a fast trigger is
+            # likely, then sleep up to 5 ms instead of waking at 1 kHz.
+            # The lock is taken per status call, not across the wait, so
+            # an Apply from the GUI can slot in between polls
+            delay = 0.0
             while True:
-                self.dwf.FDwfAnalogInStatus(self.hdwf, c_bool(True), byref(sts))
-                if sts.value == 2:  # Done
+                with self._dev_lock:
+                    self.dwf.FDwfAnalogInStatus(self.hdwf, self._c_true, self._sts_ref)
+                if self._sts.value == 2:  # Done
                     break
-                time.sleep(0.001)
-
-            # Read data
-            time_data = np.linspace(0, float(self.timebase.get()) * 10, buffer_size)
-            
-            if self.ch1_var.get():
-                ch1_data = (c_double * buffer_size)()
-                self.dwf.FDwfAnalogInStatusData(self.hdwf, c_int(0), ch1_data, c_int(buffer_size))
-                ch1_array = np.array([ch1_data[i] for i in range(buffer_size)])
-            else:
-                ch1_array = np.zeros(buffer_size)
+                if delay:
+                    time.sleep(delay)
+                delay = min(delay * 2 if delay else 0.0001, 0.005)
+
+            # The time axis only depends on timebase and buffer size;
+            # rebuild it on change, not on every frame
+            key = (self._timebase_s, buffer_size)
+            if getattr(self, '_time_axis_key', None) != key:
+                self._time_axis = np.linspace(0, key[0] * 10, buffer_size)
+                self._time_axis_key = key
+            time_data = self._time_axis
+
+            # Pooled capture storage: the driver fills one buffer pair
+            # while the GUI may still be rendering zero-copy views of
+            # another, so a frame is published without the per-frame
+            # allocation and memcpy snapshot. The pool holds one pair
+            # more than the ring can reference, so every view the ring
+            # still hands out is backed by a buffer the producer has
+            # not yet come back around to
+            if not hasattr(self, '_scope_bufs') or len(self._scope_bufs[0][0]) != buffer_size:
+                self._scope_bufs = [((c_double * buffer_size)(), (c_double * buffer_size)())
+                                    for _ in range(self.scope_ring.maxlen + 1)]
+                self._scope_views = [(np.ctypeslib.as_array(a), np.ctypeslib.as_array(b))
+                                     for a, b in self._scope_bufs]
+                self._scope_flip = 0
+                self._scope_zero = np.zeros(buffer_size)
+
+            c_ch1, c_ch2 = self._scope_bufs[self._scope_flip]
+            ch1_view, ch2_view = self._scope_views[self._scope_flip]
+            self._scope_flip = (self._scope_flip + 1) % len(self._scope_bufs)
+
+            with self._dev_lock:
+                if read_ch1:
+                    self.dwf.FDwfAnalogInStatusData(self.hdwf, c_int(0), c_ch1, c_int(buffer_size))
+                    ch1_array = ch1_view
+                else:
+                    ch1_array = self._scope_zero
 
-            if self.ch2_var.get():
-                ch2_data = (c_double * buffer_size)()
-                self.dwf.FDwfAnalogInStatusData(self.hdwf, c_int(1), ch2_data, c_int(buffer_size))
-                ch2_array = np.array([ch2_data[i] for i in range(buffer_size)])
-            else:
-                ch2_array = np.zeros(buffer_size)
+                if read_ch2:
+                    self.dwf.FDwfAnalogInStatusData(self.hdwf, c_int(1), c_ch2, c_int(buffer_size))
+                    ch2_array = ch2_view
+                else:
+                    ch2_array = self._scope_zero
 
-            # Update plot
-            self.root.after(0, lambda: self.update_oscilloscope_plot(time_data, ch1_array, ch2_array))
+            # Publish for the Tk-side poller; no per-frame root.after here
+            self.scope_ring.append((time_data, ch1_array, ch2_array))
 
         except Exception as e:
             print(f"Acquisition error: {e}")
@@ -1545,22 +1828,64 @@ class AnalogDiscovery2GUI:
     def update_oscilloscope_plot(self, time_data, ch1_data, ch2_data):
         """Update oscilloscope plot"""
         try:
-            self.ax.clear()
-            
-            if self.ch1_var.get():
-                self.ax.plot(time_data, ch1_data, 'b-', label='Channel 1', linewidth=1)
-            
-            if self.ch2_var.get():
-                self.ax.plot(time_data, ch2_data, 'r-', label='Channel 2', linewidth=1)
-
-            self.ax.set_xlabel('Time (s)')
-            self.ax.set_ylabel('Voltage (V)')
-            self.ax.set_title('Oscilloscope')
-            self.ax.grid(True)
-            self.ax.legend()
-            
-            self.canvas.draw()
-            
+            # Create the line artists, labels and legend once; ax.clear()
+            # forced every frame to rebuild them, and re-running ax.legend()
+            # re-measured the legend text and boxes on each draw
+            if not hasattr(self, '_scope_ch1_line'):
+                (self._scope_ch1_line,) = self.ax.plot([], [], 'b-',
+                                                       label='Channel 1', linewidth=1,
+                                                       animated=True)
+                (self._scope_ch2_line,) = self.ax.plot([], [], 'r-',
+                                                       label='Channel 2', linewidth=1,
+                                                       animated=True)
+                self.ax.set_xlabel('Time (s)')
+                self.ax.set_ylabel('Voltage (V)')
+                self.ax.set_title('Oscilloscope')
+                self.ax.grid(True)
+                self.ax.legend(loc='upper right')
+
+            read_ch1 = self.ch1_var.get()
+            read_ch2 = self.ch2_var.get()
+            self._scope_ch1_line.set_visible(read_ch1)
+            self._scope_ch2_line.set_visible(read_ch2)
+            if read_ch1:
+                self._scope_ch1_line.set_data(
+                    *_minmax_decimate(time_data, ch1_data))
+            if read_ch2:
+                self._scope_ch2_line.set_data(
+                    *_minmax_decimate(time_data, ch2_data))
+
+            # Rescale only when the data leaves the current view (with
+            # hysteresis); a stable view keeps the cached background
+            # valid so ordinary frames blit instead of re-rendering
+            # axes, ticks and grid
+            limits_changed = False
+            xlim = (time_data[0], time_data[-1])
+            if self.ax.get_xlim() != xlim:
+                self.ax.set_xlim(*xlim)
+                limits_changed = True
+            visible = [a for a, on in ((ch1_data, read_ch1),
+                                       (ch2_data, read_ch2)) if on]
+            if visible:
+                lo = min(a.min() for a in visible)
+                hi = max(a.max() for a in visible)
+                pad = 0.1 * max(hi - lo, 1e-6)
+                cur_lo, cur_hi = self.ax.get_ylim()
+                if (lo - pad < cur_lo or hi + pad > cur_hi
+                        or hi - lo < 0.3 * (cur_hi - cur_lo)):
+                    self.ax.set_ylim(lo - pad, hi + pad)
+                    limits_changed = True
+
+            if limits_changed or self._scope_bg is None:
+                self.canvas.draw()  # full render; draw_event recaches bg
+            if self._scope_bg is not None:
+                self.canvas.restore_region(self._scope_bg)
+                if read_ch1:
+                    self.ax.draw_artist(self._scope_ch1_line)
+                if read_ch2:
+                    self.ax.draw_artist(self._scope_ch2_line)
+                self.canvas.blit(self.ax.bbox)
+
         except Exception as e:
             print(f"Plot update error: {e}")
 
@@ -1581,45 +1906,64 @@ class AnalogDiscovery2GUI:
             return
 
         try:
-            # Channel 1
-            if self.fg1_enable.get():
-                self.dwf.FDwfAnalogOutNodeEnableSet(self.hdwf, c_int(0), c_int(0), c_bool(True))
-                
-                # Set function
-                func_map = {"Sine": 1, "Square": 2, "Triangle": 3, "DC": 8, "Sawtooth": 4, "Noise": 5}
-                func_id = func_map.get(self.fg1_func.get(), 1)
-                self.dwf.FDwfAnalogOutNodeFunctionSet(self.hdwf, c_int(0), c_int(0), c_int(func_id))
-                
-                # Set parameters
-                self.dwf.FDwfAnalogOutNodeFrequencySet(self.hdwf, c_int(0), c_int(0), c_double(float(self.fg1_freq.get())))
-                self.dwf.FDwfAnalogOutNodeAmplitudeSet(self.hdwf, c_int(0), c_int(0), c_double(float(self.fg1_amp.get())))
-                self.dwf.FDwfAnalogOutNodeOffsetSet(self.hdwf, c_int(0), c_int(0), c_double(float(self.fg1_offset.get())))
-                
-                self.dwf.FDwfAnalogOutConfigure(self.hdwf, c_int(0), c_bool(True))
-            else:
-                self.dwf.FDwfAnalogOutNodeEnableSet(self.hdwf, c_int(0), c_int(0), c_bool(False))
-                self.dwf.FDwfAnalogOutConfigure(self.hdwf, c_int(0), c_bool(True))
+            with self._dev_lock:
+                # Channel 1
+                if self.fg1_enable.get():
+                    self.dwf.FDwfAnalogOutNodeEnableSet(self.hdwf, c_int(0), c_int(0), c_bool(True))
 
-            # Channel 2
-            if self.fg2_enable.get():
-                self.dwf.FDwfAnalogOutNodeEnableSet(self.hdwf, c_int(1), c_int(0), c_bool(True))
-                
-                func_map = {"Sine": 1, "Square": 2, "Triangle": 3, "DC": 8, "Sawtooth": 4, "Noise": 5}
-                func_id = func_map.get(self.fg2_func.get(), 1)
-                self.dwf.FDwfAnalogOutNodeFunctionSet(self.hdwf, c_int(1), c_int(0), c_int(func_id))
-                
-                self.dwf.FDwfAnalogOutNodeFrequencySet(self.hdwf, c_int(1), c_int(0), c_double(float(self.fg2_freq.get())))
-                self.dwf.FDwfAnalogOutNodeAmplitudeSet(self.hdwf, c_int(1), c_int(0), c_double(float(self.fg2_amp.get())))
-                self.dwf.FDwfAnalogOutNodeOffsetSet(self.hdwf, c_int(1), c_int(0), c_double(float(self.fg2_offset.get())))
-                
-                self.dwf.FDwfAnalogOutConfigure(self.hdwf, c_int(1), c_bool(True))
-            else:
-                self.dwf.FDwfAnalogOutNodeEnableSet(self.hdwf, c_int(1), c_int(0), c_bool(False))
-                self.dwf.FDwfAnalogOutConfigure(self.hdwf, c_int(1), c_bool(True))
+                    # Set function
+                    func_id = _FG_FUNC.get(self.fg1_func.get(), 1)
+                    self.dwf.FDwfAnalogOutNodeFunctionSet(self.hdwf, c_int(0), c_int(0), c_int(func_id))
+
+                    # Set parameters
+                    self.dwf.FDwfAnalogOutNodeFrequencySet(self.hdwf, c_int(0), c_int(0), c_double(self._fg1_freq_v))
+                    self.dwf.FDwfAnalogOutNodeAmplitudeSet(self.hdwf, c_int(0), c_int(0), c_double(self._fg1_amp_v))
+                    self.dwf.FDwfAnalogOutNodeOffsetSet(self.hdwf, c_int(0), c_int(0), c_double(self._fg1_offset_v))
+
+                    self.dwf.FDwfAnalogOutConfigure(self.hdwf, c_int(0), c_bool(True))
+                else:
+                    self.dwf.FDwfAnalogOutNodeEnableSet(self.hdwf, c_int(0), c_int(0), c_bool(False))
+                    self.dwf.FDwfAnalogOutConfigure(self.hdwf, c_int(0), c_bool(True))
+
+                # Channel 2
+                if self.fg2_enable.get():
+                    self.dwf.FDwfAnalogOutNodeEnableSet(self.hdwf, c_int(1), c_int(0), c_bool(True))
+
+                    func_id = _FG_FUNC.get(self.fg2_func.get(), 1)
+                    self.dwf.FDwfAnalogOutNodeFunctionSet(self.hdwf, c_int(1), c_int(0), c_int(func_id))
+
+                    self.dwf.FDwfAnalogOutNodeFrequencySet(self.hdwf, c_int(1), c_int(0), c_double(self._fg2_freq_v))
+                    self.dwf.FDwfAnalogOutNodeAmplitudeSet(self.hdwf, c_int(1), c_int(0), c_double(self._fg2_amp_v))
+                    self.dwf.FDwfAnalogOutNodeOffsetSet(self.hdwf, c_int(1), c_int(0), c_double(self._fg2_offset_v))
+
+                    self.dwf.FDwfAnalogOutConfigure(self.hdwf, c_int(1), c_bool(True))
+                else:
+                    self.dwf.FDwfAnalogOutNodeEnableSet(self.hdwf, c_int(1), c_int(0), c_bool(False))
+                    self.dwf.FDwfAnalogOutConfigure(self.hdwf, c_int(1), c_bool(True))
 
         except Exception as e:
             messagebox.showerror("Error", f"Function generator update failed: {e}")
 
+    def load_arbitrary_waveform(self, channel, shape, n=4096):
+        """Load one period of `shape` into the FG custom-waveform buffer.
+
+        The samples come straight from the numpy generator and are
+        handed to the driver through the array's own ctypes pointer —
+        no per-point Python iteration and no intermediate ctypes array.
+        """
+        if not self.is_connected:
+            return
+
+        try:
+            y = np.ascontiguousarray(_generate_waveform(shape, n))
+            self.dwf.FDwfAnalogOutNodeFunctionSet(self.hdwf, c_int(channel), c_int(0),
+                                                  c_int(30))  # funcCustom
+            self.dwf.FDwfAnalogOutNodeDataSet(self.hdwf, c_int(channel), c_int(0),
+                                              y.ctypes.data_as(POINTER(c_double)), c_int(n))
+            self.dwf.FDwfAnalogOutConfigure(self.hdwf, c_int(channel), c_bool(True))
+        except Exception as e:
+            messagebox.showerror("Error", f"Arbitrary waveform load failed: {e}")
+
     # Power supply methods
     def update_power_supply(self):
         """Update power supply settings"""
@@ -1627,17 +1971,21 @@ class AnalogDiscovery2GUI:
             return
 
         try:
-            # Positive supply
-            if self.ps_pos_enable.get():
-                voltage = float(self.ps_pos_voltage.get())
-                self.dwf.FDwfAnalogIOChannelNodeSet(self.hdwf, c_int(0), c_int(0), c_double(voltage))
-                self.dwf.FDwfAnalogIOEnableSet(self.hdwf, c_bool(True))
-            
-            # Negative supply
-            if self.ps_neg_enable.get():
-                voltage = float(self.ps_neg_voltage.get())
-                self.dwf.FDwfAnalogIOChannelNodeSet(self.hdwf, c_int(1), c_int(0), c_double(voltage))
-                self.dwf.FDwfAnalogIOEnableSet(self.hdwf, c_bool(True))
+            with self._dev_lock:
+                # Positive supply
+                if self.ps_pos_enable.get():
+                    voltage = float(self.ps_pos_voltage.get())
+                    self.dwf.FDwfAnalogIOChannelNodeSet(self.hdwf, c_int(0), c_int(0), c_double(voltage))
+                    self.dwf.FDwfAnalogIOEnableSet(self.hdwf, c_bool(True))
+
+                # Negative supply
+                if self.ps_neg_enable.get():
+                    voltage = float(self.ps_neg_voltage.get())
+                    self.dwf.FDwfAnalogIOChannelNodeSet(self.hdwf, c_int(1), c_int(0), c_double(voltage))
+                    self.dwf.FDwfAnalogIOEnableSet(self.hdwf, c_bool(True))
+
+                # One round-trip commits the whole supply configuration
+                self.dwf.FDwfAnalogIOConfigure(self.hdwf)
 
         except Exception as e:
             messagebox.showerror("Error", f"Power supply update failed: {e}")
@@ -1653,7 +2001,9 @@ class AnalogDiscovery2GUI:
         self.ps_pos_enable.set(False)
         self.ps_neg_enable.set(False)
         if self.is_connected:
-            self.dwf.FDwfAnalogIOEnableSet(self.hdwf, c_bool(False))
+            with self._dev_lock:
+                self.dwf.FDwfAnalogIOEnableSet(self.hdwf, c_bool(False))
+                self.dwf.FDwfAnalogIOConfigure(self.hdwf)
 
     def start_current_monitoring(self):
         """Start monitoring power supply currents"""
@@ -1661,13 +2011,13 @@ class AnalogDiscovery2GUI:
             while self.is_connected:
                 try:
                     if self.is_connected:
-                        # Read positive supply current
                         pos_current = c_double()
-                        self.dwf.FDwfAnalogIOChannelNodeStatus(self.hdwf, c_int(0), c_int(1), byref(pos_current))
-                        
-                        # Read negative supply current
                         neg_current = c_double()
-                        self.dwf.FDwfAnalogIOChannelNodeStatus(self.hdwf, c_int(1), c_int(1), byref(neg_current))
+                        with self._dev_lock:
+                            # Read positive and negative supply currents
+                            self.dwf.FDwfAnalogIOStatus(self.hdwf)
+                            self.dwf.FDwfAnalogIOChannelNodeStatus(self.hdwf, c_int(0), c_int(1), byref(pos_current))
+                            self.dwf.FDwfAnalogIOChannelNodeStatus(self.hdwf, c_int(1), c_int(1), byref(neg_current))
                         
                         # Update labels
                         self.root.after(0, lambda: self.ps_pos_current_label.config(text=f"Current: {pos_current.value:.3f} A"))
@@ -1718,8 +2068,7 @@ class AnalogDiscovery2GUI:
         try:
             filename = self.dl_filename.get()
             duration = float(self.dl_duration.get())
-            interval_map = {"1s": 1, "10s": 10, "1min": 60, "10min": 600, "1hour": 3600}
-            interval = interval_map.get(self.dl_interval.get(), 1)
+            interval = _DL_INTERVALS.get(self.dl_interval.get(), 1)
             
             start_time = time.time()
             samples = int(duration / interval)
@@ -1806,56 +2155,84 @@ class AnalogDiscovery2GUI:
     def update_spectrum_plot(self, freqs, magnitude):
         """Update spectrum analyzer plot"""
         try:
-            self.sa_ax.clear()
-            self.sa_ax.plot(freqs, magnitude, 'b-', linewidth=1)
-            self.sa_ax.set_xlabel('Frequency (Hz)')
-            self.sa_ax.set_ylabel('Magnitude (dB)')
-            self.sa_ax.set_title('Spectrum Analyzer')
-            self.sa_ax.grid(True)
-            self.sa_canvas.draw()
+            # Persistent animated line instead of ax.clear() per frame:
+            # labels, title and grid were set once at tab construction
+            if not hasattr(self, '_sa_line'):
+                (self._sa_line,) = self.sa_ax.plot([], [], 'b-', linewidth=1,
+                                                   animated=True)
+            self._sa_line.set_data(freqs, magnitude)
+
+            limits_changed = False
+            xlim = (freqs[0], freqs[-1])
+            if self.sa_ax.get_xlim() != xlim:
+                self.sa_ax.set_xlim(*xlim)
+                limits_changed = True
+
+            if limits_changed or self._sa_bg is None:
+                self.sa_canvas.draw()
+            if self._sa_bg is not None:
+                self.sa_canvas.restore_region(self._sa_bg)
+                self.sa_ax.draw_artist(self._sa_line)
+                self.sa_canvas.blit(self.sa_ax.bbox)
         except Exception as e:
             print(f"Spectrum plot update error: {e}")
 
     # Digital I/O methods
+    def _toggle_dio_bit(self, pin, var):
+        """Flip one bit of the output shadow and push the new word"""
+        if var.get():
+            self._dio_mask |= (1 << pin)
+        else:
+            self._dio_mask &= ~(1 << pin)
+        self.update_digital_outputs()
+
     def update_digital_outputs(self):
-        """Update digital outputs"""
+        """Update digital outputs from the shadow word"""
         if not self.is_connected:
             return
 
         try:
-            # Create output value from checkboxes
-            output_value = 0
-            for i, var in enumerate(self.dio_vars):
-                if var.get():
-                    output_value |= (1 << i)
-            
             # Set digital outputs
-            self.dwf.FDwfDigitalIOOutputEnableSet(self.hdwf, c_int(0xFFFF))  # Enable all outputs
-            self.dwf.FDwfDigitalIOOutputSet(self.hdwf, c_int(output_value))
-            
+            with self._dev_lock:
+                self.dwf.FDwfDigitalIOOutputEnableSet(self.hdwf, c_int(0xFFFF))  # Enable all outputs
+                self.dwf.FDwfDigitalIOOutputSet(self.hdwf, c_int(self._dio_mask))
+                self.dwf.FDwfDigitalIOConfigure(self.hdwf)
+
         except Exception as e:
             messagebox.showerror("Error", f"Digital output update failed: {e}")
 
+    def _show_dio_inputs(self, word, changed):
+        """Refresh only the input labels whose bit actually changed"""
+        for i in range(16):
+            if changed & (1 << i):
+                state = "HIGH" if (word & (1 << i)) else "LOW"
+                self.dio_input_labels[i].config(text=f"DIO {i}: {state}")
+
     def start_digital_monitoring(self):
         """Start monitoring digital inputs"""
         def monitor_inputs():
+            # Remember the last word shown so an unchanged poll costs one
+            # driver call and nothing on the Tk side; the old code queued
+            # sixteen root.after callbacks every 100 ms regardless
+            last_word = None
+            input_value = c_int()
             while True:
                 try:
                     if self.is_connected:
                         # Read digital inputs
-                        input_value = c_int()
-                        self.dwf.FDwfDigitalIOInputGet(self.hdwf, byref(input_value))
-                        input_value = input_value.value
-                        # Update labels
-                        for i in range(16):
-                            state = "HIGH" if (input_value & (1 << i)) else "LOW"
-                            self.root.after(0, lambda i=i, state=state: self.dio_input_labels[i].config(text=f"DIO {i}: {state}"))
+                        with self._dev_lock:
+                            self.dwf.FDwfDigitalIOInputGet(self.hdwf, byref(input_value))
+                        word = input_value.value
+                        if word != last_word:
+                            changed = 0xFFFF if last_word is None else word ^ last_word
+                            last_word = word
+                            self.root.after(0, self._show_dio_inputs, word, changed)
                     time.sleep(0.1)  # Update every 100ms
                 except Exception as e:
                     print(f"Digital input monitoring error: {e}")
                     break
 
-                        
+        threading.Thread(target=monitor_inputs, daemon=True).start()
 
 if __name__ == "__main__":
     root = tk.Tk()